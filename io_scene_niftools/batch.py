@@ -0,0 +1,246 @@
+"""Headless batch conversion of nif files, driven by a manifest.
+
+Run with::
+
+    blender -b -P io_scene_niftools/batch.py -- manifest.json [--report status.csv]
+
+The manifest is a JSON file::
+
+    {
+        "import": {"scale_correction": 0.1},
+        "export": {"use_visible": true},
+        "jobs": [
+            {"input": "meshes/a.nif", "output": "converted/a.blend"},
+            {"input": "meshes/b.nif", "output": "converted/b.nif", "game": "SKYRIM_SE",
+             "export": {"max_bones_per_partition": 80}}
+        ]
+    }
+
+The top level ``import`` and ``export`` options apply to all jobs, a job can override them. Options are the
+properties of the nif import and export operators. Each job imports its input into an empty scene, then saves it as
+.blend or exports it as .nif, depending on the extension of its output, or only imports it if there is no output.
+Relative paths are relative to the manifest. A failed file is recorded in the CSV report, and the batch carries on.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+import traceback
+
+import bpy
+
+if __name__ == "__main__":
+    # run as a script from a source checkout, rather than from the installed addon
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from io_scene_niftools.nif_export import NifExport
+from io_scene_niftools.nif_import import NifImport
+
+EXPORT_DEFAULTS = {"use_visible": True}
+"""Batch export defaults differing from the export operator, which has no objects to export by default."""
+
+REPORT_FIELDS = ("input", "output", "status", "seconds", "import_seconds", "export_seconds", "warnings", "message")
+
+RESULT_PREFIX = "NIFTOOLS_BATCH_RESULT "
+"""Marks the result lines of a worker among the console output of blender."""
+
+
+class BatchOperator:
+    """
+    Stands in for the import or export operator, so NifImport and NifExport run without operator context.
+    Has the properties of the operator with their defaults, overridden by the given options, and collects the reports.
+    """
+
+    def __init__(self, operator, options):
+        rna_type = operator.get_rna_type()
+        properties = {prop.identifier: get_default(prop) for prop in rna_type.properties
+                      if prop.identifier != "rna_type"}
+        unknown = set(options) - set(properties)
+        if unknown:
+            raise ValueError(f"Unknown {rna_type.identifier} options: {', '.join(sorted(unknown))}")
+        properties.update(options)
+        self.properties = argparse.Namespace(**properties)
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((next(iter(level)), str(message)))
+
+    def messages(self, level):
+        return [message for report_level, message in self.reports if report_level == level]
+
+
+def get_default(prop):
+    if prop.type == 'COLLECTION':
+        return []
+    if prop.type == 'ENUM':
+        return set(prop.default_flag) if prop.is_enum_flag else prop.default
+    if prop.type in {'BOOLEAN', 'INT', 'FLOAT'} and prop.is_array:
+        return tuple(prop.default_array)
+    return getattr(prop, "default", None)
+
+
+def reset_scene():
+    """Start every job from an empty scene, without restarting blender."""
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def enable_addon():
+    import addon_utils
+
+    addon_utils.enable("io_scene_niftools", default_set=False)
+
+
+def load_manifest(manifest_path):
+    with open(manifest_path) as stream:
+        manifest = json.load(stream)
+    root = os.path.dirname(os.path.abspath(manifest_path))
+    for job in manifest["jobs"]:
+        job["input"] = os.path.join(root, job["input"])
+        if job.get("output"):
+            job["output"] = os.path.join(root, job["output"])
+    return manifest
+
+
+def run_job(job, import_options, export_options):
+    """Convert one file, return its row of the status report."""
+    row = {"input": job["input"], "output": job.get("output", ""), "status": "FINISHED", "import_seconds": 0.0,
+           "export_seconds": 0.0, "warnings": 0, "message": ""}
+    start = time.perf_counter()
+    operators = []
+    try:
+        reset_scene()
+        operator = BatchOperator(bpy.ops.import_scene.nif,
+                                 {**import_options, **job.get("import", {}), "filepath": job["input"]})
+        operators.append(operator)
+        result = NifImport(operator, bpy.context).execute()
+        row["import_seconds"] = time.perf_counter() - start
+
+        output = job.get("output")
+        if result == {'FINISHED'} and output:
+            export_start = time.perf_counter()
+            os.makedirs(os.path.dirname(output), exist_ok=True)
+            if output.lower().endswith(".blend"):
+                bpy.ops.wm.save_as_mainfile(filepath=output, copy=True)
+            else:
+                if job.get("game"):
+                    bpy.context.scene.niftools_scene.game = job["game"]
+                operator = BatchOperator(bpy.ops.export_scene.nif,
+                                         {**export_options, **job.get("export", {}), "filepath": output})
+                operators.append(operator)
+                result = NifExport(operator, bpy.context).execute()
+            row["export_seconds"] = time.perf_counter() - export_start
+
+        if result != {'FINISHED'}:
+            row["status"] = "CANCELLED"
+            row["message"] = next((message for operator in operators for message in operator.messages('ERROR')), "")
+    except Exception as e:
+        row["status"] = "FAILED"
+        row["message"] = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+
+    row["seconds"] = time.perf_counter() - start
+    row["warnings"] = sum(len(operator.messages('WARNING')) for operator in operators)
+    return row
+
+
+def get_options(manifest):
+    """The import and export options of the manifest, which apply to all its jobs."""
+    return manifest.get("import", {}), {**EXPORT_DEFAULTS, **manifest.get("export", {})}
+
+
+def run_batch(manifest, report_path=None):
+    """Convert all files of the manifest, carrying on after failed files. Return the status report rows."""
+    import_options, export_options = get_options(manifest)
+    rows = []
+    report_stream = open(report_path, "w", newline="") if report_path else None
+    try:
+        writer = csv.DictWriter(report_stream, REPORT_FIELDS) if report_stream else None
+        if writer:
+            writer.writeheader()
+        for index, job in enumerate(manifest["jobs"]):
+            print(f"[{index + 1}/{len(manifest['jobs'])}] {job['input']}")
+            row = run_job(job, import_options, export_options)
+            rows.append(row)
+            print(f"{row['status']} in {row['seconds']:.2f}s {row['message']}")
+            if writer:
+                # write as we go, so the report is useful even if blender itself crashes
+                writer.writerow(row)
+                report_stream.flush()
+    finally:
+        if report_stream:
+            report_stream.close()
+    return rows
+
+
+def run_worker(manifest):
+    """
+    Convert the jobs of the manifest whose indices are read from stdin, one per line, until stdin is closed.
+    Every converted job is answered by its status report row as JSON on a single line, after :data:`RESULT_PREFIX`.
+    """
+    import_options, export_options = get_options(manifest)
+    for line in sys.stdin:
+        row = run_job(manifest["jobs"][int(line)], import_options, export_options)
+        print(RESULT_PREFIX + json.dumps(row), flush=True)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="blender -b -P batch.py --", description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", help="JSON manifest of the files to convert")
+    parser.add_argument("--report", help="CSV file for the status and timing of every file, "
+                                         "defaults to the manifest path with .csv extension")
+    parser.add_argument("--worker", action="store_true", help="convert the jobs read from stdin, see batch_pool.py")
+    args = parser.parse_args(argv)
+
+    enable_addon()
+    if args.worker:
+        run_worker(load_manifest(args.manifest))
+        return 0
+    report_path = args.report or os.path.splitext(args.manifest)[0] + ".csv"
+    rows = run_batch(load_manifest(args.manifest), report_path)
+    failed = sum(row["status"] != "FINISHED" for row in rows)
+    print(f"Converted {len(rows) - failed} of {len(rows)} files, report written to {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
@@ -0,0 +1,238 @@
+"""Parallel batch conversion of nif files, over a pool of blender worker processes.
+
+Run with::
+
+    blender -b -P io_scene_niftools/batch_pool.py -- manifest.json [--workers 16] [--report status.csv] [--timeout 600]
+
+The manifest is the same as for :mod:`io_scene_niftools.batch`. Every worker is a background blender process running
+the batch script in worker mode. Idle workers take the next file from a shared queue, largest files first, so files of
+uneven size keep all workers busy until the end. The results of all workers are merged into a single CSV report, and
+the console output of each worker is kept in a log file next to it. A worker that crashes, or takes longer than the
+timeout on a single file, is restarted for the next file.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import argparse
+import csv
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+import bpy
+
+if __name__ == "__main__":
+    # run as a script from a source checkout, rather than from the installed addon
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from io_scene_niftools import batch
+
+
+class Worker(threading.Thread):
+    """Feeds jobs from the shared queue to one blender worker process, and collects its results."""
+
+    def __init__(self, number, manifest_path, jobs, manifest, results, log_path, timeout=None):
+        super().__init__(name=f"worker {number}", daemon=True)
+        self.number = number
+        self.manifest_path = manifest_path
+        self.jobs = jobs
+        self.manifest = manifest
+        self.results = results
+        self.log_path = log_path
+        self.timeout = timeout
+        self.process = None
+        self.lines = None
+
+    def run(self):
+        with open(self.log_path, "w") as log:
+            while True:
+                try:
+                    index = self.jobs.get_nowait()
+                except queue.Empty:
+                    break
+                start = time.perf_counter()
+                try:
+                    if not self.process or self.process.poll() is not None:
+                        self.start_process()
+                    row = self.convert(index, log)
+                except Exception as e:
+                    row = failed_row(self.manifest["jobs"][index], start, f"{type(e).__name__}: {e}")
+                row["worker"] = self.number
+                self.results.put(row)
+            self.stop_process(log)
+
+    def start_process(self):
+        command = [bpy.app.binary_path, "-b", "-P", batch.__file__, "--", self.manifest_path, "--worker"]
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True, bufsize=1)
+        # the output is read on a separate thread, so waiting for a result can time out
+        self.lines = queue.Queue()
+        threading.Thread(target=read_lines, args=(self.process.stdout, self.lines), daemon=True).start()
+
+    def stop_process(self, log):
+        if not self.process:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        # keep reading the output until the worker exits, so it does not block on a full pipe
+        self.write_output(log)
+        self.process.wait()
+
+    def kill_process(self, log):
+        self.process.kill()
+        self.process.wait()
+        self.write_output(log)
+
+    def write_output(self, log):
+        """Write the output of the worker process to the log until it is closed."""
+        for line in iter(self.lines.get, None):
+            log.write(line)
+        # keep the end marker, the output may be read again when the worker stops
+        self.lines.put(None)
+
+    def convert(self, index, log):
+        start = time.perf_counter()
+        try:
+            self.process.stdin.write(f"{index}\n")
+            self.process.stdin.flush()
+            while True:
+                remaining = None if self.timeout is None else max(self.timeout - (time.perf_counter() - start), 0)
+                line = self.lines.get(timeout=remaining)
+                if line is None:
+                    self.lines.put(None)
+                    break
+                log.write(line)
+                if line.startswith(batch.RESULT_PREFIX):
+                    log.flush()
+                    return json.loads(line[len(batch.RESULT_PREFIX):])
+        except BrokenPipeError:
+            pass
+        except queue.Empty:
+            # the worker is stuck on this file, a new one is started for the next file
+            self.kill_process(log)
+            return failed_row(self.manifest["jobs"][index], start, f"Timed out after {self.timeout:g}s")
+        # the worker died while converting this file, a new one is started for the next file
+        return_code = self.process.wait()
+        return failed_row(self.manifest["jobs"][index], start, f"Blender worker exited with code {return_code}")
+
+
+def read_lines(stream, lines):
+    """Put every line of stream on the lines queue, followed by None once the stream is closed."""
+    for line in stream:
+        lines.put(line)
+    lines.put(None)
+
+
+def failed_row(job, start, message):
+    return {"input": job["input"], "output": job.get("output", ""), "status": "FAILED",
+            "seconds": time.perf_counter() - start, "import_seconds": 0.0, "export_seconds": 0.0, "warnings": 0,
+            "message": message}
+
+
+def get_size(file_path):
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+
+def run_pool(manifest_path, num_workers, report_path, timeout=None):
+    """Convert all files of the manifest over num_workers blender processes. Return the status report rows.
+
+    A file that takes longer than timeout seconds is reported as failed, and its worker process is killed.
+    """
+    manifest = batch.load_manifest(manifest_path)
+    jobs = queue.Queue()
+    # largest first, so no worker is left with a big file while the others are done
+    for index in sorted(range(len(manifest["jobs"])), key=lambda i: get_size(manifest["jobs"][i]["input"]),
+                        reverse=True):
+        jobs.put(index)
+
+    results = queue.Queue()
+    log_base = os.path.splitext(report_path)[0]
+    workers = [Worker(number, os.path.abspath(manifest_path), jobs, manifest, results, f"{log_base}.worker{number}.log",
+                      timeout)
+               for number in range(min(num_workers, len(manifest["jobs"])))]
+    for worker in workers:
+        worker.start()
+
+    rows = []
+    with open(report_path, "w", newline="") as stream:
+        writer = csv.DictWriter(stream, ("worker",) + batch.REPORT_FIELDS)
+        writer.writeheader()
+        while len(rows) < len(manifest["jobs"]):
+            row = results.get()
+            rows.append(row)
+            writer.writerow(row)
+            stream.flush()
+            print(f"[{len(rows)}/{len(manifest['jobs'])}] worker {row['worker']}: {row['status']} "
+                  f"in {row['seconds']:.2f}s {row['input']} {row['message']}")
+    for worker in workers:
+        worker.join()
+    return rows
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog="blender -b -P batch_pool.py --", description=__doc__.splitlines()[0])
+    parser.add_argument("manifest", help="JSON manifest of the files to convert")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="number of blender worker processes (default: number of cores)")
+    parser.add_argument("--report", help="CSV file for the status and timing of every file, "
+                                         "defaults to the manifest path with .csv extension")
+    parser.add_argument("--timeout", type=float, default=600,
+                        help="seconds a single file may take before its worker is killed, 0 for no limit "
+                             "(default: 600)")
+    args = parser.parse_args(argv)
+
+    report_path = args.report or os.path.splitext(args.manifest)[0] + ".csv"
+    start = time.perf_counter()
+    rows = run_pool(args.manifest, max(1, args.workers), report_path, args.timeout or None)
+    failed = sum(row["status"] != "FINISHED" for row in rows)
+    print(f"Converted {len(rows) - failed} of {len(rows)} files in {time.perf_counter() - start:.2f}s, "
+          f"report written to {report_path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
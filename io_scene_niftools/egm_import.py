@@ -41,6 +41,7 @@ import bpy
 from io_scene_niftools.file_io.egm import EGMFile
 from io_scene_niftools.modules.nif_import.animation.morph import MorphAnimation
 from io_scene_niftools.nif_common import NifCommon
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifError, NifLog
 from io_scene_niftools.utils.singleton import NifOp, EGMData
 
@@ -71,7 +72,13 @@ class EgmImport(NifCommon):
                 else:
                     NifLog.warn(f'Selected object {b_obj.name} is not a mesh object, nothing will be imported.')
         except NifError:
+            NifLog.report_summary()
             return {'CANCELLED'}
+        finally:
+            # stop tracing allocations whatever happened, it slows down everything that runs after it
+            instrumentation.stop()
 
+        self.report_instrumentation(NifOp.props.filepath)
         NifLog.info("Finished successfully")
+        NifLog.report_summary()
         return {'FINISHED'}
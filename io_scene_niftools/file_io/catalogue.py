@@ -0,0 +1,222 @@
+"""Header-only scanning of NIF directories into a queryable SQLite catalogue."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+import sqlite3
+import sys
+from multiprocessing import Pool
+
+from io_scene_niftools.file_io.header import NifHeader
+from io_scene_niftools.utils.logging import NifLog
+
+
+NIF_EXTENSIONS = (".nif", ".kf", ".nifcache", ".kfa", ".jmi")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime REAL,
+    version INTEGER,
+    user_version INTEGER,
+    bs_version INTEGER,
+    num_blocks INTEGER,
+    root_type TEXT,
+    has_skin INTEGER,
+    has_havok INTEGER,
+    has_animation INTEGER,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS block_types (
+    path TEXT,
+    block_type TEXT,
+    count INTEGER,
+    PRIMARY KEY (path, block_type)
+);
+CREATE INDEX IF NOT EXISTS block_types_by_type ON block_types (block_type);
+"""
+
+
+def scan_file(file_path):
+    """
+    Read the header of a single file and return its catalogue row and block type histogram.
+    Runs in the worker processes, so errors are returned rather than raised.
+    """
+    row = {"path": file_path, "size": None, "mtime": None,
+           "version": None, "user_version": None, "bs_version": None, "num_blocks": None,
+           "root_type": None, "has_skin": None, "has_havok": None, "has_animation": None, "error": None}
+    counts = {}
+    try:
+        stat = os.stat(file_path)
+        row.update(size=stat.st_size, mtime=stat.st_mtime)
+        header = NifHeader.from_file(file_path)
+    except Exception as e:
+        # any file that cannot be read must not stop the scan of the others
+        row["error"] = str(e) or e.__class__.__name__
+        return row, counts
+
+    root_types = header.root_types()
+    if not root_types and header.num_blocks:
+        # without a footer, the first block is the root by convention
+        root_types = [header.block_type(0)]
+    row.update(version=header.version, user_version=header.user_version, bs_version=header.bs_version,
+               root_type=root_types[0] if root_types else None)
+    if header.block_type_index:
+        row.update(num_blocks=header.num_blocks)
+    # files without a block type table do not tell which blocks they contain, so these stay unknown (NULL)
+    if header.block_types:
+        row.update(has_skin=header.has_skin(), has_havok=header.has_havok(), has_animation=header.has_animation())
+    counts = dict(header.block_type_counts())
+    return row, counts
+
+
+class NifCatalogue:
+    """SQLite catalogue of NIF header information, used to pre-filter imports and batch conversions."""
+
+    def __init__(self, database_path):
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def scan(self, directory, processes=None, chunk_size=64):
+        """
+        Scan all NIF files below directory with a pool of worker processes.
+        Files whose size and modification time did not change since the last scan are skipped,
+        and the entries of files below directory that no longer exist are removed.
+
+        :return: The number of files that were (re)scanned.
+        """
+        known = {path: (size, mtime) for path, size, mtime in
+                 self.connection.execute("SELECT path, size, mtime FROM files")}
+        found = set()
+        file_paths = []
+        for file_path in self.find_files(directory):
+            found.add(file_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                # removed since it was listed, scan_file records the error
+                file_paths.append(file_path)
+                continue
+            if known.get(file_path) != (stat.st_size, stat.st_mtime):
+                file_paths.append(file_path)
+        self.remove([path for path in known if path not in found and self.is_below(path, directory)])
+
+        NifLog.info(f"Scanning {len(file_paths)} files in {directory}")
+        with Pool(processes) as pool:
+            for row, counts in pool.imap_unordered(scan_file, file_paths, chunk_size):
+                self.store(row, counts)
+        self.connection.commit()
+        return len(file_paths)
+
+    def store(self, row, counts):
+        """Insert or replace the catalogue entry of a file."""
+        columns = ", ".join(row.keys())
+        placeholders = ", ".join("?" for _ in row)
+        self.connection.execute(f"INSERT OR REPLACE INTO files ({columns}) VALUES ({placeholders})",
+                                tuple(row.values()))
+        self.connection.execute("DELETE FROM block_types WHERE path = ?", (row["path"],))
+        self.connection.executemany("INSERT INTO block_types (path, block_type, count) VALUES (?, ?, ?)",
+                                    [(row["path"], block_type, count) for block_type, count in counts.items()])
+
+    def remove(self, file_paths):
+        """Delete the catalogue entries of the given files."""
+        parameters = [(file_path,) for file_path in file_paths]
+        self.connection.executemany("DELETE FROM files WHERE path = ?", parameters)
+        self.connection.executemany("DELETE FROM block_types WHERE path = ?", parameters)
+
+    @staticmethod
+    def is_below(file_path, directory):
+        return os.path.commonpath([os.path.abspath(file_path), os.path.abspath(directory)]) == \
+            os.path.abspath(directory)
+
+    def find(self, version=None, user_version=None, bs_version=None, root_type=None,
+             has_skin=None, has_havok=None, has_animation=None, block_type=None):
+        """Return the paths of all readable files matching every given criterion."""
+        conditions = ["error IS NULL"]
+        parameters = []
+        for column, value in (("version", version), ("user_version", user_version), ("bs_version", bs_version),
+                              ("root_type", root_type), ("has_skin", has_skin), ("has_havok", has_havok),
+                              ("has_animation", has_animation)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        if block_type is not None:
+            conditions.append("path IN (SELECT path FROM block_types WHERE block_type = ?)")
+            parameters.append(block_type)
+        query = f"SELECT path FROM files WHERE {' AND '.join(conditions)} ORDER BY path"
+        return [path for path, in self.connection.execute(query, parameters)]
+
+    def errors(self):
+        """Return (path, error) for all files that could not be read."""
+        return list(self.connection.execute("SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path"))
+
+    @staticmethod
+    def find_files(directory):
+        for root, _, file_names in os.walk(directory):
+            for file_name in sorted(file_names):
+                if file_name.lower().endswith(NIF_EXTENSIONS):
+                    yield os.path.join(root, file_name)
+
+
+def main(argv):
+    """Usage: blender -b -P catalogue.py -- <directory> <database> [processes]"""
+    if "--" in argv:
+        argv = argv[argv.index("--") + 1:]
+    if len(argv) < 2:
+        print(main.__doc__)
+        return 1
+    processes = int(argv[2]) if len(argv) > 2 else None
+    with NifCatalogue(argv[1]) as catalogue:
+        scanned = catalogue.scan(argv[0], processes=processes)
+        NifLog.info(f"Scanned {scanned} files, {len(catalogue.errors())} unreadable.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,246 @@
+"""Header-only reading of NIF files: versions, block type table, block sizes and offsets."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+import struct
+from collections import Counter
+
+import nifgen.formats.nif as NifFormat
+from io_scene_niftools.utils.logging import NifLog, NifError
+
+
+# Versions from which the corresponding header fields are present
+VER_BLOCK_TYPES = 0x05000001
+VER_GROUPS = 0x05000006
+VER_ENDIAN = 0x14000003
+VER_USER_VERSION = 0x0A000108
+VER_NUM_BLOCKS = 0x03010001
+VER_STRINGS = 0x14010001
+VER_BLOCK_SIZES = 0x14020005
+VER_BLOCK_TYPE_HASHES = 0x14030102
+VER_METADATA = 0x1E000000
+
+SKIN_BLOCK_TYPES = {"NiSkinInstance", "BSDismemberSkinInstance", "NiSkinData", "NiSkinPartition",
+                    "BSSkin::Instance", "BSSkin::BoneData"}
+ANIMATION_BLOCK_TYPES = {"NiControllerSequence", "NiControllerManager", "NiTransformController",
+                         "NiKeyframeController", "NiTransformInterpolator", "NiKeyframeData",
+                         "NiTransformData", "NiSequenceStreamHelper", "NiTextKeyExtraData"}
+
+
+class _HeaderReader:
+    """Minimal reader for the primitive types used by the NIF header."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.endian = "<"
+
+    def read(self, fmt):
+        fmt = self.endian + fmt
+        size = struct.calcsize(fmt)
+        data = self.stream.read(size)
+        if len(data) != size:
+            raise NifError("Unexpected end of file while reading the NIF header.")
+        return struct.unpack(fmt, data)
+
+    def uint(self):
+        return self.read("I")[0]
+
+    def ushort(self):
+        return self.read("H")[0]
+
+    def byte(self):
+        return self.read("B")[0]
+
+    def uints(self, count):
+        return list(self.read(f"{count}I")) if count else []
+
+    def ints(self, count):
+        return list(self.read(f"{count}i")) if count else []
+
+    def ushorts(self, count):
+        return list(self.read(f"{count}H")) if count else []
+
+    def export_string(self):
+        """Byte-length prefixed, null terminated string."""
+        return self.stream.read(self.byte()).rstrip(b"\x00").decode("latin-1")
+
+    def sized_string(self):
+        """Uint-length prefixed string."""
+        return self.stream.read(self.uint()).decode("latin-1")
+
+
+class NifHeader:
+    """
+    Everything that can be learned about a NIF file without decoding its blocks.
+    Block offsets are only known from 20.2.0.5 onwards, when the header stores the size of every block.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.file_size = 0
+        self.modification = None
+        self.version = -1
+        self.user_version = 0
+        self.bs_version = 0
+        self.endian = "<"
+        self.num_blocks = 0
+        self.block_types = []
+        self.block_type_index = []
+        self.block_sizes = []
+        self.block_offsets = []
+        self.strings = []
+        self.blocks_start = 0
+        self.roots = []
+
+    @property
+    def has_offsets(self):
+        return bool(self.block_offsets)
+
+    def block_type(self, index):
+        """Return the type name of the block at index, or None if the header does not store it."""
+        if not self.block_type_index or not self.block_types:
+            return None
+        return self.block_types[self.block_type_index[index]]
+
+    def block_type_counts(self):
+        """Histogram of block type names."""
+        if not self.block_type_index or not self.block_types:
+            return Counter()
+        return Counter(self.block_types[i] for i in self.block_type_index)
+
+    def root_types(self):
+        """Type names of the root blocks, if known."""
+        return [self.block_type(i) for i in self.roots if 0 <= i < self.num_blocks]
+
+    def has_skin(self):
+        return any(block_type in SKIN_BLOCK_TYPES for block_type in self.block_types)
+
+    def has_havok(self):
+        return any(block_type.startswith("bhk") for block_type in self.block_types)
+
+    def has_animation(self):
+        return any(block_type in ANIMATION_BLOCK_TYPES for block_type in self.block_types)
+
+    @staticmethod
+    def from_file(file_path):
+        """Read only the header (and, when block offsets are known, the footer) of a NIF file."""
+        with open(file_path, "rb") as stream:
+            return NifHeader.from_stream(stream, file_path)
+
+    @staticmethod
+    def from_stream(stream, file_path=""):
+        header = NifHeader(file_path)
+        start = stream.tell()
+        header.file_size = stream.seek(0, os.SEEK_END)
+        stream.seek(start)
+
+        # Let nifgen decide whether this is a valid and supported file
+        header.modification, (version, user_version, bs_version) = NifFormat.NifFile.inspect_version_only(stream)
+        if version == -1:
+            raise NifError("Unsupported NIF version.")
+        elif version < 0:
+            raise NifError("Not a NIF file.")
+        header.version = version
+        header.user_version = user_version
+        header.bs_version = bs_version
+
+        if version < VER_BLOCK_TYPES:
+            # Block types are stored in front of each block, so nothing else can be learned from the header
+            NifLog.debug(f"No block type table in NIF version {version:x}")
+            return header
+
+        stream.readline()  # Header string, the version has already been inspected
+        reader = _HeaderReader(stream)
+        reader.uint()  # Version
+        if version >= VER_ENDIAN:
+            header.endian = reader.endian = "<" if reader.byte() else ">"
+        if version >= VER_USER_VERSION:
+            reader.uint()  # User version
+        header.num_blocks = reader.uint()
+
+        if NifHeader.has_bs_header(version, user_version):
+            reader.uint()  # BS version
+            reader.export_string()  # Author
+            if bs_version > 130:
+                reader.uint()
+            if bs_version < 131:
+                reader.export_string()  # Process script
+            reader.export_string()  # Export script
+            if bs_version >= 103:
+                reader.export_string()  # Max file path
+
+        if version >= VER_METADATA:
+            stream.seek(reader.uint(), os.SEEK_CUR)
+
+        num_block_types = reader.ushort()
+        if version == VER_BLOCK_TYPE_HASHES:
+            # Only hashes of the type names are stored
+            reader.uints(num_block_types)
+        else:
+            header.block_types = [reader.sized_string() for _ in range(num_block_types)]
+        # The top bit of the type index flags PhysX blocks, it is not part of the index
+        header.block_type_index = [i & 0x7FFF for i in reader.ushorts(header.num_blocks)]
+
+        if version >= VER_BLOCK_SIZES:
+            header.block_sizes = reader.uints(header.num_blocks)
+        if version >= VER_STRINGS:
+            num_strings = reader.uint()
+            reader.uint()  # Max string length
+            header.strings = [reader.sized_string() for _ in range(num_strings)]
+        if version >= VER_GROUPS:
+            reader.uints(reader.uint())
+
+        header.blocks_start = stream.tell()
+        if header.block_sizes:
+            offset = header.blocks_start
+            for block_size in header.block_sizes:
+                header.block_offsets.append(offset)
+                offset += block_size
+            # The footer follows the last block and lists the roots
+            stream.seek(offset)
+            header.roots = reader.ints(reader.uint())
+
+        stream.seek(start)
+        return header
+
+    @staticmethod
+    def has_bs_header(version, user_version):
+        """Whether the Bethesda stream header is present, as in nif.xml."""
+        return user_version >= 3 and (version in (0x14020007, 0x14000005) or
+                                      (0x0A000102 <= version <= 0x14000004 and user_version <= 11))
@@ -43,8 +43,14 @@ import os.path as path
 
 import bpy
 import nifgen.formats.nif as NifFormat
+from io_scene_niftools.file_io.header import NifHeader
+from io_scene_niftools.file_io.validation import NifValidator
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog, NifError
-from io_scene_niftools.utils.singleton import EGMData
+from io_scene_niftools.utils.singleton import EGMData, NifOp
+
+
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 class NifFile:
@@ -54,25 +60,28 @@ class NifFile:
     def load_nif(file_path):
         """Load a NIF from the given file path."""
 
-        NifLog.info(f"Importing {file_path}")
+        return NifFile.decode_nif(NifFile.load_header(file_path))
 
-        file_ext = path.splitext(file_path)[1]
+    @staticmethod
+    def load_header(file_path):
+        """
+        Read only the header of the NIF at the given file path, so that the file can be checked before its blocks
+        are decoded by :meth:`decode_nif`.
+        """
 
-        # Open file for binary reading
-        with open(file_path, "rb") as nif_stream:
-            # Check if nif file is valid
-            modification, (version, user_version, bs_version) = NifFormat.NifFile.inspect_version_only(nif_stream)
-            if version >= 0:
-                # It is valid, so read the file
-                NifLog.info(f"NIF file version: {version:x}")
-                NifLog.info(f"Reading {file_ext} file")
-                data = NifFormat.NifFile.from_stream(nif_stream)
-            elif version == -1:
-                raise NifError("Unsupported NIF version.")
-            else:
-                raise NifError("Not a NIF file.")
+        NifLog.info(f"Importing {file_path}")
+        header = NifHeader.from_file(file_path)
+        NifLog.info(f"NIF file version: {header.version:x}")
+        return header
+
+    @staticmethod
+    def decode_nif(header):
+        """Decode all blocks of the NIF file whose header was read by :meth:`load_header`."""
 
-        return data
+        file_ext = path.splitext(header.file_path)[1]
+        NifLog.info(f"Reading {file_ext} file")
+        with open(header.file_path, "rb") as nif_stream:
+            return NifFormat.NifFile.from_stream(nif_stream)
 
     @staticmethod
     def write_nif(n_data, directory, file_base, file_ext):
@@ -94,9 +103,10 @@ class NifFile:
         elif bpy.context.scene.niftools_scene.game == 'HOWLING_SWORD':
             n_data.modification = "jmihs1"
 
-        NifLog.info(f"Validating.")
-        n_data.validate()
-        with open(niffile, "wb") as stream:
+        with instrumentation.stage("validate"):
+            validation = NifValidator(n_data).validate(NifOp.props.validation)
+        NifLog.info(f"Validation passed: {validation.lower()}.")
+        with instrumentation.stage("write"), open(niffile, "wb", buffering=WRITE_BUFFER_SIZE) as stream:
             n_data.write(stream)
 
         # export egm file:
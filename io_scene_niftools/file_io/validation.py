@@ -0,0 +1,147 @@
+"""Tiered validation of NIF data before writing."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+from io_scene_niftools.utils.logging import NifLog, NifError
+
+
+# (count field, array field) pairs that must agree before writing
+COUNTED_ARRAYS = (
+    ("num_children", "children"),
+    ("num_properties", "properties"),
+    ("num_extra_data_list", "extra_data_list"),
+    ("num_effects", "effects"),
+    ("num_bones", "bones"),
+    ("num_vertices", "vertices"),
+    ("num_triangles", "triangles"),
+    ("num_strips", "strip_lengths"),
+    ("num_sub_shapes", "sub_shapes"),
+    ("num_controlled_blocks", "controlled_blocks"),
+)
+
+
+class NifValidator:
+    """
+    Checks NIF data before it is written.
+    The structural pass indexes every block once and checks link integrity, array counts and reference cycles;
+    the full pass additionally runs nifgen's own, much slower, validation.
+    """
+
+    STRUCTURAL = 'STRUCTURAL'
+    FULL = 'FULL'
+
+    def __init__(self, n_data):
+        self.n_data = n_data
+        self.block_index = {}
+        self.problems = []
+
+    def validate(self, level=STRUCTURAL):
+        """Run the passes up to the given level and return the name of the deepest pass that ran."""
+        NifLog.info("Validating (structural pass).")
+        self.structural_pass()
+        if self.problems:
+            raise NifError("Invalid NIF structure:\n" + "\n".join(self.problems))
+        if level == self.FULL:
+            NifLog.info("Validating (full pass).")
+            self.n_data.validate()
+        return level
+
+    def structural_pass(self):
+        self.index_blocks()
+        for n_block in self.block_index:
+            self.check_links(n_block)
+            self.check_counts(n_block)
+        self.check_cycles()
+
+    def index_blocks(self):
+        """Number every block reachable through references from the roots, in write order."""
+        self.block_index = {}
+        stack = list(reversed(self.n_data.roots))
+        while stack:
+            n_block = stack.pop()
+            if n_block is None or n_block in self.block_index:
+                continue
+            self.block_index[n_block] = len(self.block_index)
+            stack.extend(reversed(list(n_block.get_refs())))
+        return self.block_index
+
+    def check_links(self, n_block):
+        """Pointers must target blocks that will actually be written."""
+        for n_link in n_block.get_links():
+            if n_link is not None and n_link not in self.block_index:
+                self.problems.append(f"{self.describe(n_block)} links to {self.describe(n_link)}, "
+                                     f"which is not part of the exported tree")
+
+    def check_counts(self, n_block):
+        for count_field, array_field in COUNTED_ARRAYS:
+            count = getattr(n_block, count_field, None)
+            array = getattr(n_block, array_field, None)
+            if count is None or array is None or not getattr(n_block, "has_" + array_field, True):
+                continue
+            if len(array) != count:
+                self.problems.append(f"{self.describe(n_block)} has {count_field} = {count}, "
+                                     f"but {len(array)} {array_field}")
+
+    def check_cycles(self):
+        """A block must never be its own descendant through references."""
+        # 0: unvisited, 1: on the current path, 2: done
+        state = dict.fromkeys(self.block_index, 0)
+        for n_root in self.block_index:
+            if state[n_root]:
+                continue
+            state[n_root] = 1
+            stack = [(n_root, iter(n_root.get_refs()))]
+            while stack:
+                n_block, n_refs = stack[-1]
+                for n_ref in n_refs:
+                    if n_ref is None:
+                        continue
+                    if state[n_ref] == 1:
+                        self.problems.append(f"Reference cycle through {self.describe(n_ref)}")
+                    elif state[n_ref] == 0:
+                        state[n_ref] = 1
+                        stack.append((n_ref, iter(n_ref.get_refs())))
+                        break
+                else:
+                    state[n_block] = 2
+                    stack.pop()
+
+    def describe(self, n_block):
+        index = self.block_index.get(n_block, "?")
+        name = getattr(n_block, "name", "")
+        return f"[{index}] {n_block.__class__.__name__} '{name}'"
@@ -47,6 +47,7 @@ from io_scene_niftools.modules.nif_export.animation.object import ObjectAnimatio
 from io_scene_niftools.modules.nif_export.scene import Scene
 from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog, NifError
 from io_scene_niftools.utils.singleton import NifOp, NifData
 
@@ -119,9 +120,15 @@ class KfExport(NifCommon):
                 NifData.data.write(stream)
 
         except NifError:
+            NifLog.report_summary()
             return {'CANCELLED'}
+        finally:
+            # stop tracing allocations whatever happened, it slows down everything that runs after it
+            instrumentation.stop()
 
+        self.report_instrumentation(NifOp.props.filepath)
         NifLog.info("Export finished successfully.")
+        NifLog.report_summary()
         return {'FINISHED'}
 
     def __initialize_kf_data(self):
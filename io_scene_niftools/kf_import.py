@@ -43,6 +43,7 @@ from io_scene_niftools.file_io.nif import NifFile as KFFile
 from io_scene_niftools.modules.nif_import.animation.transform import TransformAnimation
 from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog, NifError
 from io_scene_niftools.utils.singleton import NifOp
 
@@ -80,7 +81,13 @@ class KfImport(NifCommon):
                     self.transform_anim.import_kf_root(kf_root, b_armature)
 
         except NifError:
+            NifLog.report_summary()
             return {'CANCELLED'}
+        finally:
+            # stop tracing allocations whatever happened, it slows down everything that runs after it
+            instrumentation.stop()
 
+        self.report_instrumentation(NifOp.props.filepath)
         NifLog.info("Finished successfully")
+        NifLog.report_summary()
         return {'FINISHED'}
@@ -56,6 +56,7 @@ from io_scene_niftools.modules.nif_export.animation.texture import TextureAnimat
 from io_scene_niftools.modules.nif_export.animation.common import create_text_keys, export_text_keys
 
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from nifgen.formats.nif import classes as NifClasses
 
@@ -91,6 +92,7 @@ class Animation:
         self.fps = bpy.context.scene.render.fps
         self.target_game = bpy.context.scene.niftools_scene.game
 
+    @instrumentation.timed("animation")
     def export_animations(self, b_objects, n_root_node):
         # TODO: Operator setting to toggle NiControllerManager export for NIFs
 
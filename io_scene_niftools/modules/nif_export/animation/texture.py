@@ -121,7 +121,7 @@ class TextureAnimation(AnimationCommon):
             # Iterate through FCurves linked to UV Warp modifiers
             for fcurve in action_fcurves:
 
-                NifLog.warn(f"{fcurve.data_path}")
+                NifLog.debug(lambda: f"Texture animation fcurve {fcurve.data_path}")
 
                 if fcurve.data_path not in uv_warp_data_paths:
                     continue
@@ -145,7 +145,7 @@ class TextureAnimation(AnimationCommon):
     def export_ni_texture_transform_controller(self, n_ni_texturing_property, action_fcurves, fcurve, b_action, operation):
         """Export a NiTextureTransformController block."""
 
-        NifLog.warn("Exporting NiTextureTransformController!")
+        NifLog.debug("Exporting NiTextureTransformController")
 
         n_ni_texture_transform_controller = block_store.create_block("NiTextureTransformController")
         
@@ -45,6 +45,7 @@ from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.modules.nif_export.collision.bound import Bound, NiCollision
 from io_scene_niftools.modules.nif_export.collision.havok import BhkCollision
 from io_scene_niftools.modules.nif_export.collision.havok.animation import BhkBlendCollision
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 
 from nifgen.formats.nif import classes as NifClasses
@@ -60,6 +61,7 @@ class Collision:
         self.ni_collision_helper = NiCollision()
         self.target_game = bpy.context.scene.niftools_scene.game
 
+    @instrumentation.timed("collision")
     def export_collision(self, b_collision_objects):
         """Main function for handling collision export."""
 
@@ -41,6 +41,7 @@
 import mathutils
 from io_scene_niftools.modules.nif_export import types
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.collision.bounds import bounds_store
 from io_scene_niftools.modules.nif_export.collision.common import CollisionCommon
 from io_scene_niftools.utils import math
 
@@ -131,8 +132,9 @@ class NiCollision(CollisionCommon):
 
         n_bv.collision_type = 0
         matrix = math.get_object_bind(b_obj)
-        center = matrix.translation
-        n_bv.sphere.radius = b_obj.dimensions.x / 2
+        center, radius = bounds_store.get(b_obj).sphere
+        center = matrix @ mathutils.Vector(center)
+        n_bv.sphere.radius = radius * max(matrix.to_scale())
         sphere_center = n_bv.sphere.center
         sphere_center.x = center.x
         sphere_center.y = center.y
@@ -143,37 +145,38 @@ class NiCollision(CollisionCommon):
 
         n_bv.collision_type = 1
         matrix = math.get_object_bind(b_obj)
+        center, axes, half_extents = bounds_store.get(b_obj).tightest_box
 
         # set center
-        center = matrix.translation
+        center = matrix @ mathutils.Vector(center)
         box_center = n_bv.box.center
         box_center.x = center.x
         box_center.y = center.y
         box_center.z = center.z
 
-        # set axes to unity 3x3 matrix
-        axis = n_bv.box.axis
-        axis[0].x = 1
-        axis[1].y = 1
-        axis[2].z = 1
-
-        # set extent
-        extent = b_obj.dimensions / 2
-        box_extent = n_bv.box.extent
-        box_extent[0] = extent.x
-        box_extent[1] = extent.y
-        box_extent[2] = extent.z
+        # set axes and extent, carrying the object's rotation and scale
+        for i in range(3):
+            b_axis = matrix.to_3x3() @ mathutils.Vector(axes[:, i])
+            n_axis = n_bv.box.axis[i]
+            n_bv.box.extent[i] = half_extents[i] * b_axis.length
+            b_axis.normalize()
+            n_axis.x = b_axis.x
+            n_axis.y = b_axis.y
+            n_axis.z = b_axis.z
 
     def export_capsulebv(self, b_obj, n_bv):
         """Export b_obj as a NiCollisionData's bounding_volume capsule."""
 
         n_bv.collision_type = 2
         matrix = math.get_object_bind(b_obj)
-        offset = matrix.translation
+        center, radius, extent = bounds_store.get(b_obj).capsule
+        offset = matrix @ mathutils.Vector(center)
         # calculate the direction unit vector
-        v_dir = (mathutils.Vector((0, 0, 1)) @ matrix.to_3x3().inverted()).normalized()
-        extent = b_obj.dimensions.z - b_obj.dimensions.x
-        radius = b_obj.dimensions.x / 2
+        v_dir = matrix.to_3x3() @ mathutils.Vector((0, 0, 1))
+        extent *= v_dir.length
+        v_dir.normalize()
+        scale = matrix.to_scale()
+        radius *= max(scale.x, scale.y)
 
         # store data
         capsule = n_bv.capsule
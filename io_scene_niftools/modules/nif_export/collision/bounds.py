@@ -0,0 +1,161 @@
+"""Shared bounding volume computations for collision export."""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+from functools import cached_property
+
+import numpy as np
+
+from io_scene_niftools.utils.logging import NifError
+
+# the oriented box is only preferred over the axis aligned box if it is this much smaller
+ORIENTED_BOX_GAIN = 0.99
+# growth steps before the bounding sphere falls back to enclosing the farthest point directly
+SPHERE_ITERATIONS = 64
+
+
+class MeshBounds:
+    """
+    Bounding volumes of a mesh, in the mesh's local coordinates.
+    The vertex coordinates are read once; each volume is computed on first use.
+    """
+
+    def __init__(self, b_mesh):
+        if not b_mesh.vertices:
+            raise NifError(f"Cannot compute bounds of mesh {b_mesh.name}, it has no vertices")
+        # read in the native float32 layout of the coordinates, then compute in double precision
+        vertices = np.empty(len(b_mesh.vertices) * 3, dtype=np.float32)
+        b_mesh.vertices.foreach_get("co", vertices)
+        self.vertices = vertices.reshape(-1, 3).astype(np.float64)
+
+    @cached_property
+    def aabb(self):
+        """Minimum and maximum corner of the axis aligned bounding box."""
+        return self.vertices.min(axis=0), self.vertices.max(axis=0)
+
+    @property
+    def box_extents(self):
+        """Axis aligned bounding box as [[minx, maxx], [miny, maxy], [minz, maxz]]."""
+        return np.column_stack(self.aabb).tolist()
+
+    @property
+    def center(self):
+        aabb_min, aabb_max = self.aabb
+        return (aabb_min + aabb_max) * 0.5
+
+    @property
+    def half_extents(self):
+        aabb_min, aabb_max = self.aabb
+        return (aabb_max - aabb_min) * 0.5
+
+    @cached_property
+    def sphere(self):
+        """
+        Center and radius of a bounding sphere, using Ritter's initial guess
+        which is then grown towards the farthest outlying vertex until it encloses all vertices.
+        """
+        verts = self.vertices
+        p_1 = verts[np.argmax(np.linalg.norm(verts - verts[0], axis=1))]
+        p_2 = verts[np.argmax(np.linalg.norm(verts - p_1, axis=1))]
+        center = (p_1 + p_2) * 0.5
+        radius = np.linalg.norm(p_2 - p_1) * 0.5
+        for _ in range(SPHERE_ITERATIONS):
+            dists = np.linalg.norm(verts - center, axis=1)
+            farthest = np.argmax(dists)
+            if dists[farthest] <= radius:
+                break
+            # move the sphere just enough to touch the outlier on its far side
+            new_radius = (radius + dists[farthest]) * 0.5
+            center = center + (verts[farthest] - center) * ((new_radius - radius) / dists[farthest])
+            radius = new_radius
+        else:
+            radius = np.linalg.norm(verts - center, axis=1).max()
+        return center, float(radius)
+
+    @cached_property
+    def oriented_box(self):
+        """Center, axes (as matrix columns) and half extents of the bounding box along the principal axes."""
+        verts = self.vertices
+        if len(verts) < 4:
+            return self.center, np.identity(3), self.half_extents
+        _, axes = np.linalg.eigh(np.cov(verts, rowvar=False))
+        projected = verts @ axes
+        proj_min, proj_max = projected.min(axis=0), projected.max(axis=0)
+        return axes @ ((proj_min + proj_max) * 0.5), axes, (proj_max - proj_min) * 0.5
+
+    @property
+    def tightest_box(self):
+        """The oriented box if it is noticeably smaller than the axis aligned one, otherwise the latter."""
+        center, axes, half_extents = self.oriented_box
+        if np.prod(half_extents) < ORIENTED_BOX_GAIN * np.prod(self.half_extents):
+            return center, axes, half_extents
+        return self.center, np.identity(3), self.half_extents
+
+    @cached_property
+    def capsule(self):
+        """
+        Center, radius and segment length of the capsule along the local Z axis,
+        matching how Blender displays capsule bounds.
+        """
+        half_x, half_y, half_z = self.half_extents
+        radius = max(half_x, half_y)
+        return self.center, float(radius), float(max(2.0 * (half_z - radius), 0.0))
+
+
+class MeshBoundsRegistry:
+    """Stores one :class:`MeshBounds` per Blender mesh for the duration of an export."""
+
+    def __init__(self):
+        self._bounds = {}
+
+    def get(self, b_obj):
+        """Return the bounds of b_obj's mesh, building them on first use."""
+        key = b_obj.data.as_pointer()
+        bounds = self._bounds.get(key)
+        if bounds is None:
+            bounds = MeshBounds(b_obj.data)
+            self._bounds[key] = bounds
+        return bounds
+
+    def clear(self):
+        """Forget all bounds; called at the start of every export."""
+        self._bounds = {}
+
+
+bounds_store = MeshBoundsRegistry()
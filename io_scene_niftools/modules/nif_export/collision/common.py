@@ -40,6 +40,8 @@
 
 import bpy
 
+from io_scene_niftools.modules.nif_export.collision.bounds import bounds_store
+
 
 class CollisionCommon:
     """Abstract base class containing functions and attributes shared between collision export classes."""
@@ -56,11 +58,4 @@ class CollisionCommon:
     @staticmethod
     def calculate_box_extents(b_obj):
         # calculate bounding box extents
-        b_vertlist = [vert.co for vert in b_obj.data.vertices]
-        minx = min([b_vert[0] for b_vert in b_vertlist])
-        maxx = max([b_vert[0] for b_vert in b_vertlist])
-        maxy = max([b_vert[1] for b_vert in b_vertlist])
-        miny = min([b_vert[1] for b_vert in b_vertlist])
-        minz = min([b_vert[2] for b_vert in b_vertlist])
-        maxz = max([b_vert[2] for b_vert in b_vertlist])
-        return [[minx, maxx], [miny, maxy], [minz, maxz]]
+        return bounds_store.get(b_obj).box_extents
@@ -42,8 +42,9 @@ from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.modules.nif_export.collision.havok.common import BhkCollisionCommon
 from io_scene_niftools.modules.nif_export.collision.havok.mopp_shape import BhkMOPPShape
 from io_scene_niftools.modules.nif_export.collision.havok.shape import BhkShape
+from io_scene_niftools.modules.nif_export.collision.havok.shape_cache import shape_cache
 # from io_scene_niftools.modules.nif_export.object import DICT_NAMES
-from io_scene_niftools.utils.singleton import NifData
+from io_scene_niftools.utils.singleton import NifData, NifOp
 from nifgen.formats.nif import classes as NifClasses
 
 
@@ -91,13 +92,23 @@ class BhkCollision(BhkCollisionCommon):
         # Export a bhkRigidBody
         n_bhk_rigid_body = self.__export_bhk_rigid_body(b_col_obj, n_col_obj, b_col_shape)
 
+        # Reuse the shape tree of a collision object that did not change since an earlier export
+        cache_key = None
+        if NifOp.props.use_collision_cache:
+            cache_key = shape_cache.key_for(b_col_obj, n_hav_layer)
+            n_bhk_rigid_body.shape = shape_cache.load(cache_key)
+
         # Export the collision shape(s)
-        if b_col_shape == 'MESH':
-            # Export MOPP collision
-            self.bhk_mopp_shape_helper.export_bhk_mopp_shape(b_col_obj, n_bhk_rigid_body, n_hav_mat_list, n_hav_layer)
-        else:
-            # Export normal collision
-            self.bhk_shape_helper.export_bhk_shape(b_col_obj, n_bhk_rigid_body, n_hav_mat_list[0])
+        if not n_bhk_rigid_body.shape:
+            if b_col_shape == 'MESH':
+                # Export MOPP collision
+                self.bhk_mopp_shape_helper.export_bhk_mopp_shape(b_col_obj, n_bhk_rigid_body, n_hav_mat_list,
+                                                                 n_hav_layer)
+            else:
+                # Export normal collision
+                self.bhk_shape_helper.export_bhk_shape(b_col_obj, n_bhk_rigid_body, n_hav_mat_list[0])
+            if cache_key and n_bhk_rigid_body.shape:
+                shape_cache.store(cache_key, n_bhk_rigid_body.shape)
 
         # Recalculate inertia tensor and center of mass for bhkRigidBody(T)
         if b_col_obj.nif_collision.use_blender_properties:
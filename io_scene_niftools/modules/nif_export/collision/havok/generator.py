@@ -0,0 +1,157 @@
+"""Generation of simplified Havok collision geometry from render meshes."""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import numpy as np
+
+from io_scene_niftools.modules.nif_export.collision.havok.hull import ConvexHull
+from io_scene_niftools.utils.logging import NifError
+
+# finest clustering grid tried when decimating, in cells along the longest side
+MAX_GRID_RESOLUTION = 1024
+
+
+class CollisionPart:
+    """A set of render triangles with the convex hull around them and how far the triangles sink below it."""
+
+    def __init__(self, generator, triangle_indices, max_hull_vertices):
+        self.triangle_indices = triangle_indices
+        triangles = generator.triangles[triangle_indices]
+        # the centroids catch concave faces whose corners all lie on the hull
+        self.points = np.vstack((generator.vertices[np.unique(triangles)],
+                                 generator.vertices[triangles].mean(axis=1)))
+        self.hull = ConvexHull(self.points, max_hull_vertices, 2 * max_hull_vertices)
+        depths = -(self.points @ self.hull.planes[:, :3].T + self.hull.planes[:, 3]).max(axis=1)
+        self.concavity = float(max(depths.max(), 0.0))
+        self.splittable = len(triangle_indices) > 1
+
+
+class CollisionGenerator:
+    """
+    Builds simplified collision for a triangle mesh, either as a few convex hulls or as a decimated triangle mesh.
+    Errors are relative to the diagonal of the mesh's bounding box.
+    """
+
+    def __init__(self, vertices, triangles):
+        self.vertices = np.asarray(vertices, dtype=float).reshape(-1, 3)
+        self.triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        if not len(self.triangles):
+            raise NifError("Cannot generate collision for a mesh without faces")
+        self.size = float(np.linalg.norm(self.vertices.max(axis=0) - self.vertices.min(axis=0))) or 1.0
+
+    def convex_decomposition(self, max_parts=8, max_hull_vertices=32, max_error=0.02):
+        """
+        Split the mesh into at most max_parts convex hulls, repeatedly halving the most concave part
+        along its principal axis until every part is within max_error.
+        Returns the hulls and the largest remaining relative concavity.
+        """
+        parts = [CollisionPart(self, np.arange(len(self.triangles)), max_hull_vertices)]
+        while len(parts) < max_parts:
+            candidates = [part for part in parts if part.splittable and part.concavity > max_error * self.size]
+            if not candidates:
+                break
+            worst = max(candidates, key=lambda part: part.concavity)
+            halves = self.split(worst, max_hull_vertices)
+            if halves is None:
+                worst.splittable = False
+                continue
+            parts.remove(worst)
+            parts.extend(halves)
+        return [part.hull for part in parts], max(part.concavity for part in parts) / self.size
+
+    def split(self, part, max_hull_vertices):
+        """Halve the triangles of a part at the median along its longest principal axis."""
+        centroids = self.vertices[self.triangles[part.triangle_indices]].mean(axis=1)
+        _, axes = np.linalg.eigh(np.cov(centroids, rowvar=False))
+        projected = centroids @ axes[:, -1]
+        below = projected <= np.median(projected)
+        if below.all() or not below.any():
+            return None
+        try:
+            return [CollisionPart(self, part.triangle_indices[below], max_hull_vertices),
+                    CollisionPart(self, part.triangle_indices[~below], max_hull_vertices)]
+        except NifError:
+            # one half is too thin to have a hull
+            return None
+
+    def cluster(self, resolution):
+        """Collapse the vertices in each cell of a grid with the given number of cells along the longest side."""
+        mins = self.vertices.min(axis=0)
+        cell_size = (self.vertices.max(axis=0) - mins).max() / resolution or 1.0
+        cells = np.floor((self.vertices - mins) / cell_size).astype(np.int64)
+        _, cluster_of = np.unique(cells, axis=0, return_inverse=True)
+        cluster_of = cluster_of.reshape(-1)
+
+        # every cluster is represented by the mean of its vertices
+        counts = np.bincount(cluster_of).astype(float)
+        centers = np.zeros((len(counts), 3))
+        np.add.at(centers, cluster_of, self.vertices)
+        centers /= counts[:, None]
+
+        triangles = cluster_of[self.triangles]
+        triangles = triangles[(triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) &
+                              (triangles[:, 2] != triangles[:, 0])]
+        # drop triangles that collapsed onto the same corners, keeping the first one's winding
+        _, first = np.unique(np.sort(triangles, axis=1), axis=0, return_index=True)
+        triangles = triangles[np.sort(first)]
+
+        error = float(np.linalg.norm(self.vertices - centers[cluster_of], axis=1).max()) / self.size
+        used, triangles = np.unique(triangles, return_inverse=True)
+        return centers[used], triangles.reshape(-1, 3), error
+
+    def decimated_mesh(self, max_triangles=1000):
+        """
+        Decimate the mesh by vertex clustering, using the finest grid that yields at most max_triangles triangles,
+        or the coarsest grid that leaves any triangles at all. Returns the vertices, triangles and relative error of the decimated mesh.
+        """
+        if len(self.triangles) <= max_triangles:
+            return self.vertices, self.triangles, 0.0
+        low, high = 1, MAX_GRID_RESOLUTION
+        best = self.cluster(low)
+        while low < high:
+            middle = (low + high + 1) // 2
+            result = self.cluster(middle)
+            if len(result[1]) <= max_triangles:
+                low, best = middle, result
+            else:
+                high = middle - 1
+        if not len(best[1]) and low < MAX_GRID_RESOLUTION:
+            # every grid within budget collapses the whole mesh, exceed the budget rather than return nothing
+            return self.cluster(low + 1)
+        return best
@@ -0,0 +1,384 @@
+"""Convex hull computation and simplification for Havok convex shapes."""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import itertools
+import math
+
+import numpy as np
+
+from io_scene_niftools.utils import consts
+from io_scene_niftools.utils.logging import NifError
+
+# distances below this are considered zero when building the hull
+HULL_PRECISION = 1.0 / consts.VERTEX_RESOLUTION
+# planes whose unit normals are closer than this are merged
+PLANE_NORMAL_TOLERANCE = 1.0 / consts.NORMAL_RESOLUTION
+
+
+def quickhull(points, precision=HULL_PRECISION):
+    """
+    Compute the convex hull of an (N, 3) array of points.
+    Returns the indices of the hull points and an (M, 3) array of outward facing triangles indexing into points.
+    Points closer than precision to the hull are considered inside it. Flat point sets return a fan
+    triangulation of their outline, and collinear or coincident point sets return no triangles.
+    """
+    points = np.asarray(points, dtype=float)
+    if len(points) < 3:
+        return np.arange(len(points)), np.empty((0, 3), dtype=np.int64)
+
+    # initial simplex from the extreme points
+    i_0 = int(np.argmin(points[:, 0]))
+    i_1 = int(np.argmax(np.linalg.norm(points - points[i_0], axis=1)))
+    axis = points[i_1] - points[i_0]
+    if np.linalg.norm(axis) <= precision:
+        return np.array([i_0]), np.empty((0, 3), dtype=np.int64)
+    axis /= np.linalg.norm(axis)
+    rel = points - points[i_0]
+    off_axis = rel - np.outer(rel @ axis, axis)
+    i_2 = int(np.argmax(np.linalg.norm(off_axis, axis=1)))
+    if np.linalg.norm(off_axis[i_2]) <= precision:
+        return np.array([i_0, i_1]), np.empty((0, 3), dtype=np.int64)
+    normal = np.cross(points[i_1] - points[i_0], points[i_2] - points[i_0])
+    normal /= np.linalg.norm(normal)
+    heights = rel @ normal
+    i_3 = int(np.argmax(np.abs(heights)))
+    if abs(heights[i_3]) <= precision:
+        return _quickhull_flat(points, normal, precision)
+
+    faces = {}
+    normals = {}
+    offsets = {}
+    edges = {}
+    outside = {}
+    face_ids = itertools.count()
+
+    coords = points.tolist()
+
+    def add_face(a, b, c):
+        # plain float arithmetic, numpy call overhead dominates for single vectors
+        (a_x, a_y, a_z), (b_x, b_y, b_z), (c_x, c_y, c_z) = coords[a], coords[b], coords[c]
+        u_x, u_y, u_z = b_x - a_x, b_y - a_y, b_z - a_z
+        v_x, v_y, v_z = c_x - a_x, c_y - a_y, c_z - a_z
+        n_x, n_y, n_z = u_y * v_z - u_z * v_y, u_z * v_x - u_x * v_z, u_x * v_y - u_y * v_x
+        length = math.sqrt(n_x * n_x + n_y * n_y + n_z * n_z) or 1.0
+        n_x, n_y, n_z = n_x / length, n_y / length, n_z / length
+        face = next(face_ids)
+        faces[face] = (a, b, c)
+        normals[face] = (n_x, n_y, n_z)
+        offsets[face] = -(n_x * a_x + n_y * a_y + n_z * a_z)
+        edges[a, b] = edges[b, c] = edges[c, a] = face
+        return face
+
+    def assign(candidates, new_faces):
+        """Give each candidate point to the new face it lies furthest in front of, if any."""
+        if not len(candidates) or not new_faces:
+            return
+        face_normals = np.array([normals[face] for face in new_faces])
+        face_offsets = np.array([offsets[face] for face in new_faces])
+        dists = points[candidates] @ face_normals.T + face_offsets
+        best = np.argmax(dists, axis=1)
+        above = dists[np.arange(len(candidates)), best] > precision
+        for column, face in enumerate(new_faces):
+            mine = candidates[above & (best == column)]
+            if len(mine):
+                outside[face] = mine
+
+    # orient the simplex so that its faces point away from the fourth point
+    if heights[i_3] > 0.0:
+        i_1, i_2 = i_2, i_1
+    simplex = [add_face(i_0, i_1, i_2), add_face(i_0, i_3, i_1), add_face(i_1, i_3, i_2), add_face(i_2, i_3, i_0)]
+    assign(np.arange(len(points)), simplex)
+
+    while outside:
+        face, candidates = outside.popitem()
+        apex = int(candidates[np.argmax(points[candidates] @ normals[face])])
+        apex_x, apex_y, apex_z = coords[apex]
+
+        # flood fill the faces visible from the apex, collecting the horizon as directed edges
+        visible = {face}
+        stack = [face]
+        horizon = []
+        while stack:
+            a, b, c = faces[stack.pop()]
+            for edge in ((a, b), (b, c), (c, a)):
+                neighbour = edges[edge[1], edge[0]]
+                if neighbour in visible:
+                    continue
+                n_x, n_y, n_z = normals[neighbour]
+                if n_x * apex_x + n_y * apex_y + n_z * apex_z + offsets[neighbour] > precision:
+                    visible.add(neighbour)
+                    stack.append(neighbour)
+                else:
+                    horizon.append(edge)
+
+        orphans = [candidates]
+        for current in visible:
+            if current in outside:
+                orphans.append(outside.pop(current))
+            a, b, c = faces.pop(current)
+            del normals[current], offsets[current]
+            for edge in ((a, b), (b, c), (c, a)):
+                if edges.get(edge) == current:
+                    del edges[edge]
+        new_faces = [add_face(a, b, apex) for a, b in horizon]
+        orphans = np.concatenate(orphans)
+        assign(orphans[orphans != apex], new_faces)
+
+    tris = np.array(list(faces.values()), dtype=np.int64)
+    return np.unique(tris), tris
+
+
+def _quickhull_flat(points, normal, precision):
+    """Return the outline of a flat point set as a triangle fan, using a monotone chain in its plane."""
+    u_axis = np.cross(normal, (1.0, 0.0, 0.0))
+    if np.linalg.norm(u_axis) < 0.5:
+        u_axis = np.cross(normal, (0.0, 1.0, 0.0))
+    u_axis /= np.linalg.norm(u_axis)
+    v_axis = np.cross(normal, u_axis)
+    planar = np.column_stack((points @ u_axis, points @ v_axis))
+    order = np.lexsort((planar[:, 1], planar[:, 0]))
+
+    def chain(indices):
+        hull = []
+        for i in indices:
+            while len(hull) >= 2:
+                o, a, b = planar[hull[-2]], planar[hull[-1]], planar[i]
+                if (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0]) > precision ** 2:
+                    break
+                hull.pop()
+            hull.append(int(i))
+        return hull
+
+    outline = chain(order)[:-1] + chain(order[::-1])[:-1]
+    tris = np.array([(outline[0], outline[i], outline[i + 1]) for i in range(1, len(outline) - 1)], dtype=np.int64)
+    return np.array(outline), tris.reshape(-1, 3)
+
+
+class ConvexHull:
+    """
+    Convex hull of a point cloud, reduced to a vertex and plane budget.
+
+    After construction, ``vertices`` holds the (N, 3) corner points, ``triangles`` the (M, 3) outward facing
+    triangulation of the hull and ``planes`` the (K, 4) merged face planes as (normal, w) with ``normal . p + w = 0``.
+    Every vertex lies on or behind every plane. ``volume_error`` is the fraction of the exact hull volume that
+    was lost to decimation.
+    """
+
+    def __init__(self, points, max_vertices=255, max_planes=255):
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        if len(points) < 4:
+            raise NifError(f"A convex hull needs at least 4 points, got {len(points)}")
+        self.max_vertices = max(4, max_vertices)
+        self.max_planes = max(4, max_planes)
+        self.vertices, self.triangles = self.build_hull(self.unique_points(points))
+        self.is_flat = self.volume_of(self.vertices, self.triangles) <= HULL_PRECISION ** 3
+        self.planes, self.triangle_planes = self.merge_planes()
+        self.drop_redundant_vertices()
+        self.exact_volume = self.volume
+        self.decimate()
+
+    @property
+    def volume(self):
+        return self.volume_of(self.vertices, self.triangles)
+
+    @property
+    def volume_error(self):
+        if self.exact_volume <= 0.0:
+            return 0.0
+        return max(0.0, 1.0 - self.volume / self.exact_volume)
+
+    @staticmethod
+    def unique_points(points):
+        """Collapse points that coincide at export resolution."""
+        keys = np.round(points * consts.VERTEX_RESOLUTION).astype(np.int64)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        return points[np.sort(first)]
+
+    @staticmethod
+    def build_hull(points):
+        """Return the hull vertices and outward facing triangles of the points."""
+        hull_indices, tris = quickhull(points)
+        if not len(tris):
+            raise NifError("Cannot build a convex hull from collinear or coincident points")
+        # reindex to the hull vertices only
+        remap = np.full(len(points), -1, dtype=np.int64)
+        remap[hull_indices] = np.arange(len(hull_indices))
+        return points[hull_indices], remap[tris]
+
+    @staticmethod
+    def orient_outward(verts, tris):
+        """Flip triangles so that their normals point away from the hull centroid."""
+        normals = np.cross(verts[tris[:, 1]] - verts[tris[:, 0]], verts[tris[:, 2]] - verts[tris[:, 0]])
+        inward = np.einsum("ij,ij->i", normals, verts[tris[:, 0]] - verts.mean(axis=0)) < 0.0
+        tris = tris.copy()
+        tris[inward] = tris[inward][:, ::-1]
+        return tris
+
+    @staticmethod
+    def triangle_planes_of(verts, tris):
+        """Return the unit normals and plane offsets of the triangles."""
+        normals = np.cross(verts[tris[:, 1]] - verts[tris[:, 0]], verts[tris[:, 2]] - verts[tris[:, 0]])
+        lengths = np.linalg.norm(normals, axis=1)
+        normals = normals / np.where(lengths > 0.0, lengths, 1.0)[:, None]
+        return normals, -np.einsum("ij,ij->i", normals, verts[tris[:, 0]])
+
+    @staticmethod
+    def volume_of(verts, tris):
+        if not len(tris):
+            return 0.0
+        v_0, v_1, v_2 = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+        return abs(np.einsum("ij,ij->i", v_0, np.cross(v_1, v_2)).sum()) / 6.0
+
+    def merge_planes(self):
+        """
+        Merge the planes of coplanar triangles, found in a single pass by rounding their normals and offsets
+        to the plane tolerances.
+        Returns the merged planes and, for each triangle, the index of the plane it was merged into.
+        """
+        verts, tris = self.vertices, self.triangles
+        crosses = np.cross(verts[tris[:, 1]] - verts[tris[:, 0]], verts[tris[:, 2]] - verts[tris[:, 0]])
+        normals, offsets = self.triangle_planes_of(verts, tris)
+
+        keys = np.column_stack((np.round(normals / PLANE_NORMAL_TOLERANCE),
+                                np.round(offsets / HULL_PRECISION))).astype(np.int64)
+        _, labels = np.unique(keys, axis=0, return_inverse=True)
+        labels = labels.reshape(-1)
+        num_reps = int(labels.max()) + 1
+
+        # area weighted normal per merged plane, pushed out so that no vertex lies in front of it
+        merged = np.zeros((num_reps, 3))
+        np.add.at(merged, labels, crosses)
+        merged /= np.linalg.norm(merged, axis=1)[:, None]
+        if self.is_flat:
+            # a flat hull is bounded by both faces of its plane
+            normal = crosses.sum(axis=0)
+            normal /= np.linalg.norm(normal)
+            merged = np.vstack((normal, -normal))
+            labels = np.zeros(len(tris), dtype=np.int64)
+        planes = np.empty((len(merged), 4))
+        planes[:, :3] = merged
+        planes[:, 3] = -(verts @ merged.T).max(axis=0)
+        return planes, labels
+
+    def drop_redundant_vertices(self):
+        """Remove vertices that are not a corner of at least three merged planes."""
+        if self.is_flat:
+            return
+        incident = np.zeros((len(self.vertices), len(self.planes)), dtype=bool)
+        for corner in range(3):
+            incident[self.triangles[:, corner], self.triangle_planes] = True
+        corners = incident.sum(axis=1) >= 3
+        if not corners.all():
+            self.rebuild(self.vertices[corners])
+
+    def rebuild(self, points):
+        self.vertices, self.triangles = self.build_hull(points)
+        self.planes, self.triangle_planes = self.merge_planes()
+
+    def vertex_costs(self):
+        """
+        Estimate the volume lost by removing each vertex, as the cone between the vertex
+        and the average plane through its neighbours.
+        """
+        verts, tris = self.vertices, self.triangles
+        crosses = np.cross(verts[tris[:, 1]] - verts[tris[:, 0]], verts[tris[:, 2]] - verts[tris[:, 0]])
+        normal_sums = np.zeros_like(verts)
+        neighbour_sums = np.zeros_like(verts)
+        counts = np.zeros(len(verts))
+        for corner in range(3):
+            index = tris[:, corner]
+            np.add.at(normal_sums, index, crosses)
+            np.add.at(neighbour_sums, index, verts[tris[:, (corner + 1) % 3]] + verts[tris[:, (corner + 2) % 3]])
+            np.add.at(counts, index, 2.0)
+        areas = np.linalg.norm(normal_sums, axis=1) / 2.0
+        normal_sums /= np.where(areas > 0.0, 2.0 * areas, 1.0)[:, None]
+        heights = np.abs(np.einsum("ij,ij->i", verts - neighbour_sums / np.maximum(counts, 1.0)[:, None], normal_sums))
+        return areas * heights / 3.0
+
+    def is_within_budget(self):
+        return len(self.vertices) <= self.max_vertices and len(self.planes) <= self.max_planes
+
+    def decimate(self):
+        """Remove the cheapest vertices in batches of at most half the excess until the hull fits the budget."""
+        if self.is_flat:
+            return
+        while not self.is_within_budget() and len(self.vertices) > 4:
+            excess = max(len(self.vertices) - self.max_vertices, (len(self.planes) - self.max_planes + 1) // 2, 1)
+            batch = min(max(1, excess // 2), max(1, len(self.vertices) // 4), len(self.vertices) - 4)
+            keep = np.ones(len(self.vertices), dtype=bool)
+            keep[np.argsort(self.vertex_costs())[:batch]] = False
+            self.rebuild(self.vertices[keep])
+            self.drop_redundant_vertices()
+
+
+def shrink_hull(points, distance):
+    """
+    Move every face plane of the convex hull of the points inward by distance.
+
+    Points on the hull are moved to the intersection of the offset planes they lie on, i.e. the least squares
+    solution of ``n_i . (p + d) + w_i = -distance`` over their incident planes, so corners end up exactly on the
+    shrunk hull while points on edges and faces slide along it. Points inside the hull are left where they are.
+    Returns the moved (N, 3) points and whether the shrunk hull is valid, which is not the case when the distance
+    collapses a face or the hull is flat.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    if distance <= 0.0:
+        return points.copy(), True
+    hull = ConvexHull(points, max_vertices=len(points), max_planes=np.iinfo(np.int32).max)
+    if hull.is_flat:
+        return points.copy(), False
+    normals, offsets = hull.planes[:, :3], hull.planes[:, 3]
+
+    # merged planes may be off by the normal tolerance over the size of the hull
+    extent = np.linalg.norm(hull.vertices - hull.vertices.mean(axis=0), axis=1).max()
+    tolerance = HULL_PRECISION + PLANE_NORMAL_TOLERANCE * extent
+    incident = (np.abs(points @ normals.T + offsets) <= tolerance).astype(float)
+
+    # normal equations of all points at once, regularized so that points on one or two planes
+    # get the minimum norm displacement
+    normal_products = np.einsum("vp,pi,pj->vij", incident, normals, normals)
+    normal_products += np.eye(3) * (HULL_PRECISION ** 2)
+    displacements = np.linalg.solve(normal_products, -distance * (incident @ normals)[:, :, None])[:, :, 0]
+    shrunk = points + displacements
+
+    # a collapsed face pushes the neighbouring corners out of the opposite planes
+    on_hull = incident.any(axis=1)
+    overshoot = shrunk[on_hull] @ normals.T + offsets + distance
+    return shrunk, bool(overshoot.max(initial=-np.inf) <= tolerance)
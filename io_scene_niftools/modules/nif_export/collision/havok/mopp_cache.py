@@ -0,0 +1,121 @@
+"""Disk cache of generated MOPP data, keyed by the collision geometry it was built from."""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import hashlib
+
+import numpy as np
+
+from io_scene_niftools.utils.cache import DiskCache, DEFAULT_CACHE_SIZE
+from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.singleton import NifData
+
+
+def mopper_available():
+    """
+    Whether nifgen can run the external mopper. Without it, nifgen falls back to a simple MOPP tree,
+    which must not be cached in place of the real one.
+    """
+    try:
+        from nifgen.utils import mopp
+        get_credits = getattr(mopp, "getMopperCredits", None) or getattr(mopp, "get_mopper_credits")
+        return bool(get_credits())
+    except Exception as e:
+        NifLog.debug(f"The mopper is not available: {e}")
+        return False
+
+
+class MoppCache(DiskCache):
+    """
+    Stores the MOPP code, origin, scale and welding info generated for a bhkMoppBvTreeShape,
+    so that unchanged collision shapes skip MOPP generation on the next export.
+    """
+
+    def __init__(self, directory="", max_size=DEFAULT_CACHE_SIZE):
+        super().__init__("mopp", directory, max_size)
+
+    @staticmethod
+    def get_sub_shapes(n_block):
+        n_shape = n_block.shape
+        # Oblivion stores sub shapes on the shape, later games on its data
+        return list(getattr(n_shape, "sub_shapes", [])) + list(n_shape.data.sub_shapes)
+
+    def key_for(self, n_block):
+        """Hash of every input of MOPP generation: packed geometry, welding, materials and scales."""
+        n_data = n_block.shape.data
+        digest = hashlib.sha1()
+        digest.update(np.array([(v.x, v.y, v.z) for v in n_data.vertices], dtype=np.float32).tobytes())
+        digest.update(np.array([(t.triangle.v_1, t.triangle.v_2, t.triangle.v_3, t.welding_info)
+                                for t in n_data.triangles], dtype=np.int64).tobytes())
+        digest.update(repr([(n_sub_shape.num_vertices, int(n_sub_shape.material.material))
+                            for n_sub_shape in self.get_sub_shapes(n_block)]).encode("utf-8"))
+        return self.make_key(digest.hexdigest(), NifData.data.havok_scale,
+                             NifData.data.version, NifData.data.user_version, NifData.data.bs_header.bs_version)
+
+    def load(self, n_block, key):
+        """Fill in the MOPP data of n_block from the cache entry under key; return whether it was found."""
+        result = self.get(key)
+        if result is None:
+            return False
+
+        n_block.scale = result["scale"]
+        n_mopp_code = n_block.mopp_code
+        n_mopp_code.offset.x, n_mopp_code.offset.y, n_mopp_code.offset.z, n_mopp_code.offset.w = result["offset"]
+        if "build_type" in result:
+            n_mopp_code.build_type = result["build_type"]
+        n_mopp_code.data_size = len(result["data"])
+        n_mopp_code.reset_field("data")
+        n_mopp_code.data[:] = np.frombuffer(result["data"], dtype=np.uint8)
+        for n_triangle, welding_info in zip(n_block.shape.data.triangles, result["welding_info"]):
+            n_triangle.welding_info = welding_info
+        return True
+
+    def store(self, n_block, key):
+        """Store the freshly generated MOPP data of n_block under the key its input hashed to."""
+        n_mopp_code = n_block.mopp_code
+        offset = n_mopp_code.offset
+        result = {
+            "scale": n_block.scale,
+            "offset": (offset.x, offset.y, offset.z, offset.w),
+            "data": bytes(bytearray(int(b) for b in n_mopp_code.data)),
+            "welding_info": [n_triangle.welding_info for n_triangle in n_block.shape.data.triangles],
+        }
+        if hasattr(n_mopp_code, "build_type"):
+            result["build_type"] = int(n_mopp_code.build_type)
+        self.put(key, result)
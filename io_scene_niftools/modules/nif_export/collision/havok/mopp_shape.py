@@ -38,9 +38,12 @@
 # ***** END LICENSE BLOCK *****
 
 
+import numpy as np
+
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.collision.bounds import bounds_store
 from io_scene_niftools.modules.nif_export.collision.havok import BhkCollisionCommon
-from io_scene_niftools.utils import math
+from io_scene_niftools.utils import math, consts
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.singleton import NifData
 
@@ -123,73 +126,55 @@ class BhkMOPPShape(BhkCollisionCommon):
         """
 
         b_mesh = b_col_obj.data
-        transform = math.get_object_bind(b_col_obj)
-        rotation = transform.decompose()[1]
-
-        # Transform vertices
-        transformed_vertices = [transform @ vert.co for vert in b_mesh.vertices]
-
-        # Collect triangles and normals by material
-        triangles_by_material = {}
-        normals_by_material = {}
-
-        for face in b_mesh.polygons:
-            if len(face.vertices) < 3:
-                continue  # Ignore degenerate polygons
-
-            material_idx = face.material_index
-
-            if material_idx not in triangles_by_material:
-                triangles_by_material[material_idx] = []
-                normals_by_material[material_idx] = []
-
-            triangles_by_material[material_idx].append([face.vertices[i] for i in (0, 1, 2)])
-            normals_by_material[material_idx].append(rotation @ face.normal)
-
-            if len(face.vertices) == 4:
-                triangles_by_material[material_idx].append([face.vertices[i] for i in (0, 2, 3)])
-                normals_by_material[material_idx].append(rotation @ face.normal)
+        transform = np.array(math.get_object_bind(b_col_obj))
+
+        # Transform vertices in bulk and weld those that coincide at export resolution,
+        # np.unique sorts the welded vertices so the output order no longer depends on the mesh
+        vertices = bounds_store.get(b_col_obj).vertices @ transform[:3, :3].T + transform[:3, 3]
+        _, first_vertices, weld_map = np.unique(np.round(vertices * consts.VERTEX_RESOLUTION).astype(np.int64),
+                                                axis=0, return_index=True, return_inverse=True)
+        welded_vertices = vertices[first_vertices]
+        weld_map = weld_map.reshape(-1)
+
+        # Triangulated faces and their materials
+        b_mesh.calc_loop_triangles()
+        triangles = np.empty(len(b_mesh.loop_triangles) * 3, dtype=np.int32)
+        b_mesh.loop_triangles.foreach_get("vertices", triangles)
+        triangles = weld_map[triangles].reshape(-1, 3)
+        material_indices = np.empty(len(b_mesh.loop_triangles), dtype=np.int32)
+        b_mesh.loop_triangles.foreach_get("material_index", material_indices)
+
+        # Drop triangles that welding collapsed
+        valid = ((triangles[:, 0] != triangles[:, 1]) & (triangles[:, 1] != triangles[:, 2]) &
+                 (triangles[:, 2] != triangles[:, 0]))
+        triangles = triangles[valid]
+        material_indices = material_indices[valid]
+
+        # Face normals from the transformed vertices
+        corners = welded_vertices[triangles]
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        normals /= np.where(lengths > 0.0, lengths, 1.0)[:, None]
 
         # Sort materials and align geometry
-        material_mapping = {
-            old_idx: new_idx for new_idx, (old_idx, _) in enumerate(
-                sorted(enumerate(n_hav_mat_list), key=lambda item: item[1].value)
-            )
-        }
+        material_order = sorted(range(len(n_hav_mat_list)), key=lambda i: n_hav_mat_list[i].value)
+        material_mapping = np.empty(len(n_hav_mat_list), dtype=np.int64)
+        material_mapping[material_order] = np.arange(len(n_hav_mat_list))
         n_hav_mat_list.sort(key=lambda mat: mat.value)
 
-        # Align geometry to sorted materials
-        aligned_triangles_by_material = {}
-        aligned_normals_by_material = {}
-
-        for old_idx, triangles in triangles_by_material.items():
-            new_idx = material_mapping[old_idx]
-            aligned_triangles_by_material[new_idx] = triangles
-            aligned_normals_by_material[new_idx] = normals_by_material[old_idx]
-
-        # Replace old geometry with aligned geometry
-        triangles_by_material = aligned_triangles_by_material
-        normals_by_material = aligned_normals_by_material
-
-        # Export geometry for each material group
-        for mat_idx in sorted(triangles_by_material.keys()):
-            triangles = triangles_by_material[mat_idx]
-            normals = normals_by_material[mat_idx]
-
-            try:
-                n_material = n_hav_mat_list[mat_idx]
-            except IndexError:
-                NifLog.warn(f"Material index {mat_idx} out of bounds! "
-                            f"Using default material")
-                n_material = n_hav_mat_list[0]
-
-            # Collect unique vertices used by this material's triangles
-            used_vertex_indices = {idx for tri in triangles for idx in tri}
-            subshape_vertices = [transformed_vertices[idx] for idx in used_vertex_indices]
-
-            # Map old vertex indices to new indices
-            vertex_map = {old_idx: new_idx for new_idx, old_idx in enumerate(used_vertex_indices)}
-            remapped_triangles = [[vertex_map[idx] for idx in tri] for tri in triangles]
-
-            n_bhk_packed_ni_tri_strips_shape.add_shape(remapped_triangles, normals, subshape_vertices,
-                                                       layer, n_material)
+        out_of_bounds = (material_indices < 0) | (material_indices >= len(n_hav_mat_list))
+        for mat_idx in np.unique(material_indices[out_of_bounds]):
+            NifLog.warn(f"Material index {mat_idx} out of bounds! "
+                        f"Using default material")
+        material_indices = np.where(out_of_bounds, 0, material_mapping[np.where(out_of_bounds, 0, material_indices)])
+
+        # Export geometry for each material group as one sub-shape
+        for mat_idx in np.unique(material_indices):
+            in_group = material_indices == mat_idx
+            # Collect the vertices used by this material's triangles, and remap the triangles to them
+            used_vertex_indices, remapped_triangles = np.unique(triangles[in_group], return_inverse=True)
+            remapped_triangles = remapped_triangles.reshape(-1, 3)
+
+            n_bhk_packed_ni_tri_strips_shape.add_shape(remapped_triangles.tolist(), normals[in_group].tolist(),
+                                                       welded_vertices[used_vertex_indices].tolist(),
+                                                       layer, n_hav_mat_list[mat_idx])
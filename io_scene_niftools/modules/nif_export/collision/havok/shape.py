@@ -39,11 +39,21 @@
 
 
 import mathutils
+import numpy as np
+
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.collision.bounds import bounds_store
 from io_scene_niftools.modules.nif_export.collision.havok import BhkCollisionCommon
-from io_scene_niftools.utils import math, consts
+from io_scene_niftools.modules.nif_export.collision.havok.hull import ConvexHull, shrink_hull
+from io_scene_niftools.utils import consts, math
 from io_scene_niftools.utils.logging import NifLog, NifError
-from io_scene_niftools.utils.singleton import NifData
+from io_scene_niftools.utils.singleton import NifData, NifOp
+
+# warn when simplifying a convex hull loses more than this fraction of its volume
+HULL_VOLUME_ERROR_WARNING = 0.05
+
+# radius of convex vertices shapes in Havok units
+CONVEX_RADIUS = 0.1
 
 
 class BhkShape(BhkCollisionCommon):
@@ -172,15 +182,16 @@ class BhkShape(BhkCollisionCommon):
         n_bhk_capsule_shape = block_store.create_block("bhkCapsuleShape", b_col_obj)
         n_bhk_capsule_shape.material.material = n_hav_mat
 
-        length = b_col_obj.dimensions.z - b_col_obj.dimensions.x
-        radius = b_col_obj.dimensions.x / 2
+        center, radius, length = bounds_store.get(b_col_obj).capsule
         matrix = math.get_object_bind(b_col_obj)
+        center = matrix @ mathutils.Vector(center)
+        scale = matrix.to_scale()
+        radius *= max(scale.x, scale.y)
 
-        length_half = length / 2
-        # Calculate the direction unit vector
-        v_dir = (mathutils.Vector((0, 0, 1)) @ matrix.to_3x3().inverted()).normalized()
-        first_point = matrix.translation + v_dir * length_half
-        second_point = matrix.translation - v_dir * length_half
+        # Calculate the direction vector, scaled to half the segment length
+        v_dir = matrix.to_3x3() @ mathutils.Vector((0, 0, length / 2))
+        first_point = center + v_dir
+        second_point = center - v_dir
 
         radius /= self.HAVOK_SCALE
         first_point /= self.HAVOK_SCALE
@@ -214,60 +225,44 @@ class BhkShape(BhkCollisionCommon):
 
         n_bhk_convex_vertices_shape = block_store.create_block("bhkConvexVerticesShape", b_col_obj)
         n_bhk_convex_vertices_shape.material.material = n_hav_mat
-        n_bhk_convex_vertices_shape.radius = 0.1  # This is hardcoded in the engine
+        n_bhk_convex_vertices_shape.radius = CONVEX_RADIUS  # This is hardcoded in the engine
 
         # Note: we apply transforms to convex shapes directly. No need for bhkConvexTransformShape or bhkRigidBodyT
-        b_mesh = b_col_obj.data
-        b_transform_mat = math.get_object_bind(b_col_obj)
-
-        b_rot_quat = b_transform_mat.decompose()[1]
-        b_scale_vec = b_transform_mat.decompose()[0]
-
-        # Calculate vertices, normals, and distances
-        vertex_list = [b_transform_mat @ vert.co for vert in b_mesh.vertices]
-        face_normals_list = [b_rot_quat @ b_face.normal for b_face in b_mesh.polygons]
-        face_distances_list = [
-            (b_transform_mat @ (-1 * b_mesh.vertices[b_mesh.polygons[b_face.index].vertices[0]].co)).dot(
-                b_rot_quat.to_matrix() @ b_face.normal) for b_face in b_mesh.polygons]
-
-        # Remove duplicates through dictionary
-        vertex_dict = {}
-        for i, vert in enumerate(vertex_list):
-            vertex_dict[(int(vert[0] * consts.VERTEX_RESOLUTION),
-                         int(vert[1] * consts.VERTEX_RESOLUTION),
-                         int(vert[2] * consts.VERTEX_RESOLUTION))] = i
-
-        fdict = {}
-        for i, (norm, dist) in enumerate(zip(face_normals_list, face_distances_list)):
-            fdict[(int(norm[0] * consts.NORMAL_RESOLUTION),
-                   int(norm[1] * consts.NORMAL_RESOLUTION),
-                   int(norm[2] * consts.NORMAL_RESOLUTION),
-                   int(dist * consts.VERTEX_RESOLUTION))] = i
-
-        # Sort vertices and normals
-        vertkeys = sorted(vertex_dict.keys())
-        fkeys = sorted(fdict.keys())
-        vertex_list = [vertex_list[vertex_dict[hsh]] for hsh in vertkeys]
-        face_normals_list = [face_normals_list[fdict[hsh]] for hsh in fkeys]
-        face_distances_list = [face_distances_list[fdict[hsh]] for hsh in fkeys]
-
-        # Vertices
+        b_transform_mat = np.array(math.get_object_bind(b_col_obj))
+        b_verts = bounds_store.get(b_col_obj).vertices @ b_transform_mat[:3, :3].T + b_transform_mat[:3, 3]
+        if NifOp.props.shrink_hull_by_radius:
+            b_verts, is_valid = shrink_hull(b_verts, CONVEX_RADIUS * self.HAVOK_SCALE)
+            if not is_valid:
+                NifLog.warn(f"The convex radius collapses the hull of {b_col_obj.name}, it is too thin to be shrunk")
+
+        # Always export a valid hull, simplified to the budget set on the operator
+        try:
+            hull = ConvexHull(b_verts, NifOp.props.max_hull_vertices, NifOp.props.max_hull_planes)
+        except NifError as e:
+            NifLog.warn(f"{b_col_obj.name} has no convex hull ({e}), its vertices and faces are exported as they are")
+            hull_vertices, planes = self.get_face_planes(b_col_obj, b_verts, b_transform_mat)
+        else:
+            NifLog.info(f"Convex hull of {b_col_obj.name}: {len(b_verts)} vertices reduced to {len(hull.vertices)} "
+                        f"vertices and {len(hull.planes)} planes, volume error {hull.volume_error:.2%}")
+            if hull.volume_error > HULL_VOLUME_ERROR_WARNING:
+                NifLog.warn(f"Simplifying the convex hull of {b_col_obj.name} lost {hull.volume_error:.2%} of its "
+                            f"volume. Increase the hull vertex and plane budget for a closer fit.")
+            hull_vertices, planes = hull.vertices, hull.planes
+
+        # Vertices, sorted for stable output; w component is 0
+        vertex_list = hull_vertices[np.lexsort(hull_vertices.T[::-1])] / self.HAVOK_SCALE
         n_bhk_convex_vertices_shape.num_vertices = len(vertex_list)
         n_bhk_convex_vertices_shape.reset_field("vertices")
-        for vhull, vert in zip(n_bhk_convex_vertices_shape.vertices, vertex_list):
-            vhull.x = vert[0] / self.HAVOK_SCALE
-            vhull.y = vert[1] / self.HAVOK_SCALE
-            vhull.z = vert[2] / self.HAVOK_SCALE
-            # w component is 0
-
-        # Normals
-        n_bhk_convex_vertices_shape.num_normals = len(face_normals_list)
+        for vhull, vert in zip(n_bhk_convex_vertices_shape.vertices, vertex_list.tolist()):
+            vhull.x, vhull.y, vhull.z = vert
+
+        # Normals, with the plane distance in w
+        plane_list = planes.copy()
+        plane_list[:, 3] /= self.HAVOK_SCALE
+        n_bhk_convex_vertices_shape.num_normals = len(plane_list)
         n_bhk_convex_vertices_shape.reset_field("normals")
-        for nhull, norm, dist in zip(n_bhk_convex_vertices_shape.normals, face_normals_list, face_distances_list):
-            nhull.x = norm[0]
-            nhull.y = norm[1]
-            nhull.z = norm[2]
-            nhull.w = dist / self.HAVOK_SCALE
+        for nhull, plane in zip(n_bhk_convex_vertices_shape.normals, plane_list.tolist()):
+            nhull.x, nhull.y, nhull.z, nhull.w = plane
 
         if self.is_oblivion:
             if (b_col_obj.parent and b_col_obj.parent.rigid_body and
@@ -281,6 +276,27 @@ class BhkShape(BhkCollisionCommon):
 
         return n_bhk_convex_vertices_shape
 
+    @staticmethod
+    def get_face_planes(b_col_obj, b_verts, b_transform_mat):
+        """
+        The distinct vertices and the distinct planes of the faces of a mesh without a convex hull,
+        such as a single triangle, in the same space as b_verts.
+        """
+        b_polygons = b_col_obj.data.polygons
+        normals = np.empty(len(b_polygons) * 3, dtype=np.float32)
+        centers = np.empty(len(b_polygons) * 3, dtype=np.float32)
+        b_polygons.foreach_get("normal", normals)
+        b_polygons.foreach_get("center", centers)
+        normals = normals.reshape(-1, 3) @ b_transform_mat[:3, :3].T
+        lengths = np.linalg.norm(normals, axis=1)
+        normals /= np.where(lengths > 0.0, lengths, 1.0)[:, None]
+        centers = centers.reshape(-1, 3) @ b_transform_mat[:3, :3].T + b_transform_mat[:3, 3]
+        planes = np.column_stack((normals, -np.einsum("ij,ij->i", normals, centers)))
+        keys = np.round(planes * (consts.NORMAL_RESOLUTION, consts.NORMAL_RESOLUTION, consts.NORMAL_RESOLUTION,
+                                  consts.VERTEX_RESOLUTION)).astype(np.int64)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        return ConvexHull.unique_points(np.asarray(b_verts, dtype=float).reshape(-1, 3)), planes[np.sort(first)]
+
     def __export_bhk_transform_shape(self, b_col_obj, n_hav_mat, radius=0.1):
         """
         Export and return a bhkTransformShape.
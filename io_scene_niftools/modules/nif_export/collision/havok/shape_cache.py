@@ -0,0 +1,166 @@
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import hashlib
+from collections import OrderedDict
+
+import bpy
+import numpy as np
+
+from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.utils.cache import DiskCache
+from io_scene_niftools.utils.instrumentation import instrumentation
+from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.singleton import NifData, NifOp
+from nifgen.formats.nif import classes as NifClasses
+
+DEFAULT_SHAPE_CACHE_ENTRIES = 512
+
+
+class CollisionShapeCache:
+    """
+    Keeps the shape tree exported for each collision object during this session, as it was before scale correction
+    and MOPP generation, so that unchanged collision objects are spliced into later exports as a copy instead of
+    being exported again. MOPP data of spliced shapes is then found in the MOPP cache.
+    Entries are kept in memory, as the blocks are copied into the NIF data of each export and re-exports of
+    the same objects happen within one Blender session.
+    """
+
+    def __init__(self, max_entries=DEFAULT_SHAPE_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_shape_objects(b_col_obj):
+        """The collision object itself, and the sub shape objects of a compound collision object."""
+        b_objs = [b_col_obj]
+        if b_col_obj.rigid_body.collision_shape == 'COMPOUND':
+            b_objs += [b_child for b_child in b_col_obj.children if b_child.type == 'MESH' and b_child.rigid_body]
+        return b_objs
+
+    @staticmethod
+    def hash_object(digest, b_obj):
+        """Add every input of the shape export of b_obj to digest: geometry, transforms, parent, rigid body and
+        materials."""
+        b_mesh = b_obj.data
+        b_verts = np.empty(len(b_mesh.vertices) * 3, dtype=np.float32)
+        b_mesh.vertices.foreach_get("co", b_verts)
+        digest.update(b_verts.tobytes())
+        for b_collection, attribute in ((b_mesh.loops, "vertex_index"), (b_mesh.polygons, "loop_total"),
+                                        (b_mesh.polygons, "material_index")):
+            values = np.empty(len(b_collection), dtype=np.int32)
+            b_collection.foreach_get(attribute, values)
+            digest.update(values.tobytes())
+        for b_matrix in (b_obj.matrix_world, b_obj.matrix_local, b_obj.matrix_basis, b_obj.matrix_parent_inverse):
+            digest.update(np.array(b_matrix).tobytes())
+        b_rigid_body = b_obj.rigid_body
+        # sub shapes of a compound parent are exported differently
+        b_parent = b_obj.parent
+        b_parent_shape = b_parent.rigid_body.collision_shape if b_parent and b_parent.rigid_body else None
+        digest.update(repr((b_obj.name, b_parent.name if b_parent else "", b_parent_shape, b_obj.parent_bone,
+                            b_rigid_body.collision_shape, b_rigid_body.use_margin,
+                            b_rigid_body.collision_margin,
+                            [b_mat.name if b_mat else "" for b_mat in b_mesh.materials])).encode("utf-8"))
+
+    def key_for(self, b_col_obj, n_hav_layer):
+        digest = hashlib.sha1()
+        for b_obj in self.get_shape_objects(b_col_obj):
+            self.hash_object(digest, b_obj)
+        return DiskCache.make_key(digest.hexdigest(), int(n_hav_layer), bpy.context.scene.niftools_scene.game,
+                                  NifData.data.version, NifData.data.user_version, NifData.data.bs_header.bs_version,
+                                  NifData.data.havok_scale, NifOp.props.max_hull_vertices,
+                                  NifOp.props.max_hull_planes, NifOp.props.shrink_hull_by_radius)
+
+    @classmethod
+    def copy_tree(cls, n_shape, copies):
+        """Copy n_shape and the shapes and data it references into the current NIF data.
+        Appends (original, copy) pairs to copies in depth first order and returns the copy."""
+        n_copy = type(n_shape)(NifData.data).deepcopy(n_shape)
+        copies.append((n_shape, n_copy))
+        if isinstance(n_shape, NifClasses.BhkListShape):
+            for i, n_sub_shape in enumerate(n_shape.sub_shapes):
+                n_copy.sub_shapes[i] = cls.copy_tree(n_sub_shape, copies)
+        elif isinstance(n_shape, (NifClasses.BhkMoppBvTreeShape, NifClasses.BhkTransformShape)):
+            n_copy.shape = cls.copy_tree(n_shape.shape, copies)
+        elif isinstance(n_shape, NifClasses.BhkPackedNiTriStripsShape) and n_shape.data:
+            n_copy.data = cls.copy_tree(n_shape.data, copies)
+        return n_copy
+
+    def load(self, key):
+        """Return a registered copy of the shape tree cached under key, or None if it is not cached."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            instrumentation.count("shape_cache_misses")
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        instrumentation.count("shape_cache_hits")
+
+        n_cached_shape, registrations = entry
+        copies = []
+        n_shape = self.copy_tree(n_cached_shape, copies)
+        # register the copies with the objects their originals were exported for
+        for index, b_obj_name in registrations:
+            block_store.register_block(copies[index][1], bpy.data.objects.get(b_obj_name) if b_obj_name else None)
+        NifLog.debug(f"Reused cached collision shape tree of {len(copies)} blocks")
+        return n_shape
+
+    def store(self, key, n_shape):
+        """Keep a copy of a freshly exported shape tree, with the objects its blocks were registered for."""
+        copies = []
+        n_cached_shape = self.copy_tree(n_shape, copies)
+        registrations = []
+        for index, (n_block, _) in enumerate(copies):
+            if n_block in block_store.block_to_obj:
+                b_obj = block_store.block_to_obj[n_block]
+                registrations.append((index, b_obj.name if b_obj else None))
+        self.entries[key] = (n_cached_shape, registrations)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+shape_cache = CollisionShapeCache()
@@ -45,6 +45,7 @@ from io_scene_niftools.modules.nif_export.animation.geometry import GeometryAnim
 from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.modules.nif_export.geometry import skin_partition
 from io_scene_niftools.modules.nif_export.geometry.data import GeometryData
+from io_scene_niftools.modules.nif_export.geometry.geometry_cache import geometry_cache
 from io_scene_niftools.modules.nif_export.geometry.skinned import SkinnedGeometry
 from io_scene_niftools.modules.nif_export.property.object import ObjectProperty
 from io_scene_niftools.modules.nif_export.property.texture.texture import NiTexturingProperty
@@ -93,6 +94,19 @@ class Geometry:
                         f"It will not be exported.")
             return
 
+        # Reuse the geometry blocks of a mesh object that did not change since an earlier export
+        cache_key = None
+        if NifOp.props.use_geometry_cache and geometry_cache.is_cacheable(b_obj):
+            cache_key = geometry_cache.key_for(b_obj, b_eval_mesh, n_parent_node)
+            n_ni_geometry_blocks = geometry_cache.load(cache_key)
+            if n_ni_geometry_blocks:
+                for n_ni_geometry in n_ni_geometry_blocks:
+                    if n_parent_node:
+                        n_parent_node.add_child(n_ni_geometry)
+                    # properties are not cached, so they are shared with the other objects as in a full export
+                    self.object_property_helper.export_object_properties(b_obj, n_ni_geometry)
+                return n_ni_geometry_blocks[0]
+
         b_materials = []
 
         # Get the mesh's materials if not a collision shape
@@ -124,6 +138,9 @@ class Geometry:
             # Shape keys are only present on the raw, unevaluated mesh
             self.geometry_animation_helper.export_geometry_animations(b_mesh, n_ni_geometry, vertex_map)
 
+        if cache_key:
+            geometry_cache.store(cache_key, n_ni_geometry_blocks)
+
         return n_ni_geometry_blocks[0]
 
     def export_ni_geometry(self, b_obj, b_mat, b_mat_index, n_parent_node):
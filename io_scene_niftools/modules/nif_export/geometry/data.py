@@ -41,6 +41,7 @@
 import numpy as np
 
 import bpy
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog, NifError
 from io_scene_niftools.utils.singleton import NifOp, NifData
 from nifgen.formats.nif import classes as NifClasses
@@ -48,6 +49,7 @@ from nifgen.formats.nif import classes as NifClasses
 
 class GeometryData:
 
+    @instrumentation.timed("geometry")
     def get_geom_data(self, b_mesh, color, normal, uv, tangent, b_mat_index):
         """
         Converts the blender information in b_mesh to a triangles, a dictionary with vertex information and a
@@ -242,6 +244,8 @@ class GeometryData:
             data_dict['TANGENT'] = loop_tangents[nif_to_matl]
             data_dict['BITANGENT'] = loop_bitangents[nif_to_matl]
 
+        instrumentation.count("vertices", len(nif_to_matl))
+        instrumentation.count("triangles", len(blend_triangles))
         return blend_triangles, tri_to_poly, data_dict, loop_to_vert[matl_to_loop[nif_to_matl]]
 
     def set_geom_data(self, n_geom, triangles, vertex_information, b_uv_layers):
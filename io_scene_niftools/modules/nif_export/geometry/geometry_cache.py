@@ -0,0 +1,338 @@
+"""Session cache of exported geometry blocks, keyed by a fingerprint of the mesh object they were built from."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import hashlib
+import io
+from collections import OrderedDict
+
+import bpy
+import numpy as np
+
+import nifgen.formats.nif as NifFormat
+from nifgen.formats.nif import classes as NifClasses
+
+from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.utils.cache import DiskCache
+from io_scene_niftools.utils.instrumentation import instrumentation
+from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.singleton import NifData, NifOp
+
+DEFAULT_GEOMETRY_CACHE_ENTRIES = 512
+
+# foreach_get key, components per element and dtype for each mesh attribute data type
+ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT16_2D': ("value", 2, np.int32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+# bpy.data collections of the data blocks that geometry blocks can be registered with
+ID_COLLECTIONS = {
+    'OBJECT': "objects",
+    'MESH': "meshes",
+    'MATERIAL': "materials",
+    'ACTION': "actions",
+    'IMAGE': "images",
+}
+
+# node properties that only affect how the node editor shows a node
+NODE_UI_PROPERTIES = {"location", "width", "height", "dimensions", "select", "hide", "show_options", "show_preview",
+                      "show_texture", "color", "use_custom_color"}
+
+
+class GeometryCache:
+    """
+    Keeps the geometry blocks exported for each mesh object during this session, serialized as they were before
+    scale correction, so that mesh objects whose fingerprint did not change are spliced into later exports by reading
+    the blocks back and copying them into the exported file, instead of exporting the object again.
+    Property blocks are left out and exported again for every splice, so they are shared between objects exactly as
+    in a full export.
+    """
+
+    def __init__(self, max_entries=DEFAULT_GEOMETRY_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def is_cacheable(b_obj):
+        """Skinned geometry links to bones outside its own blocks and EGM morphs go to a separate file, so both
+        are always exported again."""
+        if b_obj.parent and b_obj.parent.type == 'ARMATURE':
+            return False
+        b_key = b_obj.data.shape_keys
+        return not (b_key and len(b_key.key_blocks) > 1 and b_key.key_blocks[1].name.startswith("EGM"))
+
+    @staticmethod
+    def hash_array(digest, b_collection, attribute, size, dtype):
+        values = np.empty(len(b_collection) * size, dtype=dtype)
+        b_collection.foreach_get(attribute, values)
+        digest.update(values.tobytes())
+
+    @classmethod
+    def hash_mesh(cls, digest, b_mesh):
+        """Add the evaluated mesh to digest: topology, normals and every named attribute, such as positions, UV maps
+        and colors."""
+        cls.hash_array(digest, b_mesh.loops, "vertex_index", 1, np.int32)
+        cls.hash_array(digest, b_mesh.polygons, "loop_total", 1, np.int32)
+        cls.hash_array(digest, b_mesh.corner_normals, "vector", 3, np.float32)
+        for b_attribute in b_mesh.attributes:
+            layout = ATTRIBUTE_LAYOUTS.get(b_attribute.data_type)
+            # internal attributes such as selection and hiding do not end up in the nif
+            if not layout or b_attribute.name.startswith("."):
+                continue
+            digest.update(repr((b_attribute.name, b_attribute.domain, b_attribute.data_type)).encode("utf-8"))
+            cls.hash_array(digest, b_attribute.data, *layout)
+        digest.update(repr([b_mat.name if b_mat else "" for b_mat in b_mesh.materials]).encode("utf-8"))
+
+    @classmethod
+    def hash_properties(cls, digest, b_struct, ignored=()):
+        """Add the values of all properties of b_struct to digest, including those of nested property groups."""
+        values = []
+        for b_prop in b_struct.bl_rna.properties:
+            if b_prop.identifier == "rna_type" or b_prop.identifier in ignored:
+                continue
+            value = getattr(b_struct, b_prop.identifier, None)
+            if b_prop.type == 'POINTER':
+                if isinstance(value, bpy.types.PropertyGroup):
+                    cls.hash_properties(digest, value)
+                elif isinstance(value, bpy.types.ID):
+                    values.append((value.name, getattr(value, "filepath", None)))
+            elif b_prop.type == 'COLLECTION':
+                for b_item in value:
+                    if isinstance(b_item, bpy.types.PropertyGroup):
+                        cls.hash_properties(digest, b_item)
+            elif getattr(b_prop, "is_array", False):
+                values.append(np.asarray(value).tolist())
+            elif isinstance(value, set):
+                values.append(sorted(value))
+            else:
+                values.append(value)
+        digest.update(repr(values).encode("utf-8"))
+
+    @classmethod
+    def hash_material(cls, digest, b_mat):
+        """Add the nif settings, viewport settings and shader node tree of b_mat to digest."""
+        if not b_mat:
+            return
+        digest.update(repr((b_mat.name, tuple(b_mat.specular_color), b_mat.use_backface_culling)).encode("utf-8"))
+        for b_group in (b_mat.nif_shader, b_mat.nif_material, b_mat.nif_alpha):
+            cls.hash_properties(digest, b_group)
+        if not b_mat.node_tree:
+            return
+        for b_node in b_mat.node_tree.nodes:
+            cls.hash_properties(digest, b_node, NODE_UI_PROPERTIES)
+            digest.update(repr([(b_socket.identifier, np.asarray(b_socket.default_value).tolist())
+                                for b_socket in b_node.inputs
+                                if not b_socket.is_linked and hasattr(b_socket, "default_value")]).encode("utf-8"))
+        digest.update(repr([(b_link.from_node.name, b_link.from_socket.identifier,
+                             b_link.to_node.name, b_link.to_socket.identifier)
+                            for b_link in b_mat.node_tree.links]).encode("utf-8"))
+
+    @classmethod
+    def hash_action(cls, digest, b_action):
+        """Add the keyframes of every fcurve of b_action to digest."""
+        for b_fcurve in b_action.fcurves:
+            b_keyframes = b_fcurve.keyframe_points
+            digest.update(repr((b_fcurve.data_path, b_fcurve.array_index, b_fcurve.extrapolation,
+                                [b_keyframe.interpolation for b_keyframe in b_keyframes])).encode("utf-8"))
+            for attribute in ("co", "handle_left", "handle_right"):
+                cls.hash_array(digest, b_keyframes, attribute, 2, np.float32)
+
+    @classmethod
+    def hash_shape_keys(cls, digest, b_mesh):
+        """Add the shape keys of the unevaluated mesh and the action animating them to digest."""
+        b_key = b_mesh.shape_keys
+        if not b_key:
+            return
+        for b_key_block in b_key.key_blocks:
+            digest.update(repr((b_key_block.name, b_key_block.value, b_key_block.relative_key.name)).encode("utf-8"))
+            cls.hash_array(digest, b_key_block.data, "co", 3, np.float32)
+        if b_key.animation_data and b_key.animation_data.action:
+            cls.hash_action(digest, b_key.animation_data.action)
+
+    @classmethod
+    def hash_object(cls, digest, b_obj):
+        """Add the object level inputs of the geometry export to digest: transforms, parenting, material slots,
+        modifiers and nif settings."""
+        for b_matrix in (b_obj.matrix_world, b_obj.matrix_local, b_obj.matrix_basis, b_obj.matrix_parent_inverse):
+            digest.update(np.array(b_matrix).tobytes())
+        digest.update(repr((b_obj.name, b_obj.parent.name if b_obj.parent else "", b_obj.parent_type,
+                            b_obj.parent_bone, b_obj.active_material.name if b_obj.active_material else "",
+                            [(b_mod.type, b_mod.name, b_mod.show_viewport, b_mod.show_render)
+                             for b_mod in b_obj.modifiers])).encode("utf-8"))
+        cls.hash_properties(digest, b_obj.nif_object)
+
+    def key_for(self, b_obj, b_eval_mesh, n_parent_node):
+        """The fingerprint of b_obj: every input of its geometry export, plus the export settings that affect it."""
+        digest = hashlib.sha1()
+        self.hash_mesh(digest, b_eval_mesh)
+        self.hash_object(digest, b_obj)
+        self.hash_shape_keys(digest, b_obj.data)
+        for b_mat in dict.fromkeys([*b_eval_mesh.materials, b_obj.active_material]):
+            self.hash_material(digest, b_mat)
+        b_scene = bpy.context.scene
+        return DiskCache.make_key(digest.hexdigest(), type(n_parent_node).__name__, b_scene.niftools_scene.game,
+                                  NifData.data.version, NifData.data.user_version,
+                                  b_scene.niftools_scene.user_version_2, NifData.data.bs_header.bs_version,
+                                  b_scene.render.fps, b_scene.render.fps_base, NifOp.props.animation,
+                                  NifOp.props.stripify, NifOp.props.force_dds, NifOp.props.sep_tangent_space,
+                                  NifOp.props.epsilon)
+
+    @staticmethod
+    def get_tree(n_blocks, skipped=()):
+        """All blocks referenced from n_blocks, parents first, in an order that only depends on the tree's shape.
+        Blocks of the skipped types are left out, with the blocks only they reference."""
+        n_tree = {}
+        stack = list(reversed(n_blocks))
+        while stack:
+            n_block = stack.pop()
+            if n_block is None or n_block in n_tree or isinstance(n_block, skipped):
+                continue
+            n_tree[n_block] = len(n_tree)
+            stack.extend(reversed(list(n_block.get_refs())))
+        return list(n_tree)
+
+    @staticmethod
+    def new_file():
+        """An empty NIF file of the version being exported, to serialize cached blocks with."""
+        n_data = NifFormat.NifFile.from_version(NifData.data.version, NifData.data.user_version,
+                                                bpy.context.scene.niftools_scene.user_version_2)
+        n_data.bs_header.bs_version = NifData.data.bs_header.bs_version
+        return n_data
+
+    @staticmethod
+    def get_id_reference(b_id):
+        if isinstance(b_id, bpy.types.ID) and b_id.id_type in ID_COLLECTIONS:
+            return b_id.id_type, b_id.name
+        return None
+
+    @staticmethod
+    def remove_properties(n_geometry):
+        """Drop the references of a spliced geometry block to the property blocks of the cached export."""
+        if hasattr(n_geometry, "num_properties"):
+            n_geometry.num_properties = 0
+            n_geometry.properties = n_geometry.properties[:0]
+        for field in ("shader_property", "alpha_property"):
+            if hasattr(n_geometry, field):
+                setattr(n_geometry, field, None)
+
+    @staticmethod
+    def resolve_id_reference(b_id_reference):
+        if b_id_reference is None:
+            return None
+        id_type, name = b_id_reference
+        return getattr(bpy.data, ID_COLLECTIONS[id_type]).get(name)
+
+    @staticmethod
+    def copy_tree(n_tree):
+        """Copy the blocks of n_tree into the NIF data being exported, with the references and links between them
+        pointing at the copies. Returns the copies in the same order."""
+        n_copies = [type(n_block)(NifData.data).deepcopy(n_block) for n_block in n_tree]
+        # replacing only descends into the blocks that are referenced at the time, so every copy is updated directly
+        for n_block, n_copy in zip(n_tree, n_copies):
+            for n_other_copy in n_copies:
+                n_other_copy.replace_global_node(n_block, n_copy)
+        return n_copies
+
+    def load(self, key):
+        """Return registered copies of the geometry blocks cached under key, or None if they are not cached.
+        The copies have no properties, those are exported again by the caller."""
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            instrumentation.count("geometry_cache_misses")
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        instrumentation.count("geometry_cache_hits")
+
+        n_serialized, registrations = entry
+        n_read_blocks = NifFormat.NifFile.from_stream(io.BytesIO(n_serialized)).roots
+        n_tree = self.get_tree(n_read_blocks, NifClasses.NiProperty)
+        # the blocks that were read back belong to their own file, so they are copied into the exported one
+        n_copies = self.copy_tree(n_tree)
+        # register the copies with the data blocks their originals were exported for
+        for index, b_id_reference in registrations:
+            block_store.register_block(n_copies[index], self.resolve_id_reference(b_id_reference))
+        NifLog.debug(f"Reused cached geometry of {len(n_tree)} blocks")
+        n_tree_copies = dict(zip(n_tree, n_copies))
+        n_blocks = [n_tree_copies[n_block] for n_block in n_read_blocks]
+        for n_block in n_blocks:
+            self.remove_properties(n_block)
+        return n_blocks
+
+    def store(self, key, n_blocks):
+        """Serialize freshly exported geometry blocks, with the data blocks they were registered for."""
+        n_tree = self.get_tree(n_blocks, NifClasses.NiProperty)
+        n_members = set(n_tree)
+        if any(n_link is not None and n_link not in n_members for n_block in n_tree for n_link in n_block.get_links()):
+            NifLog.debug(f"Not caching geometry {n_blocks[0].name}, it links to blocks outside of it")
+            return
+        registrations = []
+        for index, n_block in enumerate(n_tree):
+            if n_block in block_store.block_to_obj:
+                registrations.append((index, self.get_id_reference(block_store.block_to_obj[n_block])))
+
+        n_data = self.new_file()
+        n_data.roots = list(n_blocks)
+        stream = io.BytesIO()
+        n_data.write(stream)
+        self.entries[key] = (stream.getvalue(), registrations)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+geometry_cache = GeometryCache()
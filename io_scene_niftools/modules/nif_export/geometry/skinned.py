@@ -43,6 +43,7 @@ import numpy as np
 import bpy
 from io_scene_niftools.modules.nif_export.block_registry import block_store
 from io_scene_niftools.utils import math
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog, NifError
 from io_scene_niftools.utils.singleton import NifOp, NifData
 from nifgen.formats.nif import classes as NifClasses
@@ -53,6 +54,7 @@ class SkinnedGeometry:
     def __init__(self):
         self.target_game = bpy.context.scene.niftools_scene.game
 
+    @instrumentation.timed("skin")
     def export_skinned_geometry(self, n_ni_geometry, n_root_node, b_obj, b_eval_mesh, triangles, vertex_map,
                                 t_nif_to_blend, b_face_groups, face_group_names):
 
@@ -46,7 +46,7 @@ from io_scene_niftools.modules.nif_export.geometry import Geometry
 from io_scene_niftools.modules.nif_export.object.armature import Armature
 from io_scene_niftools.modules.nif_export.property.object import ObjectProperty
 from io_scene_niftools.utils import math
-from io_scene_niftools.utils.logging import NifLog
+from io_scene_niftools.utils.logging import NifLog, error_context
 
 DICT_NAMES = {}  # Dictionary to map Blender object names to NIF blocks
 
@@ -111,6 +111,10 @@ class Object:
         if not b_obj or not b_obj in self.b_exportable_objects or b_obj.particle_systems:
             return None
 
+        with error_context(b_obj=b_obj):
+            return self.__export_object(b_obj, n_parent_node, n_node_type)
+
+    def __export_object(self, b_obj, n_parent_node, n_node_type):
         if b_obj.type == 'MESH':
             # Export a geometry block
 
@@ -0,0 +1,223 @@
+"""Per-export cache of compiled material shader node tree descriptions."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import bpy
+from io_scene_niftools.utils.consts import TEX_SLOTS
+from io_scene_niftools.utils.logging import NifLog, NifError
+
+
+# Maps shader node input sockets to image texture nodes and NIF texture slots
+TEX_SLOT_MAP = {
+    TEX_SLOTS.BASE: {"shader_type": bpy.types.ShaderNodeBsdfPrincipled,
+                     "socket_index": 0, "texture_type": bpy.types.ShaderNodeTexImage},  # Base Color
+    TEX_SLOTS.NORMAL: {"shader_type": bpy.types.ShaderNodeBsdfPrincipled,
+                       "socket_index": 5, "texture_type": bpy.types.ShaderNodeTexImage},  # Normal
+    TEX_SLOTS.GLOW: {"shader_type": bpy.types.ShaderNodeBsdfPrincipled,
+                     "socket_index": 27, "texture_type": bpy.types.ShaderNodeTexImage},  # Emissive Color
+    TEX_SLOTS.DETAIL: {"shader_type": bpy.types.ShaderNodeOutputMaterial,
+                       "socket_index": 2, "texture_type": bpy.types.ShaderNodeTexImage},  # Displacement
+    TEX_SLOTS.ENV_MAP: {"shader_type": bpy.types.ShaderNodeBsdfAnisotropic,
+                        "socket_index": 0, "texture_type": bpy.types.ShaderNodeTexEnvironment},  # Color
+    TEX_SLOTS.ENV_MASK: {"shader_type": bpy.types.ShaderNodeBsdfAnisotropic,
+                         "socket_index": 1, "texture_type": bpy.types.ShaderNodeTexImage}  # Roughness
+}
+
+UV_NODE_TYPES = (bpy.types.ShaderNodeUVMap, bpy.types.ShaderNodeTexCoord)
+
+
+class MaterialAnalysis:
+    """
+    Compiled description of a material's shader node tree.
+    Texture slots, UV map indices, the global UV transform and alpha mode
+    are resolved with a single traversal of the node tree and then shared by every geometry using the material.
+    """
+
+    def __init__(self, b_mat):
+        self.b_mat = b_mat
+        self.slots = {slot: None for slot in TEX_SLOT_MAP.keys()}
+        self.uv_maps = {}
+        self.uv_transform = (None, None, None, None, None, None)
+        self.principled_bsdf = None
+        self.use_alpha = False
+
+        # Memoized depth-first search results, keyed by (socket pointer, node types)
+        self._upstream = {}
+
+        if b_mat is None:
+            return
+
+        self.use_alpha = b_mat.nif_material.use_alpha
+
+        if b_mat.node_tree is None:
+            return
+
+        b_nodes = b_mat.node_tree.nodes
+        self.principled_bsdf = next((node for node in b_nodes if isinstance(node, bpy.types.ShaderNodeBsdfPrincipled)), None)
+
+        self.__determine_texture_slots(b_nodes)
+        for slot_name, b_texture_node in self.slots.items():
+            if b_texture_node:
+                self.uv_maps[slot_name] = self.__determine_uv_index(b_texture_node)
+        self.uv_transform = self.__determine_uv_transform(b_nodes)
+
+    def find_input_node_of_type(self, input_socket, node_types):
+        """
+        Search back in the node tree for a node of the given type(s), depth-first.
+        Results are memoized per socket so that shared branches of the tree are only walked once.
+        """
+        return self.__find_input_node_of_type(input_socket, node_types, set())
+
+    def __find_input_node_of_type(self, input_socket, node_types, visited):
+        key = (input_socket.as_pointer(), node_types)
+        if key in self._upstream:
+            return self._upstream[key]
+
+        result = None
+        links = input_socket.links
+        if links:
+            node = links[0].from_node
+            if isinstance(node, node_types):
+                # the input node is of the required type
+                result = node
+            elif node.as_pointer() not in visited:
+                visited.add(node.as_pointer())
+                # check every input if somewhere up that tree is a node of the required type
+                for node_input in node.inputs:
+                    result = self.__find_input_node_of_type(node_input, node_types, visited)
+                    if result:
+                        break
+
+        self._upstream[key] = result
+        return result
+
+    def __determine_texture_slots(self, b_nodes):
+        """Determine texture slots based on shader node connections."""
+        for shader_node in b_nodes:
+            if not isinstance(shader_node, bpy.types.ShaderNode):
+                continue
+            for slot_name, mapping in TEX_SLOT_MAP.items():
+                if isinstance(shader_node, mapping["shader_type"]):
+                    input_socket = shader_node.inputs[mapping["socket_index"]]
+                    if input_socket.is_linked:
+                        texture_node = self.find_input_node_of_type(input_socket, mapping["texture_type"])
+                        if texture_node:
+                            self.__assign_texture_to_slot(slot_name, texture_node)
+
+    def __assign_texture_to_slot(self, slot_name, texture_node):
+        """Assign a texture node to a slot, ensuring no duplicates."""
+        if self.slots[slot_name]:
+            raise NifError(f"Multiple textures assigned to slot '{slot_name}' in material '{self.b_mat.name}'.")
+        self.slots[slot_name] = texture_node
+        NifLog.info(f"Assigned texture node '{texture_node.name}' to slot '{slot_name}'")
+
+    def __determine_uv_index(self, b_texture_node):
+        """
+        Return the UV layer index used by a texture node, "REFLECT" for texture coordinate nodes,
+        or None if its vector input is not supported.
+        """
+        uv_node = self.find_input_node_of_type(b_texture_node.inputs[0], UV_NODE_TYPES)
+        if uv_node is None:
+            if not b_texture_node.inputs[0].links:
+                # nothing is plugged in, so it will use the first UV map
+                return 0
+            return None
+        if isinstance(uv_node, bpy.types.ShaderNodeUVMap):
+            uv_name = uv_node.uv_map
+            try:
+                # ignore the "UV" prefix
+                return int(uv_name[2:])
+            except ValueError:
+                return 0
+        return "REFLECT"
+
+    def __determine_uv_transform(self, b_nodes):
+        """Get the UV scale, offset and clamping from the UV combine node, if present."""
+        x_scale = y_scale = x_offset = y_offset = clamp_x = clamp_y = None
+        # first check if there are any of the preset name - much more time efficient
+        combine_node = b_nodes.get("Combine UV0")
+        if combine_node is None:
+            NifLog.debug(f"Did not find node with 'Combine UV0' name in material '{self.b_mat.name}'.")
+        elif not isinstance(combine_node, bpy.types.ShaderNodeCombineXYZ):
+            combine_node = None
+            NifLog.warn(f"Found node with name 'Combine UV0', but it was of the wrong type.")
+
+        if combine_node is None:
+            # did not find a (correct) combine node, search through the first existing texture node vector input
+            slot_name, slot_node = next(((name, node) for name, node in self.slots.items() if node), (None, None))
+            if slot_node is not None:
+                combine_node = self.find_input_node_of_type(slot_node.inputs[0], bpy.types.ShaderNodeCombineXYZ)
+                NifLog.debug(f"Searching through vector input of {slot_name} texture gave {combine_node}")
+
+        if combine_node:
+            x_link = combine_node.inputs[0].links
+            if x_link:
+                x_node = x_link[0].from_node
+                x_scale = x_node.inputs[1].default_value
+                x_offset = x_node.inputs[2].default_value
+                clamp_x = x_node.use_clamp
+            y_link = combine_node.inputs[1].links
+            if y_link:
+                y_node = y_link[0].from_node
+                y_scale = y_node.inputs[1].default_value
+                y_offset = y_node.inputs[2].default_value
+                clamp_y = y_node.use_clamp
+        return x_scale, y_scale, x_offset, y_offset, clamp_x, clamp_y
+
+
+class MaterialAnalysisRegistry:
+    """Stores one :class:`MaterialAnalysis` per Blender material for the duration of an export."""
+
+    def __init__(self):
+        self._analyses = {}
+
+    def get(self, b_mat):
+        """Return the analysis of b_mat, building it on first use."""
+        key = b_mat.as_pointer() if b_mat is not None else None
+        analysis = self._analyses.get(key)
+        if analysis is None:
+            analysis = MaterialAnalysis(b_mat)
+            self._analyses[key] = analysis
+        return analysis
+
+    def clear(self):
+        """Forget all analyses; called at the start of every export."""
+        self._analyses = {}
+
+
+material_store = MaterialAnalysisRegistry()
@@ -43,6 +43,7 @@ import mathutils
 
 # from io_scene_niftools.modules.nif_export.animation.material import MaterialAnimation
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.property.analysis import material_store
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.singleton import NifData
 from nifgen.formats.nif import classes as NifClasses
@@ -94,7 +95,7 @@ class MaterialProperty:
 
         n_ni_material_property.flags = b_mat.nif_material.material_flags
 
-        b_shader_node = next((node for node in b_mat.node_tree.nodes if isinstance(node, bpy.types.ShaderNodeBsdfPrincipled)), None)
+        b_shader_node = material_store.get(b_mat).principled_bsdf
 
         if b_shader_node is not None:
             b_ambient_value = b_shader_node.inputs[26].default_value
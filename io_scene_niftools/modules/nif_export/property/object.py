@@ -42,9 +42,11 @@ from math import pi
 
 import bpy
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.property.analysis import material_store
 from io_scene_niftools.modules.nif_export.property.material import MaterialProperty
 from io_scene_niftools.modules.nif_export.property.texture import TextureProperty
 from io_scene_niftools.utils.consts import USED_EXTRA_SHADER_TEXTURES
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.singleton import NifOp
 from nifgen.formats.nif import classes as NifClasses
@@ -60,6 +62,7 @@ class ObjectProperty:
         self.material_property_helper = MaterialProperty()
         self.texture_property_helper = TextureProperty()
 
+    @instrumentation.timed("materials")
     def export_object_properties(self, b_obj, n_node):
         """
         This is the main property processor that attaches
@@ -138,7 +141,7 @@ class ObjectProperty:
         """Return existing alpha property with given flags, or create new one
         if an alpha property with required flags is not found."""
         # don't export an alpha property if mat is opaque in blender
-        if b_mat.nif_material.use_alpha:
+        if material_store.get(b_mat).use_alpha:
             n_ni_alpha_property = block_store.create_block("NiAlphaProperty")
             n_node.add_property(n_ni_alpha_property)
 
@@ -44,9 +44,11 @@ import io_scene_niftools.utils.logging
 import io_scene_niftools.utils.math
 
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.property.analysis import material_store
 from io_scene_niftools.modules.nif_export.property.texture.bethesda import BSShaderTextureSet
 from io_scene_niftools.modules.nif_export.property.texture.texture import NiTexturingProperty
 
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog, NifError
 from io_scene_niftools.utils.math import color_blender_to_nif
 
@@ -60,6 +62,7 @@ class BSShaderProperty:
         self.bs_shader_texture_set_helper = BSShaderTextureSet.get()
         self.ni_texturing_property_helper = NiTexturingProperty.get()
 
+    @instrumentation.timed("materials")
     def export_bs_shader_property(self, n_ni_geometry, b_mat=None):
         """Main function for handling Bethesda shader property export."""
 
@@ -124,7 +127,7 @@ class BSShaderProperty:
 
         self.bs_shader_texture_set_helper.export_bs_lighting_shader_property_textures(n_bs_lighting_shader_property)
 
-        b_principled_bsdf = next((node for node in b_mat.node_tree.nodes if isinstance(node, bpy.types.ShaderNodeBsdfPrincipled)), None)
+        b_principled_bsdf = material_store.get(b_mat).principled_bsdf
 
         if b_principled_bsdf is None:
             raise NifError(f"{b_mat.name} must have a Principled BSDF to export a BSLightingShaderProperty!")
@@ -43,7 +43,8 @@ import os.path
 import bpy
 import io_scene_niftools
 from io_scene_niftools.modules.nif_export.block_registry import block_store
-from io_scene_niftools.utils.consts import TEX_SLOTS, USED_EXTRA_SHADER_TEXTURES
+from io_scene_niftools.modules.nif_export.property.analysis import TEX_SLOT_MAP, material_store
+from io_scene_niftools.utils.consts import USED_EXTRA_SHADER_TEXTURES
 from io_scene_niftools.utils.logging import NifLog, NifError
 from io_scene_niftools.utils.singleton import NifData
 from io_scene_niftools.utils.singleton import NifOp
@@ -75,24 +76,13 @@ def get_input_node_of_type(input_socket, node_types):
 
 class TextureCommon:
     # Maps shader node input sockets to image texture nodes and NIF texture slots
-    TEX_SLOT_MAP = {
-        TEX_SLOTS.BASE: {"shader_type": bpy.types.ShaderNodeBsdfPrincipled,
-                         "socket_index": 0, "texture_type": bpy.types.ShaderNodeTexImage},  # Base Color
-        TEX_SLOTS.NORMAL: {"shader_type": bpy.types.ShaderNodeBsdfPrincipled,
-                           "socket_index": 5, "texture_type": bpy.types.ShaderNodeTexImage},  # Normal
-        TEX_SLOTS.GLOW: {"shader_type": bpy.types.ShaderNodeBsdfPrincipled,
-                         "socket_index": 27, "texture_type": bpy.types.ShaderNodeTexImage},  # Emissive Color
-        TEX_SLOTS.DETAIL: {"shader_type": bpy.types.ShaderNodeOutputMaterial,
-                           "socket_index": 2, "texture_type": bpy.types.ShaderNodeTexImage},  # Displacement
-        TEX_SLOTS.ENV_MAP: {"shader_type": bpy.types.ShaderNodeBsdfAnisotropic,
-                            "socket_index": 0, "texture_type": bpy.types.ShaderNodeTexEnvironment},  # Color
-        TEX_SLOTS.ENV_MASK: {"shader_type": bpy.types.ShaderNodeBsdfAnisotropic,
-                             "socket_index": 1, "texture_type": bpy.types.ShaderNodeTexImage}  # Roughness
-    }
+    TEX_SLOT_MAP = TEX_SLOT_MAP
 
     def __init__(self):
         self.dict_mesh_uvlayers = []
         self.slots = {}
+        self.b_mat = None
+        self.material_analysis = None
         self._reset_fields()
 
     def _reset_fields(self):
@@ -100,29 +90,10 @@ class TextureCommon:
         self.slots = {slot: None for slot in self.TEX_SLOT_MAP.keys()}
 
     def determine_texture_types(self, b_mat):
-        """Determine texture slots based on shader node connections."""
-        self._reset_fields()
-
-        shader_nodes = self._get_shader_nodes(b_mat)
-        for shader_node in shader_nodes:
-            for slot_name, mapping in self.TEX_SLOT_MAP.items():
-                if isinstance(shader_node, mapping["shader_type"]):
-                    input_socket = shader_node.inputs[mapping["socket_index"]]
-                    if input_socket.is_linked:
-                        texture_node = get_input_node_of_type(input_socket, mapping["texture_type"])
-                        if texture_node:
-                            self._assign_texture_to_slot(slot_name, texture_node, b_mat.name)
-
-    def _get_shader_nodes(self, b_mat):
-        """Retrieve all shader nodes in the material."""
-        return [node for node in b_mat.node_tree.nodes if isinstance(node, bpy.types.ShaderNode)]
-
-    def _assign_texture_to_slot(self, slot_name, texture_node, mat_name):
-        """Assign a texture node to a slot, ensuring no duplicates."""
-        if self.slots[slot_name]:
-            raise NifError(f"Multiple textures assigned to slot '{slot_name}' in material '{mat_name}'.")
-        self.slots[slot_name] = texture_node
-        NifLog.info(f"Assigned texture node '{texture_node.name}' to slot '{slot_name}'")
+        """Determine texture slots based on shader node connections, reusing the material's cached analysis."""
+        self.b_mat = b_mat
+        self.material_analysis = material_store.get(b_mat)
+        self.slots = dict(self.material_analysis.slots)
 
     @staticmethod
     def export_source_texture(n_texture=None, filename=None):
@@ -245,64 +216,20 @@ class TextureCommon:
         return NifClasses.ApplyMode.APPLY_MODULATE
 
     def get_uv_node(self, b_texture_node):
-        uv_node = get_input_node_of_type(b_texture_node.inputs[0],
-                                              (bpy.types.ShaderNodeUVMap, bpy.types.ShaderNodeTexCoord))
-        if uv_node is None:
-            links = b_texture_node.inputs[0].links
-            if not links:
-                # nothing is plugged in, so it will use the first UV map
-                return 0
-        if isinstance(uv_node, bpy.types.ShaderNodeUVMap):
-            uv_name = uv_node.uv_map
-            try:
-                # ignore the "UV" prefix
-                return int(uv_name[2:])
-            except:
-                return 0
-        elif isinstance(uv_node, bpy.types.ShaderNodeTexCoord):
-            return "REFLECT"
+        for slot_name, slot_node in self.slots.items():
+            if slot_node == b_texture_node:
+                uv_index = self.material_analysis.uv_maps[slot_name]
+                break
         else:
+            uv_index = None
+        if uv_index is None:
             raise NifError(f"Unsupported vector input for {b_texture_node.name}.'.\n"
                            f"Expected 'UV Map' or 'Texture Coordinate' nodes")
+        return uv_index
 
     def get_global_uv_transform_clip(self):
-        # get the values from the nodes, find the nodes by name, or search back in the node tree
-        x_scale = y_scale = x_offset = y_offset = clamp_x = clamp_y = None
-        # first check if there are any of the preset name - much more time efficient
-        try:
-            combine_node = self.b_mat.node_tree.nodes["Combine UV0"]
-            if not isinstance(combine_node, bpy.types.ShaderNodeCombineXYZ):
-                combine_node = None
-                NifLog.warn(f"Found node with name 'Combine UV0', but it was of the wrong type.")
-        except:
-            # if there is a combine node, it does not have the standard name
-            combine_node = None
-            NifLog.warn(f"Did not find node with 'Combine UV0' name.")
-
-        if combine_node is None:
-            # did not find a (correct) combine node, search through the first existing texture node vector input
-            b_texture_node = None
-            for slot_name, slot_node in self.slots.items():
-                if slot_node is not None:
-                    break
-            if slot_node is not None:
-                combine_node = get_input_node_of_type(slot_node.inputs[0], bpy.types.ShaderNodeCombineXYZ)
-                NifLog.warn(f"Searching through vector input of {slot_name} texture gave {combine_node}")
-
-        if combine_node:
-            x_link = combine_node.inputs[0].links
-            if x_link:
-                x_node = x_link[0].from_node
-                x_scale = x_node.inputs[1].default_value
-                x_offset = x_node.inputs[2].default_value
-                clamp_x = x_node.use_clamp
-            y_link = combine_node.inputs[1].links
-            if y_link:
-                y_node = y_link[0].from_node
-                y_scale = y_node.inputs[1].default_value
-                y_offset = y_node.inputs[2].default_value
-                clamp_y = y_node.use_clamp
-        return x_scale, y_scale, x_offset, y_offset, clamp_x, clamp_y
+        # the values are read from the nodes once per material, see MaterialAnalysis
+        return self.material_analysis.uv_transform
 
     def get_uv_layers(self, b_mat):
         used_uvlayers = set()
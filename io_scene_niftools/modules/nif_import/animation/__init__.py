@@ -38,6 +38,7 @@
 # ***** END LICENSE BLOCK *****
 import bpy
 from io_scene_niftools.utils.consts import QUAT, EULER, LOC, SCALE
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from nifgen.formats.nif import classes as NifClasses
 
@@ -181,6 +182,7 @@ class Animation:
             for fcurve in fcurves:
                 fcurve.extrapolation = 'CONSTANT'
 
+    @instrumentation.timed("animation")
     def add_keys(self, b_obj, b_action, key_type, key_range, flags, times, keys, interp, bone_name=None, key_name=None):
         """
         Create needed fcurves and add a list of keys to an action.
@@ -206,6 +208,8 @@ class Animation:
                 fcurve.keyframe_points.foreach_set("interpolation", interpolations)
                 # update
                 fcurve.update()
+                instrumentation.count("keys", len(fcu_keys))
+                instrumentation.count("rna_bulk_calls", 3)
                 # Update max_key_time
                 self.max_key_time = max(self.max_key_time, max(times))
         except RuntimeError:
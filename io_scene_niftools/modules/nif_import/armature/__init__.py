@@ -45,6 +45,7 @@ from io_scene_niftools.modules.nif_import.animation.transform import TransformAn
 from io_scene_niftools.modules.nif_import.object import Object
 from io_scene_niftools.modules.nif_import.object.block_registry import block_store, get_bone_name_for_blender
 from io_scene_niftools.utils import math
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.singleton import NifOp
 from nifgen.formats.nif import classes as NifClasses
@@ -191,6 +192,7 @@ class Armature:
             # move down the hierarchy
             self.fix_pose(n_child_node, n_root)
 
+    @instrumentation.timed("armature")
     def import_armature(self, n_armature):
         """Scans an armature hierarchy, and returns a whole armature.
         This is done outside the normal node tree scan to allow for positioning
@@ -45,6 +45,10 @@ import mathutils
 # This is used to set up the rigid body constraints
 DICT_HAVOK_OBJECTS = {}
 
+# Dictionary mapping bhkRigidBody objects to the local matrix of their Blender object before it is parented
+# This is used to find the rigid body frame that the constraint pivots are given in
+DICT_HAVOK_MATRICES = {}
+
 
 def get_material(mat_name):
     """Returns material of mat_name, create new one if required"""
@@ -67,6 +71,16 @@ class Collision:
         rot.translation = (n_center.x, n_center.y, n_center.z)
         return rot
 
+    @staticmethod
+    def rigid_body_t_to_matrix(n_bhk_rigid_body_t, havok_scale):
+        """Helper for bhkRigidBodyT to transform its rotation and translation into a local matrix"""
+        body_info = n_bhk_rigid_body_t.rigid_body_info
+        b_rot = body_info.rotation
+        transform = mathutils.Quaternion([b_rot.w, b_rot.x, b_rot.y, b_rot.z]).to_matrix().to_4x4()
+        b_trans = body_info.translation
+        transform.translation = mathutils.Vector((b_trans.x, b_trans.y, b_trans.z)) * havok_scale
+        return transform
+
     @staticmethod
     def set_b_collider(b_obj, radius, n_obj=None, bounds_type='BOX', display_type=None):
         """Helper function to set up b_obj so it becomes recognizable as a collision object."""
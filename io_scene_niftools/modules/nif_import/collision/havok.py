@@ -42,6 +42,7 @@ from functools import singledispatch
 
 import bpy
 import mathutils
+import numpy as np
 from io_scene_niftools.modules.nif_import import collision
 from io_scene_niftools.modules.nif_import.collision import Collision
 from io_scene_niftools.modules.nif_import.object import Object
@@ -66,6 +67,7 @@ class BhkCollision(Collision):
         # Dictionary mapping bhkRigidBody objects to objects imported in Blender;
         # We use this dictionary to set the physics constraints (ragdoll, etc.)
         collision.DICT_HAVOK_OBJECTS = {}
+        collision.DICT_HAVOK_MATRICES = {}
 
         self.HAVOK_SCALE = NifData.data.havok_scale
 
@@ -111,17 +113,9 @@ class BhkCollision(Collision):
 
         # Import collision shape as Blender object
         b_col_obj = self.import_bhk_shape(n_bhk_rigid_body_t.shape)
-        body_info = n_bhk_rigid_body_t.rigid_body_info
-
-        # Set rotation
-        b_rot = body_info.rotation
 
         # Get transformation matrix
-        transform = mathutils.Quaternion([b_rot.w, b_rot.x, b_rot.y, b_rot.z]).to_matrix().to_4x4()
-
-        # Set translation
-        b_trans = body_info.translation
-        transform.translation = mathutils.Vector((b_trans.x, b_trans.y, b_trans.z)) * self.HAVOK_SCALE
+        transform = self.rigid_body_t_to_matrix(n_bhk_rigid_body_t, self.HAVOK_SCALE)
 
         # Apply transform
         b_col_obj.matrix_local = b_col_obj.matrix_local @ transform
@@ -196,6 +190,7 @@ class BhkCollision(Collision):
         # Import constraints
         # This is done once all objects are imported for now, store all imported havok shapes with object lists
         collision.DICT_HAVOK_OBJECTS[n_bhk_rigid_body] = b_col_obj
+        collision.DICT_HAVOK_MATRICES[n_bhk_rigid_body] = b_col_obj.matrix_local.copy()
 
     def import_bhk_shape(self, n_bhk_shape):
         NifLog.debug(f"Importing {n_bhk_shape.__class__.__name__}")
@@ -344,61 +339,50 @@ class BhkCollision(Collision):
 
         NifLog.debug(f"Importing {n_bhk_packed_nitristrips_shape.__class__.__name__}")
 
-        # Create mesh for each sub shape
-        all_verts = []
-        all_faces = []
-        material_map = {}  # Map of material names to material indices
-        material_indices = []
-        vertex_offset = 0
         subshapes = n_bhk_packed_nitristrips_shape.sub_shapes
 
         if not subshapes:
             # Fallout 3 stores them in the data
             subshapes = n_bhk_packed_nitristrips_shape.data.sub_shapes
 
+        # Read the packed geometry once
+        n_data = n_bhk_packed_nitristrips_shape.data
+        verts = np.array([(n_vert.x, n_vert.y, n_vert.z) for n_vert in n_data.vertices],
+                         dtype=np.float32).reshape(-1, 3) * self.HAVOK_SCALE
+        faces = np.array([(bhk_triangle.triangle.v_1, bhk_triangle.triangle.v_2, bhk_triangle.triangle.v_3)
+                          for bhk_triangle in n_data.triangles], dtype=np.int32).reshape(-1, 3)
+
+        # A triangle belongs to the sub shape whose vertex range holds its first vertex;
+        # sort the triangles by sub shape once instead of rescanning them for every sub shape
+        vertex_ends = np.cumsum([subshape.num_vertices for subshape in subshapes], dtype=np.int64)
+        face_subshapes = np.searchsorted(vertex_ends, faces[:, 0], side="right")
+        order = np.argsort(face_subshapes, kind="stable")
+        faces = faces[order]
+        face_subshapes = face_subshapes[order]
+        in_range = face_subshapes < len(subshapes)
+        faces = faces[in_range]
+        face_subshapes = face_subshapes[in_range]
+
+        # Resolve the Havok material once per sub shape
+        material_map = {}  # Map of materials to material indices
+        subshape_materials = np.zeros(len(subshapes), dtype=np.int32)
         for subshape_num, subshape in enumerate(subshapes):
-            verts = []
-            faces = []
-            for vert_index in range(vertex_offset, vertex_offset + subshape.num_vertices):
-                n_vert = n_bhk_packed_nitristrips_shape.data.vertices[vert_index]
-                verts.append((n_vert.x * self.HAVOK_SCALE,
-                              n_vert.y * self.HAVOK_SCALE,
-                              n_vert.z * self.HAVOK_SCALE))
-
-            for bhk_triangle in n_bhk_packed_nitristrips_shape.data.triangles:
-                bhk_tri = bhk_triangle.triangle
-                if vertex_offset <= bhk_tri.v_1 < vertex_offset + subshape.num_vertices:
-                    faces.append((bhk_tri.v_1 - vertex_offset,
-                                  bhk_tri.v_2 - vertex_offset,
-                                  bhk_tri.v_3 - vertex_offset))
-                    # Assign the material index for this face
-                    havok_material = getattr(subshape, 'material', None)
-                    if havok_material:
-                        if hasattr(havok_material, "material"):
-                            mat_enum = havok_material.material
-                            mat_name = mat_enum.name
-                            b_mat = collision.get_material(mat_name)
-                            if b_mat not in material_map:
-                                material_map[b_mat] = len(material_map)
-
-                            material_indices.append(material_map[b_mat])
-
-            # Extend global lists with this subshape's data
-            all_verts.extend(verts)
-            all_faces.extend([(v1 + vertex_offset, v2 + vertex_offset, v3 + vertex_offset) for v1, v2, v3 in faces])
-            vertex_offset += subshape.num_vertices
+            havok_material = getattr(subshape, 'material', None)
+            if havok_material and hasattr(havok_material, "material"):
+                b_mat = collision.get_material(havok_material.material.name)
+                if b_mat not in material_map:
+                    material_map[b_mat] = len(material_map)
+                subshape_materials[subshape_num] = material_map[b_mat]
 
         # Create a single mesh object with all vertices and faces
-        b_col_obj = Object.mesh_from_data("collision_poly", all_verts, all_faces)
+        b_col_obj = Object.mesh_from_arrays("collision_poly", verts, faces)
         b_me = b_col_obj.data
 
         for b_mapped_mat in material_map.keys():
             b_me.materials.append(b_mapped_mat)
+        b_me.polygons.foreach_set("material_index", subshape_materials[face_subshapes])
 
-        for poly, mat_index in zip(b_me.polygons, material_indices):
-            poly.material_index = mat_index
-
-        radius = min(vert.co.length for vert in b_me.vertices)
+        radius = float(np.linalg.norm(verts, axis=1).min()) if len(verts) else 0.0
         self.set_b_collider(b_col_obj, radius, bounds_type="MESH")
         return b_col_obj
 
@@ -51,30 +51,37 @@ class Constraint:
         self.HAVOK_SCALE = NifData.data.havok_scale
 
     def import_bhk_constraints(self):
-        for n_bhk_rigid_body in collision.DICT_HAVOK_OBJECTS:
-            self.import_constraint(n_bhk_rigid_body)
+        """Import the constraints of all rigid bodies imported by the collision importer.
 
-    def import_constraint(self, n_bhk_rigid_body):
-        """Imports a bone havok constraint as Blender object constraint."""
+        Entities are resolved through collision.DICT_HAVOK_OBJECTS, which maps every imported bhkRigidBody to its
+        Blender object, so no scene scan is needed."""
+        if not any(n_bhk_rigid_body.constraints for n_bhk_rigid_body in collision.DICT_HAVOK_OBJECTS):
+            return
+
+        # make sure the world matrices of the freshly imported collision objects are up to date
+        bpy.context.view_layer.update()
+
+        for n_bhk_rigid_body, b_col_obj in collision.DICT_HAVOK_OBJECTS.items():
+            self.import_constraint(n_bhk_rigid_body, b_col_obj)
+
+    def import_constraint(self, n_bhk_rigid_body, b_col_obj):
+        """Imports the havok constraints of a rigid body as Blender rigid body constraints."""
         assert (isinstance(n_bhk_rigid_body, NifClasses.BhkRigidBody))
 
         # check for constraints
         if not n_bhk_rigid_body.constraints:
             return
 
-        # find objects
-        if not collision.DICT_HAVOK_OBJECTS[n_bhk_rigid_body]:
+        if not b_col_obj:
             NifLog.warn("Rigid body with no or multiple shapes, constraints skipped")
             return
 
-        b_col_obj = collision.DICT_HAVOK_OBJECTS[n_bhk_rigid_body]
-
         NifLog.info(f"Importing constraints for {b_col_obj.name}")
 
         # now import all constraints
         for n_bhk_constraint in n_bhk_rigid_body.constraints:
 
-            # check constraint 
+            # check constraint
             n_c_info = n_bhk_constraint.constraint_info
             if not n_c_info.num_entities == 2:
                 NifLog.warn("Constraint with more than 2 entities, skipped")
@@ -82,7 +89,8 @@ class Constraint:
             if not n_c_info.entity_a is n_bhk_rigid_body:
                 NifLog.warn("First constraint entity not self, skipped")
                 continue
-            if not n_c_info.entity_b in collision.DICT_HAVOK_OBJECTS:
+            b_col_obj2 = collision.DICT_HAVOK_OBJECTS.get(n_c_info.entity_b)
+            if not b_col_obj2:
                 NifLog.warn("Second constraint entity not imported, skipped")
                 continue
 
@@ -101,249 +109,103 @@ class Constraint:
                     n_bhk_descriptor = n_bhk_descriptor.ragdoll
                     b_col_obj.rigid_body.enabled = False
                 else:
-                    NifLog.warn(f"Unknown malleable type ({n_bhk_constraint.type:s}), skipped")
+                    NifLog.warn(f"Unknown malleable type ({n_bhk_descriptor.type}), skipped")
+                    continue
             else:
                 NifLog.warn(f"Unknown constraint type ({n_bhk_constraint.__class__.__name__}), skipped")
                 continue
 
-            # TODO: The following is no longer possible. Fix me!
-
-            b_col_obj2 = collision.DICT_HAVOK_OBJECTS[n_bhk_constraint.constraint_info.entity_b]
-            # add the constraint as a rigid body joint
-            override = bpy.context.copy()
-            override['active_object'] = b_col_obj
-            override['selected_objects'] = b_col_obj2
-
-            bpy.ops.rigidbody.connect(con_type='FIXED', pivot_type='CENTER', connection_pattern='SELECTED_TO_ACTIVE')
-
-            continue
-
-            b_constr = None
-            for obj in bpy.context.scene.objects:  # Iterate over all objects
-                if obj.rigid_body_constraint:  # Check for rigid body constraints
-                    if obj.rigid_body_constraint.object1 == b_col_obj and obj.rigid_body_constraint.object2 == b_col_obj2:
-                        b_constr = obj.rigid_body_constraint
-
-            # note: rigidbodyjoint parameters (from Constraint.c)
-            # CONSTR_RB_AXX 0.0
-            # CONSTR_RB_AXY 0.0
-            # CONSTR_RB_AXZ 0.0
-            # CONSTR_RB_EXTRAFZ 0.0
-            # CONSTR_RB_MAXLIMIT0 0.0
-            # CONSTR_RB_MAXLIMIT1 0.0
-            # CONSTR_RB_MAXLIMIT2 0.0
-            # CONSTR_RB_MAXLIMIT3 0.0
-            # CONSTR_RB_MAXLIMIT4 0.0
-            # CONSTR_RB_MAXLIMIT5 0.0
-            # CONSTR_RB_MINLIMIT0 0.0
-            # CONSTR_RB_MINLIMIT1 0.0
-            # CONSTR_RB_MINLIMIT2 0.0
-            # CONSTR_RB_MINLIMIT3 0.0
-            # CONSTR_RB_MINLIMIT4 0.0
-            # CONSTR_RB_MINLIMIT5 0.0
-            # CONSTR_RB_PIVX 0.0
-            # CONSTR_RB_PIVY 0.0
-            # CONSTR_RB_PIVZ 0.0
-            # CONSTR_RB_TYPE 12
-            # LIMIT 63
-            # PARSIZEY 63
-            # TARGET [Object "capsule.002"]
-
-            # limit 3, 4, 5 correspond to angular limits along x, y and z
-            # and are measured in degrees
-
-            # pivx/y/z is the pivot point
+            if isinstance(n_bhk_descriptor, NifClasses.BhkRagdollConstraintCInfo):
+                b_constr_type = 'GENERIC'
+                # for ragdoll, take z to be the twist axis (central axis of the cone, that is)
+                axis_z = self.get_vector(n_bhk_descriptor.twist_a)
+                # for ragdoll, let x be the plane vector
+                axis_x = self.get_vector(n_bhk_descriptor.plane_a)
+            else:
+                b_constr_type = 'HINGE'
+                # for hinge, x is the vector on the plane of rotation defining the zero angle
+                axis_x = self.get_vector(n_bhk_descriptor.perp_2_axle_in_a_1)
+                # Blender hinges rotate around the local z axis of the constraint object
+                if isinstance(n_bhk_descriptor, NifClasses.BhkLimitedHingeConstraintCInfo):
+                    axis_z = self.get_vector(n_bhk_descriptor.axle_a)
+                else:
+                    axis_z = axis_x.cross(self.get_vector(n_bhk_descriptor.perp_2_axle_in_a_2))
 
-            # set constraint target
-            b_constr.object1 = collision.DICT_HAVOK_OBJECTS[n_bhk_constraint.constraint_info.entity_a]
-            b_constr.object2 = collision.DICT_HAVOK_OBJECTS[n_bhk_constraint.constraint_info.entity_b]
-            # set rigid body type (generic)
-            b_constr.pivot_type = 'GENERIC_6_DOF'
-            # limiting parameters (limit everything)
-            b_constr.use_angular_limit_x = True
-            b_constr.use_angular_limit_y = True
-            b_constr.use_angular_limit_z = True
+            b_constr_obj = self.create_constraint_object(b_col_obj, b_col_obj2, b_constr_type)
+            b_constr = b_constr_obj.rigid_body_constraint
 
-            # get pivot point
-            pivot = mathutils.Vector((n_bhk_descriptor.pivot_b.x,
-                                      n_bhk_descriptor.pivot_b.y,
-                                      n_bhk_descriptor.pivot_b.z)) * self.HAVOK_SCALE
+            # the pivot point and axes are given in the space of the first rigid body
+            b_constr_obj.matrix_world = self.get_body_matrix(n_bhk_rigid_body, b_col_obj) @ self.get_constraint_matrix(
+                self.get_vector(n_bhk_descriptor.pivot_a) * self.HAVOK_SCALE, axis_x, axis_z, n_bhk_descriptor)
 
-            # get z- and x-axes of the constraint
-            # (also see export_nif.py NifImport.export_constraints)
             if isinstance(n_bhk_descriptor, NifClasses.BhkRagdollConstraintCInfo):
-                b_constr.pivot_type = 'CONE_TWIST'
-                # for ragdoll, take z to be the twist axis (central axis of the
-                # cone, that is)
-                axis_z = mathutils.Vector((n_bhk_descriptor.twist_a.x,
-                                           n_bhk_descriptor.twist_a.y,
-                                           n_bhk_descriptor.twist_a.z))
-                # for ragdoll, let x be the plane vector
-                axis_x = mathutils.Vector((n_bhk_descriptor.plane_a.x,
-                                           n_bhk_descriptor.plane_a.y,
-                                           n_bhk_descriptor.plane_a.z))
                 # set the angle limits
                 # (see http://niftools.sourceforge.net/wiki/Oblivion/Bhk_Objects/Ragdoll_Constraint
                 # for a nice picture explaining this)
-                b_constr.limit_angle_min_x = n_bhk_descriptor.plane_min_angle
-                b_constr.limit_angle_max_x = n_bhk_descriptor.plane_max_angle
-
-                b_constr.limit_angle_min_y = -n_bhk_descriptor.cone_max_angle
-                b_constr.limit_angle_max_y = n_bhk_descriptor.cone_max_angle
-
-                b_constr.limit_angle_min_z = n_bhk_descriptor.twist_min_angle
-                b_constr.limit_angle_max_z = n_bhk_descriptor.twist_max_angle
-
-                b_col_obj.niftools_constraint.LHMaxFriction = n_bhk_descriptor.max_friction
-
+                b_constr.use_limit_ang_x = True
+                b_constr.use_limit_ang_y = True
+                b_constr.use_limit_ang_z = True
+                b_constr.limit_ang_x_lower = n_bhk_descriptor.plane_min_angle
+                b_constr.limit_ang_x_upper = n_bhk_descriptor.plane_max_angle
+                b_constr.limit_ang_y_lower = -n_bhk_descriptor.cone_max_angle
+                b_constr.limit_ang_y_upper = n_bhk_descriptor.cone_max_angle
+                b_constr.limit_ang_z_lower = n_bhk_descriptor.twist_min_angle
+                b_constr.limit_ang_z_upper = n_bhk_descriptor.twist_max_angle
             elif isinstance(n_bhk_descriptor, NifClasses.BhkLimitedHingeConstraintCInfo):
-                # for hinge, y is the vector on the plane of rotation defining
-                # the zero angle
-                axis_y = mathutils.Vector((n_bhk_descriptor.perp_2_axle_in_a_1.x,
-                                           n_bhk_descriptor.perp_2_axle_in_a_1.y,
-                                           n_bhk_descriptor.perp_2_axle_in_a_1.z))
-                # for hinge, take x to be the the axis of rotation
-                # (this corresponds with Blender's convention for hinges)
-                axis_x = mathutils.Vector((n_bhk_descriptor.axle_a.x,
-                                           n_bhk_descriptor.axle_a.y,
-                                           n_bhk_descriptor.axle_a.z))
-                # for hinge, z is the vector on the plane of rotation defining
-                # the positive direction of rotation
-                axis_z = mathutils.Vector((n_bhk_descriptor.perp_2_axle_in_a_2.x,
-                                           n_bhk_descriptor.perp_2_axle_in_a_2.y,
-                                           n_bhk_descriptor.perp_2_axle_in_a_2.z))
-                # they should form a orthogonal basis
-                if (mathutils.Vector.cross(axis_x, axis_y) - axis_z).length > 0.01:
-                    # either not orthogonal, or negative orientation
-                    if (mathutils.Vector.cross(-axis_x, axis_y) - axis_z).length > 0.01:
-                        NifLog.warn(
-                            f"Axes are not orthogonal in {n_bhk_descriptor.__class__.__name__}; Arbitrary orientation has been chosen")
-                        axis_z = mathutils.Vector.cross(axis_x, axis_y)
-                    else:
-                        # fix orientation
-                        NifLog.warn(f"X axis flipped in {n_bhk_descriptor.__class__.__name__} to fix orientation")
-                        axis_x = -axis_x
-                # getting properties with no blender constraint equivalent and setting as obj properties
-                b_constr.limit_angle_max_x = n_bhk_descriptor.max_angle
-                b_constr.limit_angle_min_x = n_bhk_descriptor.min_angle
-                b_col_obj.niftools_constraint.LHMaxFriction = n_bhk_descriptor.max_friction
-
-                if hasattr(n_bhk_constraint, "tau"):
-                    b_col_obj.niftools_constraint.tau = n_bhk_constraint.tau
-                    b_col_obj.niftools_constraint.damping = n_bhk_constraint.damping
+                b_constr.use_limit_ang_z = True
+                b_constr.limit_ang_z_lower = n_bhk_descriptor.min_angle
+                b_constr.limit_ang_z_upper = n_bhk_descriptor.max_angle
 
-            elif isinstance(n_bhk_descriptor, NifClasses.HingeDescriptor):
-                # for hinge, y is the vector on the plane of rotation defining
-                # the zero angle
-                axis_y = mathutils.Vector((n_bhk_descriptor.perp_2_axle_in_a_1.x,
-                                           n_bhk_descriptor.perp_2_axle_in_a_1.y,
-                                           n_bhk_descriptor.perp_2_axle_in_a_1.z))
-                # for hinge, z is the vector on the plane of rotation defining
-                # the positive direction of rotation
-                axis_z = mathutils.Vector((n_bhk_descriptor.perp_2_axle_in_a_2.x,
-                                           n_bhk_descriptor.perp_2_axle_in_a_2.y,
-                                           n_bhk_descriptor.perp_2_axle_in_a_2.z))
-                # take x to be the the axis of rotation
-                # (this corresponds with Blender's convention for hinges)
-                axis_x = mathutils.Vector.cross(axis_y, axis_z)
+            # getting properties with no blender constraint equivalent and setting as obj properties
+            if hasattr(n_bhk_descriptor, "max_friction"):
                 b_col_obj.niftools_constraint.LHMaxFriction = n_bhk_descriptor.max_friction
-            else:
-                raise ValueError(f"Unknown descriptor {n_bhk_descriptor.__class__.__name__}")
-
-            # transform pivot point and constraint matrix into object
-            # coordinates
-            # (also see export_nif.py NifImport.export_constraints)
-
-            # the pivot point v is in hkbody coordinates
-            # however blender expects it in object coordinates, v'
-            # v * R * B = v' * O * T * B'
-            # with R = rigid body transform (usually unit tf)
-            # B = nif bone matrix
-            # O = blender object transform
-            # T = bone tail matrix (translation in Y direction)
-            # B' = blender bone matrix
-            # so we need to cancel out the object transformation by
-            # v' = v * R * B * B'^{-1} * T^{-1} * O^{-1}
-
-            # the local rotation L at the pivot point must be such that
-            # (axis_z + v) * R * B = ([0 0 1] * L + v') * O * T * B'
-            # so (taking the rotation parts of all matrices!!!)
-            # [0 0 1] * L = axis_z * R * B * B'^{-1} * T^{-1} * O^{-1}
-            # and similarly
-            # [1 0 0] * L = axis_x * R * B * B'^{-1} * T^{-1} * O^{-1}
-            # hence these give us the first and last row of L
-            # which is exactly enough to provide the euler angles
-
-            # multiply with rigid body transform
-            if isinstance(n_bhk_rigid_body, NifClasses.BhkRigidBodyT):
-                # set rotation
-                transform = mathutils.Quaternion((n_bhk_rigid_body.rotation.w,
-                                                  n_bhk_rigid_body.rotation.x,
-                                                  n_bhk_rigid_body.rotation.y,
-                                                  n_bhk_rigid_body.rotation.z)).to_matrix()
-                transform.resize_4x4()
-                # set translation
-                transform[0][3] = n_bhk_rigid_body.translation.x * self.HAVOK_SCALE
-                transform[1][3] = n_bhk_rigid_body.translation.y * self.HAVOK_SCALE
-                transform[2][3] = n_bhk_rigid_body.translation.z * self.HAVOK_SCALE
-                # apply transform
-                # pivot = pivot * transform
-                transform = transform.to_3x3()
-                axis_z = axis_z * transform
-                axis_x = axis_x * transform
-
-            # TODO [armature] update this to use the new bone system
-            # next, cancel out bone matrix correction
-            # note that B' = X * B with X = self.nif_import.dict_bones_extra_matrix[B]
-            # so multiply with the inverse of X
-            # for niBone in self.nif_import.dict_bones_extra_matrix:
-            # if niBone.collision_object \
-            # and niBone.collision_object.body is hkbody:
-            # transform = mathutils.Matrix(
-            # self.nif_import.dict_bones_extra_matrix[niBone])
-            # transform.invert()
-            # pivot = pivot * transform
-            # transform = transform.to_3x3()
-            # axis_z = axis_z * transform
-            # axis_x = axis_x * transform
-            # break
-
-            # # cancel out bone tail translation
-            # if b_hkobj.parent_bone:
-            #     pivot[1] -= b_hkobj.parent.data.bones[
-            #         b_hkobj.parent_bone].length
-
-            # cancel out object transform
-            transform = mathutils.Matrix(b_col_obj.matrix_local)
-            transform.invert()
-            # pivot = pivot * transform
-            transform = transform.to_3x3()
-            axis_z = axis_z * transform
-            axis_x = axis_x * transform
-
-            # set pivot point
-            b_constr.pivot_x = pivot[0]
-            b_constr.pivot_y = pivot[1]
-            b_constr.pivot_z = pivot[2]
-
-            # set euler angles
-            constr_matrix = mathutils.Matrix((axis_x,
-                                              mathutils.Vector.cross(axis_z, axis_x),
-                                              axis_z))
-            constr_euler = constr_matrix.to_euler()
-            b_constr.axis_x = constr_euler.x
-            b_constr.axis_y = constr_euler.y
-            b_constr.axis_z = constr_euler.z
-            # DEBUG
-            assert ((axis_x - mathutils.Vector((1, 0, 0)) * constr_matrix).length < 0.0001)
-            assert ((axis_z - mathutils.Vector((0, 0, 1)) * constr_matrix).length < 0.0001)
-
-            # the generic rigid body type is very buggy... so for simulation purposes let's transform it into ball and hinge
-            if isinstance(n_bhk_descriptor, NifClasses.BhkRagdollConstraintCInfo):
-                # cone_twist
-                b_constr.pivot_type = 'CONE_TWIST'
-            elif isinstance(n_bhk_descriptor, (NifClasses.BhkLimitedHingeConstraintCInfo, NifClasses.HingeDescriptor)):
-                # (limited) hinge
-                b_constr.pivot_type = 'HINGE'
-            else:
-                raise ValueError(f"Unknown descriptor {n_bhk_descriptor.__class__.__name__}")
+            if hasattr(n_bhk_constraint, "tau"):
+                b_col_obj.niftools_constraint.tau = n_bhk_constraint.tau
+                b_col_obj.niftools_constraint.damping = n_bhk_constraint.damping
+
+    def get_body_matrix(self, n_bhk_rigid_body, b_col_obj):
+        """World matrix of the rigid body frame, which the pivots and axes of its constraints are given in.
+
+        This is the parent space of the collision object, moved by the transform of a bhkRigidBodyT. The local matrix
+        of the collision shape, such as the centering and alignment of a capsule, is not part of it."""
+        b_body_matrix = b_col_obj.matrix_world @ collision.DICT_HAVOK_MATRICES[n_bhk_rigid_body].inverted_safe()
+        if isinstance(n_bhk_rigid_body, NifClasses.BhkRigidBodyT):
+            b_body_matrix = b_body_matrix @ collision.Collision.rigid_body_t_to_matrix(n_bhk_rigid_body,
+                                                                                       self.HAVOK_SCALE)
+        return b_body_matrix
+
+    @staticmethod
+    def create_constraint_object(b_col_obj, b_col_obj2, b_constr_type):
+        """Create an empty holding a rigid body constraint between the two given objects."""
+        b_constr_obj = bpy.data.objects.new(f"{b_col_obj.name}:{b_col_obj2.name}", None)
+        b_constr_obj.empty_display_type = 'ARROWS'
+        bpy.context.scene.collection.objects.link(b_constr_obj)
+
+        # Blender has no data API to create constraint settings, so add them to the new empty only
+        with bpy.context.temp_override(object=b_constr_obj, active_object=b_constr_obj,
+                                       selected_objects=[b_constr_obj]):
+            bpy.ops.rigidbody.constraint_add(type=b_constr_type)
+
+        b_constr = b_constr_obj.rigid_body_constraint
+        b_constr.object1 = b_col_obj
+        b_constr.object2 = b_col_obj2
+        return b_constr_obj
+
+    @staticmethod
+    def get_vector(n_vector):
+        return mathutils.Vector((n_vector.x, n_vector.y, n_vector.z))
+
+    @staticmethod
+    def get_constraint_matrix(pivot, axis_x, axis_z, n_bhk_descriptor):
+        """Build the local matrix of the constraint object from the pivot and its x and z axes."""
+        axis_x = axis_x.normalized()
+        axis_z = axis_z.normalized()
+        # the axes should form an orthogonal basis
+        if abs(axis_x.dot(axis_z)) > 0.01:
+            NifLog.warn(f"Axes are not orthogonal in {n_bhk_descriptor.__class__.__name__}; "
+                        f"arbitrary orientation has been chosen")
+            axis_x = axis_z.orthogonal().normalized()
+        axis_y = axis_z.cross(axis_x)
+        constr_matrix = mathutils.Matrix((axis_x, axis_y, axis_z)).transposed().to_4x4()
+        constr_matrix.translation = pivot
+        return constr_matrix
@@ -44,6 +44,7 @@ from io_scene_niftools.modules.nif_import.animation.morph import MorphAnimation
 from io_scene_niftools.modules.nif_import.geometry.vertex import Vertex
 from io_scene_niftools.modules.nif_import.geometry.vertex.groups import VertexGroup
 from io_scene_niftools.modules.nif_import.property.material import MaterialProperty
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.singleton import NifOp
 from nifgen.formats.nif import classes as NifClasses
@@ -57,6 +58,7 @@ class Mesh:
         self.material_property_helper = MaterialProperty()
         self.morph_anim = MorphAnimation()
 
+    @instrumentation.timed("geometry")
     def import_mesh(self, n_block, b_obj):
         """Creates and returns a raw mesh, or appends geometry data to group_mesh.
 
@@ -137,6 +139,9 @@ class Mesh:
             if n_tri_data.has_normals:
                 normals = n_tri_data.normals
 
+        instrumentation.count("vertices", len(vertices))
+        instrumentation.count("triangles", len(triangles))
+
         # create raw mesh from vertices and triangles
         b_mesh.from_pydata(vertices, [], triangles)
         b_mesh.update()
@@ -43,6 +43,7 @@ import numpy as np
 
 import bpy
 from io_scene_niftools.modules.nif_import.object.block_registry import block_store, get_bone_name_for_blender
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from nifgen.formats.nif import classes as NifClasses
 from nifgen.formats.nif.nimesh.structs.DisplayList import DisplayList
@@ -127,6 +128,7 @@ class VertexGroup:
                 vold.z = vnew.z
 
     @classmethod
+    @instrumentation.timed("skin")
     def import_skin(cls, ni_block, b_obj):
         """Import a NiSkinInstance and its contents as vertex groups"""
         bone_weights_map = cls.get_bone_weights(ni_block)
@@ -38,6 +38,7 @@
 # ***** END LICENSE BLOCK *****
 
 import bpy
+import numpy as np
 from io_scene_niftools.modules.nif_import.geometry.mesh import Mesh
 from io_scene_niftools.modules.nif_import.object.block_registry import block_store
 from io_scene_niftools.utils import math
@@ -72,6 +73,22 @@ class Object:
         me.update()
         return Object.create_b_obj(None, me, name)
 
+    @staticmethod
+    def mesh_from_arrays(name, verts, triangles):
+        """Like mesh_from_data, for an array of vertices and an array of triangles, which are set in bulk."""
+        me = bpy.data.meshes.new(name)
+        me.vertices.add(len(verts))
+        me.vertices.foreach_set("co", np.asarray(verts, dtype=np.float32).ravel())
+        me.loops.add(len(triangles) * 3)
+        me.loops.foreach_set("vertex_index", np.asarray(triangles, dtype=np.int32).ravel())
+        me.polygons.add(len(triangles))
+        me.polygons.foreach_set("loop_start", np.arange(0, len(triangles) * 3, 3, dtype=np.int32))
+        me.polygons.foreach_set("loop_total", np.full(len(triangles), 3, dtype=np.int32))
+        me.update(calc_edges=True)
+        # flat shaded, as from_pydata does
+        me.shade_flat()
+        return Object.create_b_obj(None, me, name)
+
     @staticmethod
     def box_from_extents(b_name, minx, maxx, miny, maxy, minz, maxz):
         verts = []
@@ -43,6 +43,7 @@ import bpy
 from io_scene_niftools.modules.nif_import.property.node_wrapper import NodeWrapper
 from io_scene_niftools.modules.nif_import.property.shader.bethesda import BSShaderProperty
 from io_scene_niftools.utils.consts import TEX_SLOTS
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from nifgen.formats.nif import classes as NifClasses
 
@@ -71,6 +72,7 @@ class MaterialProperty:
         self.import_material_property.register(NifClasses.TileShaderProperty, self.__import_bs_shader_property)
         self.import_material_property.register(NifClasses.WaterShaderProperty, self.__import_bs_shader_property)
 
+    @instrumentation.timed("materials")
     def import_material_properties(self, n_ni_geometry, b_obj):
         """Main function for handling material import."""
 
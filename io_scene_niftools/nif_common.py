@@ -40,6 +40,7 @@
 import bpy
 import nifgen.formats.nif as NifFormat
 from io_scene_niftools.utils import debugging
+from io_scene_niftools.utils.instrumentation import instrumentation
 from io_scene_niftools.utils.logging import NifLog
 from io_scene_niftools.utils.singleton import NifOp
 from nifgen.spells.nif import NifToaster
@@ -56,6 +57,7 @@ class NifCommon:
         """Common initialization functions for executing the import/export operators."""
 
         NifOp.init(operator, context)
+        instrumentation.start(NifOp.props.timing_report, memory=NifOp.props.memory_report)
 
         debugging.start_debug()
 
@@ -67,6 +69,16 @@ class NifCommon:
                     f"(Running on Blender {bpy.app.version_string}, "
                     f"NIF XML version {NifFormat.__xml_version__}).")
 
+    @staticmethod
+    def report_instrumentation(file_path):
+        """Write the timing report of this run next to file_path and summarize it in the operator report."""
+        if not instrumentation.enabled:
+            return
+        report_path = instrumentation.write_report(file_path)
+        if report_path:
+            NifLog.info(f"Wrote timing report {report_path}")
+        NifOp.op.report({'INFO'}, instrumentation.summary())
+
     @staticmethod
     def apply_scale(data, scale):
         NifLog.info(f"Scale Correction set to {scale}.")
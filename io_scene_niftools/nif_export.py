@@ -39,6 +39,8 @@
 
 
 import os.path
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bpy
 
@@ -47,16 +49,20 @@ from io_scene_niftools.file_io import File
 from io_scene_niftools.nif_common import NifCommon
 
 from io_scene_niftools.utils import math
-from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.instrumentation import instrumentation
+from io_scene_niftools.utils.logging import NifLog, NifError, error_context
 from io_scene_niftools.utils.singleton import NifOp, EGMData, NifData
 
 from io_scene_niftools.modules.nif_export.animation import Animation
 from io_scene_niftools.modules.nif_export.collision import Collision
+from io_scene_niftools.modules.nif_export.collision.bounds import bounds_store
+from io_scene_niftools.modules.nif_export.collision.havok.mopp_cache import MoppCache, mopper_available
 from io_scene_niftools.modules.nif_export.constraint import Constraint
 from io_scene_niftools.modules.nif_export.object import Object
 from io_scene_niftools.modules.nif_export.particle import Particle
 from io_scene_niftools.modules.nif_export.scene import Scene
 from io_scene_niftools.modules.nif_export.block_registry import block_store
+from io_scene_niftools.modules.nif_export.property.analysis import material_store
 
 from nifgen.formats.nif import classes as NifClasses
 
@@ -93,12 +99,15 @@ class NifExport(NifCommon):
 
         # Used in testing
         self.n_root_blocks = []
+        self.mopp_timings = {}  # Seconds spent generating MOPP data, per collision object name
 
     def execute(self):
         """Main NIF export function."""
 
         block_store.block_to_obj = {}  # Clear data from last export attempt
         block_store.obj_to_block = {}
+        material_store.clear()
+        bounds_store.clear()
 
         # Bpy functions are sensitive to the UI context; force it to object mode for now
         if bpy.context.mode != 'OBJECT':
@@ -130,26 +139,40 @@ class NifExport(NifCommon):
             # Root node is exported as a meta root if multiple root objects are present
             # The name is fixed later to avoid confusing the exporter with duplicate names
             # Specialized objects not in b_exportable_objects are skipped for now
-            n_root_node = self.object_helper.export_objects(self.b_root_objects, self.b_main_objects,
-                                                            self.target_game, file_base)
+            with instrumentation.stage("objects"), error_context(stage="objects"):
+                n_root_node = self.object_helper.export_objects(self.b_root_objects, self.b_main_objects,
+                                                                self.target_game, file_base)
 
             # Export remaining block type categories
-            self.collision_helper.export_collision(self.b_collision_objects)
-            self.constraint_helper.export_constraints(self.b_constraint_objects, n_root_node)
-            self.particle_helper.export_particles(self.b_particle_objects, self.b_force_field_objects, n_root_node)
-            self.animation_helper.export_animations(self.b_main_objects, n_root_node)
-
-            self.correct_scale(n_root_node)  # Correct scale for NIF units
-            self.__generate_mopp_data()  # Generate MOPP data
+            with error_context(stage="collision"):
+                self.collision_helper.export_collision(self.b_collision_objects)
+            with instrumentation.stage("constraints"), error_context(stage="constraints"):
+                self.constraint_helper.export_constraints(self.b_constraint_objects, n_root_node)
+            with instrumentation.stage("particles"), error_context(stage="particles"):
+                self.particle_helper.export_particles(self.b_particle_objects, self.b_force_field_objects, n_root_node)
+            with error_context(stage="animation"):
+                self.animation_helper.export_animations(self.b_main_objects, n_root_node)
+
+            with instrumentation.stage("scale"):
+                self.correct_scale(n_root_node)  # Correct scale for NIF units
+            with instrumentation.stage("mopp"):
+                self.__generate_mopp_data()  # Generate MOPP data
+            instrumentation.count("blocks", len(block_store.block_to_obj))
 
             NifData.data.roots = [n_root_node]
             File.write_file(NifData.data, directory, file_base, file_ext)  # Write NIF file
             self.n_root_blocks = [n_root_node]  # Save exported file (this is used by the test suite)
 
         except NifError:
+            NifLog.report_summary()
             return {'CANCELLED'}
+        finally:
+            # stop tracing allocations whatever happened, it slows down everything that runs after it
+            instrumentation.stop()
 
+        self.report_instrumentation(NifOp.props.filepath)
         NifLog.info("Export finished successfully.")
+        NifLog.report_summary()
         return {'FINISHED'}
 
     def __initialize_nif_data(self):
@@ -278,16 +301,53 @@ class NifExport(NifCommon):
         """
 
         if bpy.context.scene.niftools_scene.is_bs():
-            for n_block in block_store.block_to_obj:
-                if isinstance(n_block, NifClasses.BhkMoppBvTreeShape):
-                    NifLog.info("Generating MOPP data...")
-                    n_block.update_mopp()
-                    # NifLog.debug(f"=== DEBUG: MOPP TREE ===")
-                    # n_block.parse_mopp(verbose = True)
-                    # NifLog.debug(f"=== END OF MOPP TREE ===")
-                    # Warn about MOPP on non-static objects
-                    if any(n_sub_shape.layer != 1 for n_sub_shape in n_block.shape.data.sub_shapes):
-                        NifLog.warn(
-                            "MOPP for non-static collision is performance-intensive "
-                            "and may not function correctly in-game. "
-                            "You may wish to use list shapes instead.")
+            n_mopp_blocks = [n_block for n_block in block_store.block_to_obj
+                             if isinstance(n_block, NifClasses.BhkMoppBvTreeShape)]
+            if not n_mopp_blocks:
+                return
+
+            # Reuse the MOPP data of shapes whose geometry did not change since a previous export
+            n_pending_blocks = n_mopp_blocks
+            if NifOp.props.use_mopp_cache:
+                mopp_cache = MoppCache(NifOp.props.cache_directory, NifOp.props.cache_size)
+                cache_keys = {n_block: mopp_cache.key_for(n_block) for n_block in n_mopp_blocks}
+                n_pending_blocks = [n_block for n_block in n_mopp_blocks
+                                    if not mopp_cache.load(n_block, cache_keys[n_block])]
+                NifLog.info(f"Reused cached MOPP data for {len(n_mopp_blocks) - len(n_pending_blocks)} "
+                            f"of {len(n_mopp_blocks)} shapes")
+
+            # Every shape is independent and the MOPP code is built by the external mopper process,
+            # so the pool threads mostly wait on it; results are collected in block order
+            if n_pending_blocks:
+                workers = min(NifOp.props.mopp_threads or os.cpu_count() or 1, len(n_pending_blocks))
+                NifLog.info(f"Generating MOPP data for {len(n_pending_blocks)} shapes on {workers} threads...")
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    timings = list(executor.map(self.__update_mopp, n_pending_blocks))
+                # only cache MOPP data built by the mopper, not the simple fallback tree
+                store_mopp = NifOp.props.use_mopp_cache and mopper_available()
+
+                for n_block, seconds in zip(n_pending_blocks, timings):
+                    b_obj = block_store.block_to_obj[n_block]
+                    self.mopp_timings[b_obj.name] = seconds
+                    instrumentation.count("mopp_shapes")
+                    NifLog.debug(f"Generated MOPP data for {b_obj.name} in {seconds:.3f}s")
+                    if store_mopp:
+                        mopp_cache.store(n_block, cache_keys[n_block])
+
+            for n_block in n_mopp_blocks:
+                # NifLog.debug(f"=== DEBUG: MOPP TREE ===")
+                # n_block.parse_mopp(verbose = True)
+                # NifLog.debug(f"=== END OF MOPP TREE ===")
+                # Warn about MOPP on non-static objects
+                if any(n_sub_shape.layer != 1 for n_sub_shape in n_block.shape.data.sub_shapes):
+                    NifLog.warn(
+                        "MOPP for non-static collision is performance-intensive "
+                        "and may not function correctly in-game. "
+                        "You may wish to use list shapes instead.")
+
+    @staticmethod
+    def __update_mopp(n_block):
+        """Generate the MOPP data of a single bhkMoppBvTreeShape and return how long it took."""
+        start = time.perf_counter()
+        n_block.update_mopp()
+        return time.perf_counter() - start
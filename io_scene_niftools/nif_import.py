@@ -38,8 +38,14 @@
 # ***** END LICENSE BLOCK *****
 
 
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
 import bpy
 import io_scene_niftools.utils.logging
+import nifgen.formats.nif as NifFormat
 import nifgen.spells.nif.fix
 from io_scene_niftools.file_io.nif import NifFile
 from io_scene_niftools.modules.nif_import import scene
@@ -56,11 +62,31 @@ from io_scene_niftools.modules.nif_import.object.types import NiTypes
 from io_scene_niftools.modules.nif_import.property.object import ObjectProperty
 from io_scene_niftools.nif_common import NifCommon
 from io_scene_niftools.utils import math
-from io_scene_niftools.utils.logging import NifLog, NifError
+from io_scene_niftools.utils.cache import DiskCache
+from io_scene_niftools.utils.instrumentation import instrumentation
+from io_scene_niftools.utils.logging import NifLog, NifError, error_context
 from io_scene_niftools.utils.singleton import NifOp, NifData
 from nifgen.formats.nif import classes as NifClasses
 
 
+SPELL_OPTIONS = ("merge_skeleton_roots", "send_geoms_to_bind_pos", "send_detached_geoms_to_node_pos",
+                 "apply_skin_deformation", "scale_correction")
+"""Import options that change the data before it is imported, so they are applied when the file is prepared."""
+
+PARSE_START_METHOD = "fork"
+"""
+Start method of the processes that read several files in parallel. Spawned processes would import this module, which
+needs bpy and so only loads inside blender, so files are read in parallel only where the blender process can be forked.
+"""
+
+
+def prepare_file(file_path, options):
+    """Read a file and apply the spells and scale correction, in a worker process of a multi file import."""
+    n_data = NifImport.read_file(file_path)
+    NifImport.apply_spells(n_data, options)
+    return n_data
+
+
 class NifImport(NifCommon):
 
     def __init__(self, operator, context):
@@ -69,22 +95,14 @@ class NifImport(NifCommon):
     def execute(self):
         """Main NIF import function."""
 
-        self.load_files()  # Needs to be first to provide version info
-
-        # Helper systems
-        self.armaturehelper = Armature()
-        self.boundhelper = Bound()
-        self.bhkhelper = BhkCollision()
-        self.constrainthelper = Constraint()
-        self.objecthelper = Object()
-        self.object_anim = ObjectAnimation()
-        self.transform_anim = TransformAnimation()
-
         # find and store this list now of selected objects as creating new objects adds them to the selection list
         self.SELECTED_OBJECTS = bpy.context.selected_objects[:]
 
         # catch nif import errors
         try:
+            with instrumentation.stage("load"):
+                self.load_files()
+
             # check that one armature is selected in 'import geometry + parent
             # to armature' mode
             if NifOp.props.process == "GEOMETRY_ONLY":
@@ -92,61 +110,189 @@ class NifImport(NifCommon):
                     raise io_scene_niftools.utils.logging.NifError(
                         "You must select exactly one armature in 'Import Geometry Only' mode.")
 
-            # Force the wireframe color type to object for collision
-            for area in bpy.context.window.screen.areas:
-                if area.type == 'VIEW_3D':
-                    for space in area.spaces:
-                        if space.type == 'VIEW_3D':
-                            space.shading.wireframe_color_type = 'OBJECT'
-
-            NifLog.info("Importing data")
-            # calculate and set frames per second
-            if NifOp.props.animation:
-                self.transform_anim.set_frames_per_second(NifData.data.roots)
-
-            # merge skeleton roots and transform geometry into the rest pose
-            if NifOp.props.merge_skeleton_roots:
-                nifgen.spells.nif.fix.SpellMergeSkeletonRoots(data=NifData.data).recurse()
-            if NifOp.props.send_geoms_to_bind_pos:
-                nifgen.spells.nif.fix.SpellSendGeometriesToBindPosition(data=NifData.data).recurse()
-            if NifOp.props.send_detached_geoms_to_node_pos:
-                nifgen.spells.nif.fix.SpellSendDetachedGeometriesToNodePosition(data=NifData.data).recurse()
-            if NifOp.props.apply_skin_deformation:
-                VertexGroup.apply_skin_deformation(NifData.data)
+            # Force the wireframe color type to object for collision, there is no window in background mode
+            if bpy.context.window:
+                for area in bpy.context.window.screen.areas:
+                    if area.type == 'VIEW_3D':
+                        for space in area.spaces:
+                            if space.type == 'VIEW_3D':
+                                space.shading.wireframe_color_type = 'OBJECT'
 
             # store scale correction
             bpy.context.scene.niftools_scene.scale_correction = NifOp.props.scale_correction
-            self.apply_scale(NifData.data, NifOp.props.scale_correction)
-
-            # import all root blocks
-            for root in NifData.data.roots:
-                # root hack for corrupt better bodies meshes and remove geometry from better bodies on skeleton import
-                for b in (b for b in root.tree(block_type=NifClasses.NiGeometry) if b.is_skin()):
-                    # check if root belongs to the children list of the skeleton root
-                    if root in [c for c in b.skin_instance.skeleton_root.children]:
-                        # fix parenting and update transform accordingly
-                        b.skin_instance.data.set_transform(root.get_transform() * b.skin_instance.data.get_transform())
-                        b.skin_instance.skeleton_root = root
-                        # delete non-skeleton nodes if we're importing skeleton only
-                        if NifOp.props.process == "SKELETON_ONLY":
-                            nonbip_children = (child for child in root.children if child.name[:6] != 'Bip01 ')
-                            for child in nonbip_children:
-                                root.remove_child(child)
-
-                # import this root block
-                NifLog.debug(f"Root block: {root.get_global_display()}")
-                self.import_root(root)
+
+            for file_path, n_data, is_prepared in self.loaded_files:
+                NifLog.info(f"Importing data of {file_path}")
+                NifData.init(n_data)
+                if NifOp.props.override_scene_info:
+                    scene.import_version_info(NifData.data)
+                # the helpers read the version info of the scene
+                self.init_helpers()
+
+                # calculate and set frames per second
+                if NifOp.props.animation:
+                    self.transform_anim.set_frames_per_second(NifData.data.roots)
+
+                if is_prepared:
+                    NifLog.info("Spells and scale correction were already applied")
+                else:
+                    with instrumentation.stage("spells"):
+                        self.apply_spells(NifData.data, self.get_spell_options())
+                    if self.import_cache:
+                        self.import_cache.put(self.get_cache_key(file_path), NifData.data)
+
+                self.import_data()
 
         except NifError:
+            NifLog.report_summary()
             return {'CANCELLED'}
+        finally:
+            # stop tracing allocations whatever happened, it slows down everything that runs after it
+            instrumentation.stop()
 
+        self.report_instrumentation(NifOp.props.filepath)
         NifLog.info("Finished")
+        NifLog.report_summary()
         return {'FINISHED'}
 
+    def init_helpers(self):
+        self.armaturehelper = Armature()
+        self.boundhelper = Bound()
+        self.bhkhelper = BhkCollision()
+        self.constrainthelper = Constraint()
+        self.objecthelper = Object()
+        self.object_anim = ObjectAnimation()
+        self.transform_anim = TransformAnimation()
+
+    def import_data(self):
+        """Import all root blocks of the current nif data."""
+        for root in NifData.data.roots:
+            # root hack for corrupt better bodies meshes and remove geometry from better bodies on skeleton import
+            for b in (b for b in root.tree(block_type=NifClasses.NiGeometry) if b.is_skin()):
+                # check if root belongs to the children list of the skeleton root
+                if root in [c for c in b.skin_instance.skeleton_root.children]:
+                    # fix parenting and update transform accordingly
+                    b.skin_instance.data.set_transform(root.get_transform() * b.skin_instance.data.get_transform())
+                    b.skin_instance.skeleton_root = root
+                    # delete non-skeleton nodes if we're importing skeleton only
+                    if NifOp.props.process == "SKELETON_ONLY":
+                        nonbip_children = (child for child in root.children if child.name[:6] != 'Bip01 ')
+                        for child in nonbip_children:
+                            root.remove_child(child)
+
+            # import this root block
+            NifLog.debug(lambda: f"Root block: {root.get_global_display()}")
+            self.import_root(root)
+
+    @staticmethod
+    def get_file_paths():
+        """All selected files, or the file path if the operator was not called from the file browser."""
+        directory = os.path.dirname(NifOp.props.filepath)
+        file_paths = [os.path.join(directory, file.name) for file in NifOp.props.files if file.name]
+        return file_paths or [NifOp.props.filepath]
+
     def load_files(self):
-        NifData.init(NifFile.load_nif(NifOp.props.filepath))
-        if NifOp.props.override_scene_info:
-            scene.import_version_info(NifData.data)
+        """
+        Read the files to import into loaded_files, as tuples of the file path, its data, and whether the spells and
+        scale correction were already applied to it. Several files are read and prepared in parallel processes.
+        """
+        self.import_cache = None
+        if NifOp.props.use_import_cache:
+            self.import_cache = DiskCache("import", NifOp.props.cache_directory, NifOp.props.cache_size)
+
+        file_paths = self.get_file_paths()
+        loaded = {}
+        for file_path in file_paths:
+            if self.import_cache:
+                data = self.import_cache.get(self.get_cache_key(file_path))
+                if data is not None:
+                    NifLog.info(f"Loaded {file_path} from the import cache")
+                    loaded[file_path] = (data, True)
+
+        pending = [file_path for file_path in file_paths if file_path not in loaded]
+        processes = min(NifOp.props.parse_processes or os.cpu_count() or 1, len(pending))
+        if processes > 1 and not self.can_parse_in_parallel():
+            NifLog.info(f"Reading files in parallel is not supported on {sys.platform}, reading them one by one")
+            processes = 1
+        if processes > 1:
+            NifLog.info(f"Reading {len(pending)} files with {processes} processes")
+            with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context(PARSE_START_METHOD),
+                                     initializer=NifLog.detach) as executor:
+                options = self.get_spell_options()
+                futures = [executor.submit(prepare_file, file_path, options) for file_path in pending]
+                for file_path, future in zip(pending, futures):
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        self.skip_file(file_path, e)
+                        continue
+                    if self.import_cache:
+                        self.import_cache.put(self.get_cache_key(file_path), data)
+                    loaded[file_path] = (data, True)
+        else:
+            for file_path in pending:
+                try:
+                    loaded[file_path] = (self.read_file(file_path), False)
+                except Exception as e:
+                    # a single file fails the import as before
+                    if len(file_paths) == 1:
+                        raise
+                    self.skip_file(file_path, e)
+
+        if not loaded:
+            raise NifError("None of the selected files could be read.")
+        self.loaded_files = [(file_path,) + loaded[file_path] for file_path in file_paths if file_path in loaded]
+
+    @staticmethod
+    def can_parse_in_parallel():
+        """Whether this platform can fork the blender process to read files. Forking is unsafe on macOS."""
+        return PARSE_START_METHOD in multiprocessing.get_all_start_methods() and sys.platform != "darwin"
+
+    @staticmethod
+    def skip_file(file_path, error):
+        """Report a file of a multi file import that could not be read, the other files are still imported."""
+        NifLog.warn(f"Skipped {file_path}, it could not be read: {error}")
+
+    @staticmethod
+    def read_file(file_path):
+        header = NifFile.load_header(file_path)
+        # reject kf files from the header alone, before any block is decoded
+        root_types = header.root_types()
+        if root_types and all(root_type in ("NiControllerSequence", "NiSequenceStreamHelper")
+                              for root_type in root_types):
+            raise NifError("Use the KF import operator to load KF files.")
+        return NifFile.decode_nif(header)
+
+    @staticmethod
+    def get_spell_options():
+        return {option: getattr(NifOp.props, option) for option in SPELL_OPTIONS}
+
+    @staticmethod
+    def apply_spells(n_data, options):
+        """Merge skeleton roots, transform geometry into the rest pose and correct the scale, as set in options."""
+        if options["merge_skeleton_roots"]:
+            nifgen.spells.nif.fix.SpellMergeSkeletonRoots(data=n_data).recurse()
+        if options["send_geoms_to_bind_pos"]:
+            nifgen.spells.nif.fix.SpellSendGeometriesToBindPosition(data=n_data).recurse()
+        if options["send_detached_geoms_to_node_pos"]:
+            nifgen.spells.nif.fix.SpellSendDetachedGeometriesToNodePosition(data=n_data).recurse()
+        if options["apply_skin_deformation"]:
+            VertexGroup.apply_skin_deformation(n_data)
+
+        NifCommon.apply_scale(n_data, options["scale_correction"])
+
+    @staticmethod
+    def get_cache_key(file_path):
+        """Key of the import cache entry for a file: its identity plus every setting that changes the prepared data."""
+        from io_scene_niftools import bl_info
+        stat = os.stat(file_path)
+        return DiskCache.make_key(os.path.abspath(file_path), stat.st_size, stat.st_mtime,
+                                  bl_info["version"], NifFormat.__xml_version__,
+                                  NifOp.props.scale_correction,
+                                  NifOp.props.merge_skeleton_roots,
+                                  NifOp.props.send_geoms_to_bind_pos,
+                                  NifOp.props.send_detached_geoms_to_node_pos,
+                                  NifOp.props.apply_skin_deformation)
 
     def import_root(self, n_root_node):
         """Main import function."""
@@ -168,7 +314,8 @@ class NifImport(NifCommon):
             ObjectProperty().import_root_extra_data(n_root_node, b_obj)
 
             # now all havok objects are imported, so we are ready to import the havok constraints
-            self.constrainthelper.import_bhk_constraints()
+            with instrumentation.stage("constraints"):
+                self.constrainthelper.import_bhk_constraints()
 
             # parent selected meshes to imported skeleton
             if NifOp.props.process == "SKELETON_ONLY":
@@ -185,6 +332,7 @@ class NifImport(NifCommon):
         else:
             NifLog.warn(f"Skipped unsupported root block type '{n_root_node.__class__}' (corrupted nif?).")
 
+    @instrumentation.timed("collision")
     def import_collision(self, n_node):
         """Imports a NiNode's collision_object, if present."""
         if n_node.collision_object:
@@ -204,6 +352,11 @@ class NifImport(NifCommon):
         if not n_block:
             return None
 
+        with error_context(block=n_block):
+            return self.__import_block(n_block, b_armature)
+
+    def __import_block(self, n_block, b_armature):
+        instrumentation.count("blocks")
         NifLog.info(f"Importing data for block '{n_block.name}'")
         if self.objecthelper.has_geometry(n_block) and NifOp.props.process != "SKELETON_ONLY":
             return self.objecthelper.import_geometry_object(b_armature, n_block)
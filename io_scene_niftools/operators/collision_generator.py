@@ -0,0 +1,186 @@
+"""Operator generating simplified Havok collision objects from a render mesh."""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import bpy
+import numpy as np
+from bpy.types import Operator
+
+from io_scene_niftools.modules.nif_export.collision.havok.generator import CollisionGenerator
+from io_scene_niftools.modules.nif_import import collision
+from io_scene_niftools.modules.nif_import.collision import Collision
+from io_scene_niftools.modules.nif_import.object import Object
+from io_scene_niftools.utils.decorators import register_classes, unregister_classes
+from io_scene_niftools.utils.logging import NifError
+from nifgen.formats.nif import classes as NifClasses
+
+# Collision margin of generated objects; the exporter also uses this for convex shapes
+GENERATED_MARGIN = 0.1
+
+# Enum items must stay referenced while Blender displays them
+_havok_material_items = {}
+
+
+def get_havok_material_enum(game):
+    if game in ('SKYRIM', 'SKYRIM_SE'):
+        return NifClasses.SkyrimHavokMaterial
+    if game in ('FALLOUT_3', 'FALLOUT_NV'):
+        return NifClasses.Fallout3HavokMaterial
+    return NifClasses.OblivionHavokMaterial
+
+
+def havok_material_items(self, context):
+    havok_materials = get_havok_material_enum(context.scene.niftools_scene.game)
+    if havok_materials not in _havok_material_items:
+        _havok_material_items[havok_materials] = [(name, name, "") for name in havok_materials.__members__]
+    return _havok_material_items[havok_materials]
+
+
+class OperatorGenerateCollision(Operator):
+    """Generate simplified collision objects for the active mesh"""
+    bl_idname = "niftools.generate_collision"
+    bl_label = "Generate Collision"
+    bl_description = "Create ready to export collision objects approximating the active mesh"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Kind of collision to generate.
+    mode: bpy.props.EnumProperty(
+        items=[
+            ('CONVEX', "Convex Parts", "Split the mesh into convex hulls, exported as convex vertices shapes"),
+            ('MESH', "Packed Mesh", "Decimate the mesh, exported as MOPP packed triangle collision"),
+        ],
+        name="Mode",
+        description="Kind of collision to generate",
+        default='CONVEX')
+
+    # Maximum number of convex parts.
+    max_parts: bpy.props.IntProperty(
+        name="Max Parts",
+        description="Maximum number of convex hulls to split the mesh into",
+        default=8, min=1, max=256)
+
+    # Vertex budget of each convex part.
+    max_hull_vertices: bpy.props.IntProperty(
+        name="Max Hull Vertices",
+        description="Maximum number of vertices of each convex hull",
+        default=32, min=4, max=255)
+
+    # Allowed concavity of convex parts.
+    max_error: bpy.props.FloatProperty(
+        name="Max Error",
+        description="Stop splitting once no part sinks deeper into its hull than this fraction of the mesh size",
+        default=0.02, min=0.0, max=1.0, precision=3)
+
+    # Triangle budget of the packed mesh.
+    max_triangles: bpy.props.IntProperty(
+        name="Max Triangles",
+        description="Maximum number of triangles of the decimated collision mesh",
+        default=1000, min=4)
+
+    # Material of the generated collision.
+    havok_material: bpy.props.EnumProperty(
+        items=havok_material_items,
+        name="Havok Material",
+        description="Havok material assigned to the generated collision")
+
+    @classmethod
+    def poll(cls, context):
+        b_obj = context.active_object
+        return b_obj is not None and b_obj.type == 'MESH' and not b_obj.rigid_body
+
+    def execute(self, context):
+        b_obj = context.active_object
+
+        # Read the evaluated render mesh, so modifiers are taken into account
+        b_eval_obj = b_obj.evaluated_get(context.evaluated_depsgraph_get())
+        b_mesh = b_eval_obj.to_mesh()
+        try:
+            b_mesh.calc_loop_triangles()
+            vertices = np.empty(len(b_mesh.vertices) * 3, dtype=np.float32)
+            b_mesh.vertices.foreach_get("co", vertices)
+            triangles = np.empty(len(b_mesh.loop_triangles) * 3, dtype=np.int32)
+            b_mesh.loop_triangles.foreach_get("vertices", triangles)
+        finally:
+            b_eval_obj.to_mesh_clear()
+
+        try:
+            generator = CollisionGenerator(vertices, triangles)
+            if self.mode == 'CONVEX':
+                hulls, error = generator.convex_decomposition(self.max_parts, self.max_hull_vertices, self.max_error)
+                if len(hulls) == 1:
+                    self.create_collider(f"{b_obj.name}_collision", hulls[0].vertices, hulls[0].triangles,
+                                         'CONVEX_HULL', b_obj)
+                else:
+                    b_list_obj = self.create_collider(f"{b_obj.name}_collision", [], [], 'COMPOUND', b_obj)
+                    for i, hull in enumerate(hulls):
+                        self.create_collider(f"{b_obj.name}_collision_{i}", hull.vertices, hull.triangles,
+                                             'CONVEX_HULL', b_list_obj)
+                summary = f"{len(hulls)} convex parts"
+            else:
+                vertices, triangles, error = generator.decimated_mesh(self.max_triangles)
+                self.create_collider(f"{b_obj.name}_collision", vertices, triangles, 'MESH', b_obj)
+                summary = f"a packed mesh of {len(triangles)} triangles"
+        except NifError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+
+        context.view_layer.objects.active = b_obj
+        self.report({'INFO'}, f"Generated {summary} for {b_obj.name}, error {error:.2%} of its size")
+        return {'FINISHED'}
+
+    def create_collider(self, name, vertices, triangles, collision_shape, b_parent):
+        """Create a collision object in b_parent's space with the chosen Havok material."""
+        b_col_obj = Object.mesh_from_data(name, np.asarray(vertices).tolist(), np.asarray(triangles).tolist())
+        b_col_obj.parent = b_parent
+        Collision.set_b_collider(b_col_obj, GENERATED_MARGIN, bounds_type=collision_shape)
+        b_col_obj.data.materials.append(collision.get_material(self.havok_material))
+        return b_col_obj
+
+
+classes = [
+    OperatorGenerateCollision
+]
+
+
+def register():
+    register_classes(classes, __name__)
+
+
+def unregister():
+    unregister_classes(classes, __name__)
@@ -79,6 +79,34 @@ class CommonDevOperator:
         subtype="FILE_PATH",
         options={'HIDDEN'})
 
+    # Root directory of the import and export caches.
+    cache_directory: bpy.props.StringProperty(
+        name="Cache Directory",
+        description="Directory for cached import and export data. Leave empty to use the system's temporary directory",
+        maxlen=1024,
+        default="",
+        subtype="DIR_PATH")
+
+    # Size limit of each cache, least recently used entries are deleted first.
+    cache_size: bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        description="Maximum size of each cache in megabytes",
+        default=1024,
+        min=1)
+
+    # Time each stage and count the work done, reported as JSON next to the file.
+    timing_report: bpy.props.BoolProperty(
+        name="Timing Report",
+        description="Time every import or export stage and write the timings and counters as JSON next to the file",
+        default=False)
+
+    # Trace allocations per stage, reported with the largest allocation sites in the timing report.
+    memory_report: bpy.props.BoolProperty(
+        name="Memory Report",
+        description="Trace memory allocations of every stage and add the peak memory and largest allocations to the "
+                    "timing report. Slows down the import or export considerably",
+        default=False)
+
     # Used for checking equality between floats.
     epsilon: bpy.props.FloatProperty(
         name="Epsilon",
@@ -159,6 +159,60 @@ class NifExportOperator(Operator, ExportHelper, CommonDevOperator, CommonNif, Co
         description="Export empty NiTransformControllers for armatures in Bethesda games.",
         default=False)
 
+    # Vertex budget for exported convex hull collision shapes.
+    max_hull_vertices: bpy.props.IntProperty(
+        name="Max Hull Vertices",
+        description="Convex hull collision shapes with more vertices are simplified to this many",
+        default=255, min=4, max=65535)
+
+    # Plane budget for exported convex hull collision shapes.
+    max_hull_planes: bpy.props.IntProperty(
+        name="Max Hull Planes",
+        description="Convex hull collision shapes with more face planes are simplified to this many",
+        default=255, min=4, max=65535)
+
+    # Shrink convex hull collision shapes to compensate for the Havok convex radius.
+    shrink_hull_by_radius: bpy.props.BoolProperty(
+        name="Shrink Hulls By Radius",
+        description="Move the planes of convex hull collision shapes inward by the Havok convex radius, "
+                    "so the collision surface matches the mesh",
+        default=False)
+
+    # Number of threads generating MOPP data.
+    mopp_threads: bpy.props.IntProperty(
+        name="MOPP Threads",
+        description="Number of collision shapes to generate MOPP data for at once (0 uses all processors)",
+        default=0, min=0, max=256)
+
+    # Store generated MOPP data on disk and reuse it for unchanged collision shapes.
+    use_mopp_cache: bpy.props.BoolProperty(
+        name="Use MOPP Cache",
+        description="Reuse MOPP data generated by an earlier export for collision shapes that did not change",
+        default=True)
+
+    # Keep exported collision shapes in memory and reuse them for unchanged collision objects.
+    use_collision_cache: bpy.props.BoolProperty(
+        name="Use Collision Cache",
+        description="Reuse the collision shapes exported earlier in this session for collision objects "
+                    "that did not change",
+        default=True)
+
+    # Keep exported geometry in memory and reuse it for unchanged mesh objects.
+    use_geometry_cache: bpy.props.BoolProperty(
+        name="Use Geometry Cache",
+        description="Reuse the geometry exported earlier in this session for mesh objects that did not change. "
+                    "Skinned meshes are always exported again",
+        default=True)
+
+    # How thoroughly to check the NIF data before writing it.
+    validation: bpy.props.EnumProperty(
+        items=[
+            ('STRUCTURAL', "Structural", "Only check links, array counts and reference cycles (fast)"),
+            ('FULL', "Full", "Also run the complete NIF validation (slow on large exports)"),
+        ],
+        name="Validation",
+        description="How thoroughly to check the NIF data before writing it",
+        default='STRUCTURAL')
 
     def draw(self, context):
         pass
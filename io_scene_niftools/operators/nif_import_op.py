@@ -38,7 +38,7 @@
 # ***** END LICENSE BLOCK *****
 
 import bpy
-from bpy.types import Operator
+from bpy.types import Operator, PropertyGroup
 from bpy_extras.io_utils import ImportHelper, orientation_helper
 
 from io_scene_niftools.nif_import import NifImport
@@ -124,6 +124,24 @@ class NifImportOperator(Operator, ImportHelper, CommonScale, CommonDevOperator,
         description="Override detected armature orientation",
         default=False)
 
+    # Store the parsed and scale corrected data on disk for faster repeated imports.
+    use_import_cache: bpy.props.BoolProperty(
+        name="Use Import Cache",
+        description="Cache the parsed and scale corrected file so importing it again with the same settings "
+                    "skips parsing",
+        default=False)
+
+    # Selected files, all of them are imported.
+    files: bpy.props.CollectionProperty(type=PropertyGroup)
+
+    # Number of processes reading several selected files in parallel.
+    parse_processes: bpy.props.IntProperty(
+        name="Parse Processes",
+        description="Number of processes reading and preparing the files when several are imported, "
+                    "on Linux only. 0 uses all cores",
+        default=1,
+        min=0)
+
     def draw(self, context):
         pass
 
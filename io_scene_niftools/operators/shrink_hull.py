@@ -1,42 +1,61 @@
-import bmesh
 import bpy
+import numpy as np
 from bpy.types import Operator
+from io_scene_niftools.modules.nif_export.collision.havok.hull import shrink_hull
 from io_scene_niftools.utils.decorators import register_classes, unregister_classes
+from io_scene_niftools.utils.logging import NifError
+
+
+def shrink_object_hull(b_obj, distance):
+    """Shrink the convex hull of a mesh object by distance in world space, writing the vertices back in place.
+    Returns whether the shrunk hull is valid."""
+    b_mesh = b_obj.data
+    b_verts = np.empty(len(b_mesh.vertices) * 3, dtype=np.float32)
+    b_mesh.vertices.foreach_get("co", b_verts)
+
+    # shrink in world space so that the offset is not distorted by the object scale
+    b_matrix = np.array(b_obj.matrix_world)
+    b_verts = b_verts.reshape(-1, 3) @ b_matrix[:3, :3].T + b_matrix[:3, 3]
+    b_verts, is_valid = shrink_hull(b_verts, distance)
+    b_verts = (b_verts - b_matrix[:3, 3]) @ np.linalg.inv(b_matrix[:3, :3]).T
+
+    b_mesh.vertices.foreach_set("co", b_verts.astype(np.float32).ravel())
+    b_mesh.update()
+    return is_valid
 
 
 class OperatorShrinkHull(Operator):
     """Shrink Collision Hull"""
     bl_idname = "niftools.shrink_hull"
     bl_label = "Shrink Collision Hull"
-    bl_description = "Shrink the collision hull inward by the shrink offset"
+    bl_description = "Shrink the collision hulls of the selected objects inward by their shrink offset"
+    bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        obj = context.active_object
-        if not obj or not obj.data:
-            self.report({'WARNING'}, "No active object with mesh data found")
+        b_objs = [b_obj for b_obj in context.selected_objects if b_obj.type == 'MESH']
+        if context.active_object and context.active_object.type == 'MESH' and context.active_object not in b_objs:
+            b_objs.append(context.active_object)
+        if not b_objs:
+            self.report({'WARNING'}, "No selected object with mesh data found")
             return {'CANCELLED'}
 
-        if obj.type != 'MESH':
-            self.report({'WARNING'}, f"{obj.name} is not a mesh. Skipping")
-            return {'CANCELLED'}
-
-        # Enter edit mode
-        bpy.context.view_layer.objects.active = obj
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(obj.data)
-
-        bm.normal_update()
-
-        # Offset each vertex along its normal
-        for vert in bm.verts:
-            if vert.select:  # Process only selected vertices
-                vert.co -= vert.normal * obj.nif_collision.shrink_offset
+        # mesh data can only be written outside edit mode
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
 
-        # Update the mesh and return to object mode
-        bmesh.update_edit_mesh(obj.data)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        shrunk = 0
+        for b_obj in b_objs:
+            try:
+                is_valid = shrink_object_hull(b_obj, b_obj.nif_collision.shrink_offset)
+            except NifError as e:
+                self.report({'WARNING'}, f"{b_obj.name}: {e}. Skipping")
+                continue
+            if not is_valid:
+                self.report({'WARNING'}, f"Shrink offset {b_obj.nif_collision.shrink_offset} collapses the hull of "
+                                         f"{b_obj.name}, check the result")
+            shrunk += 1
 
-        self.report({'INFO'}, f"Shrank collision hull by {obj.nif_collision.shrink_offset}")
+        self.report({'INFO'}, f"Shrank {shrunk} collision hull(s)")
         return {'FINISHED'}
 
 
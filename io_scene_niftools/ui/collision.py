@@ -39,6 +39,7 @@
 
 
 from bpy.types import Panel
+from io_scene_niftools.operators.collision_generator import OperatorGenerateCollision
 from io_scene_niftools.operators.shrink_hull import OperatorShrinkHull
 
 from io_scene_niftools.utils.decorators import register_classes, unregister_classes
@@ -84,9 +85,29 @@ class CollisionPanel(Panel):
         box.operator("niftools.shrink_hull", text='Shrink Hull')
 
 
+class CollisionGeneratorPanel(Panel):
+    bl_idname = "NIFTOOLS_PT_CollisionGeneratorPanel"
+    bl_label = "NifTools Collision Generator"
+
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "physics"
+
+    @classmethod
+    def poll(cls, context):
+        b_obj = context.active_object
+        return b_obj is not None and b_obj.type == 'MESH' and not b_obj.rigid_body
+
+    def draw(self, context):
+        layout = self.layout
+        layout.operator("niftools.generate_collision", text='Generate Collision')
+
+
 classes = [
     CollisionPanel,
-    OperatorShrinkHull
+    CollisionGeneratorPanel,
+    OperatorShrinkHull,
+    OperatorGenerateCollision
 ]
 
 
@@ -73,6 +73,10 @@ class OperatorCommonDevPanel(OperatorSetting, Panel):
         layout.prop(operator, "pyffi_log_level")
         layout.prop(operator, "plugin_log_level")
         layout.prop(operator, "epsilon")
+        layout.prop(operator, "cache_directory")
+        layout.prop(operator, "cache_size")
+        layout.prop(operator, "timing_report")
+        layout.prop(operator, "memory_report")
 
 
 CLASSES = [OperatorCommonDevPanel]
@@ -148,6 +148,14 @@ class OperatorExportOptimisePanel(OperatorSetting, Panel):
         layout.prop(operator, "force_dds")
         layout.prop(operator, "optimise_materials")
         layout.prop(operator, "sep_tangent_space")
+        layout.prop(operator, "max_hull_vertices")
+        layout.prop(operator, "max_hull_planes")
+        layout.prop(operator, "shrink_hull_by_radius")
+        layout.prop(operator, "mopp_threads")
+        layout.prop(operator, "use_mopp_cache")
+        layout.prop(operator, "use_collision_cache")
+        layout.prop(operator, "use_geometry_cache")
+        layout.prop(operator, "validation")
 
 class OperatorExportIncludePanel(OperatorSetting, Panel):
     bl_label = "Include"
@@ -68,6 +68,8 @@ class OperatorImportIncludePanel(OperatorSetting, Panel):
 
         layout.prop(operator, "process")
         layout.prop(operator, "override_scene_info")
+        layout.prop(operator, "use_import_cache")
+        layout.prop(operator, "parse_processes")
 
 
 class OperatorImportTransformPanel(OperatorSetting, Panel):
@@ -0,0 +1,148 @@
+"""Size-capped on-disk cache of pickled objects, shared by the import and export caches."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+from io_scene_niftools.utils.instrumentation import instrumentation
+from io_scene_niftools.utils.logging import NifLog
+
+
+DEFAULT_CACHE_SIZE = 1024  # In megabytes
+
+
+def default_cache_directory():
+    return os.path.join(tempfile.gettempdir(), "niftools_cache")
+
+
+class DiskCache:
+    """
+    Least-recently-used cache of pickled objects in a local directory.
+    Every entry is one file named after the hash of its key; reading an entry refreshes its modification time,
+    and the oldest entries are deleted once the directory grows past the size limit.
+    """
+
+    extension = ".pickle"
+
+    def __init__(self, name, directory="", max_size=DEFAULT_CACHE_SIZE):
+        """
+        :param name: Sub directory for this kind of cache entry.
+        :param directory: Root cache directory, defaults to the system's temporary directory.
+        :param max_size: Size limit in megabytes.
+        """
+        self.name = name
+        self.directory = os.path.join(directory or default_cache_directory(), name)
+        self.max_size = max_size * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(*parts):
+        """Hash any number of reprable key parts into a file name safe key."""
+        return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+    def get_path(self, key):
+        return os.path.join(self.directory, key + self.extension)
+
+    def get(self, key):
+        """Return the cached object for key, or None if it is not cached or could not be read."""
+        path = self.get_path(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            instrumentation.count(f"{self.name}_cache_misses")
+            return None
+        try:
+            with open(path, "rb") as stream:
+                value = pickle.load(stream)
+        except Exception as e:
+            # stale entries from an older addon or library version may no longer unpickle
+            NifLog.warn(f"Discarding unreadable cache entry {path}: {e}")
+            self.remove(key)
+            self.misses += 1
+            instrumentation.count(f"{self.name}_cache_misses")
+            return None
+        os.utime(path)
+        self.hits += 1
+        instrumentation.count(f"{self.name}_cache_hits")
+        return value
+
+    def put(self, key, value):
+        """Store value under key, then evict the least recently used entries over the size limit."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.get_path(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as stream:
+                pickle.dump(value, stream, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            NifLog.warn(f"Could not store cache entry {path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        os.replace(temp_path, path)
+        self.evict()
+        return True
+
+    def remove(self, key):
+        path = self.get_path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def evict(self):
+        """Delete the least recently used entries until the cache fits in its size limit."""
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith(self.extension):
+                stat = os.stat(os.path.join(self.directory, file_name))
+                entries.append((stat.st_mtime, stat.st_size, file_name))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, file_name in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            NifLog.debug(f"Evicting cache entry {file_name}")
+            os.remove(os.path.join(self.directory, file_name))
+            total_size -= size
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for file_name in os.listdir(self.directory):
+                if file_name.endswith(self.extension):
+                    os.remove(os.path.join(self.directory, file_name))
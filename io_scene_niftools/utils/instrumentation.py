@@ -0,0 +1,254 @@
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import functools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from io_scene_niftools.utils.logging import NifLog
+
+MEMORY_TRACE_FRAMES = 8
+"""Stack depth recorded per allocation, deep enough to attribute nifgen allocations to the addon code calling it."""
+
+MEMORY_TOP_ENTRIES = 25
+"""Number of allocation sites and modules listed in the memory report."""
+
+ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class Instrumentation:
+    """
+    Wall clock timers for the stages of an import or export, and counters for the work they did.
+    Stages may nest; the time of a nested stage is also included in the stages around it, but a stage that is
+    entered again while it is running, such as a recursive call, is only timed once.
+    While disabled, stages and counters cost a single attribute check.
+
+    In memory mode, allocations are traced with :mod:`tracemalloc`. Every stage records the peak of traced memory
+    above the memory at its start, and the memory it retained. At the end of every outermost stage that reached a new
+    high of traced memory a snapshot is taken, and the allocations of the highest snapshot are reported.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.start_time = 0.0
+        self.stages = {}
+        self.counters = {}
+        self._active = set()
+        self._memory_frames = []
+        self._snapshot = None
+        self._snapshot_stage = None
+        self._snapshot_size = 0
+        self._memory_peak = 0
+
+    def start(self, enabled, memory=False):
+        """Reset all timers and counters and switch instrumentation on or off for the next run."""
+        self.stop()
+        self.enabled = enabled or memory
+        self.memory = memory
+        self.start_time = time.perf_counter()
+        self.stages = {}
+        self.counters = {}
+        self._active = set()
+        self._memory_frames = []
+        self._snapshot = None
+        self._snapshot_stage = None
+        self._snapshot_size = 0
+        self._memory_peak = 0
+        if memory:
+            tracemalloc.start(MEMORY_TRACE_FRAMES)
+
+    def stop(self):
+        """Stop tracing allocations, which slows down all Python code while it runs."""
+        if self.memory and tracemalloc.is_tracing():
+            # keep the peak for the report, which may be written after tracing stopped
+            self._memory_peak = max(self._memory_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    @contextmanager
+    def stage(self, name):
+        """Time the body of the with statement as the given stage."""
+        if not self.enabled or name in self._active:
+            yield
+            return
+        self._active.add(name)
+        if self.memory:
+            self._enter_memory()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._active.discard(name)
+            stage = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+            stage["seconds"] += seconds
+            stage["calls"] += 1
+            if self.memory:
+                self._exit_memory(name, stage)
+
+    def _enter_memory(self):
+        current, peak = tracemalloc.get_traced_memory()
+        self._memory_peak = max(self._memory_peak, peak)
+        # the peak is reset for every stage, so carry the peak so far over to the stages around it
+        for frame in self._memory_frames:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        self._memory_frames.append([current, current])
+
+    def _exit_memory(self, name, stage):
+        current, peak = tracemalloc.get_traced_memory()
+        start, stage_peak = self._memory_frames.pop()
+        stage_peak = max(stage_peak, peak)
+        self._memory_peak = max(self._memory_peak, stage_peak)
+        if self._memory_frames:
+            self._memory_frames[-1][1] = max(self._memory_frames[-1][1], stage_peak)
+        tracemalloc.reset_peak()
+        stage["memory_peak"] = max(stage.get("memory_peak", 0), stage_peak - start)
+        stage["memory_retained"] = stage.get("memory_retained", 0) + current - start
+
+        # snapshots are slow, only take them at the boundaries of the pipeline at a new high of traced memory
+        if not self._memory_frames and current > self._snapshot_size:
+            self._snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ))
+            self._snapshot_stage = name
+            self._snapshot_size = current
+
+    def timed(self, name):
+        """Decorator timing every call of a function as the given stage."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.stage(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def as_dict(self):
+        report = {
+            "total_seconds": time.perf_counter() - self.start_time,
+            "stages": self.stages,
+            "counters": self.counters,
+        }
+        if self.memory:
+            report["memory"] = self.memory_report()
+        return report
+
+    def memory_report(self):
+        """Peak traced memory, and the largest allocation sites and modules at the highest snapshot."""
+        peak = self._memory_peak
+        if tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        report = {"peak": peak,
+                  "snapshot_stage": self._snapshot_stage,
+                  "snapshot_size": self._snapshot_size,
+                  "sites": [],
+                  "modules": []}
+        if not self._snapshot:
+            return report
+
+        # modules get the memory they allocated, such as nifgen for its structs, while the allocation sites are the
+        # innermost addon code responsible for the allocation
+        sites = {}
+        modules = {}
+        module_names = {}
+        for statistic in self._snapshot.statistics("traceback"):
+            frames = tuple(reversed(statistic.traceback))
+            file_name = frames[0].filename
+            if file_name not in module_names:
+                module_names[file_name] = module_name(file_name)
+            module = module_names[file_name]
+            modules[module] = modules.get(module, 0) + statistic.size
+            frame = next((frame for frame in frames if frame.filename.startswith(ADDON_ROOT)), frames[0])
+            site = sites.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+            site[0] += statistic.size
+            site[1] += statistic.count
+        report["sites"] = [{"site": site, "size": size, "count": count} for site, (size, count) in
+                           sorted(sites.items(), key=lambda item: item[1][0], reverse=True)[:MEMORY_TOP_ENTRIES]]
+        report["modules"] = [{"module": module, "size": size} for module, size in
+                             sorted(modules.items(), key=lambda item: item[1], reverse=True)[:MEMORY_TOP_ENTRIES]]
+        return report
+
+    def summary(self):
+        """One line overview of the slowest stages and all counters."""
+        total_seconds = time.perf_counter() - self.start_time
+        stages = sorted(self.stages.items(), key=lambda item: item[1]["seconds"], reverse=True)
+        parts = [f"{name} {stage['seconds']:.2f}s" for name, stage in stages]
+        parts += [f"{name} {value}" for name, value in sorted(self.counters.items())]
+        if self.memory:
+            parts.append(f"peak memory {self._memory_peak / 2 ** 20:.1f}MB")
+        return f"Total {total_seconds:.2f}s: " + ", ".join(parts)
+
+    def write_report(self, file_path):
+        """Write the timers and counters as JSON, return the path of the report."""
+        report_path = file_path + ".timing.json"
+        try:
+            with open(report_path, "w") as stream:
+                json.dump(self.as_dict(), stream, indent=2, sort_keys=True)
+        except OSError as e:
+            NifLog.warn(f"Could not write timing report {report_path}: {e}")
+            return None
+        return report_path
+
+
+def module_name(file_path):
+    """Dotted module name of a source file in the addon or on sys.path, or the file path itself."""
+    file_path = os.path.abspath(file_path)
+    for root in sorted((os.path.abspath(path) for path in [os.path.dirname(ADDON_ROOT)] + sys.path if path),
+                       key=len, reverse=True):
+        if file_path.startswith(root + os.sep):
+            module = os.path.splitext(os.path.relpath(file_path, root))[0].replace(os.sep, ".")
+            return module[:-len(".__init__")] if module.endswith(".__init__") else module
+    return file_path
+
+
+instrumentation = Instrumentation()
@@ -38,8 +38,9 @@
 # ***** END LICENSE BLOCK *****
 
 
-import inspect
 import logging
+import sys
+from contextlib import contextmanager
 
 from io_scene_niftools.utils.consts import LOGGER_PYFFI, LOGGER_PLUGIN
 
@@ -55,31 +56,78 @@ class NifLog:
     """
     A simple custom exception class for export errors.
     This module require initialisation of an operator reference to function.
+
+    Messages below the plugin log level are dropped before they are formatted, so messages can also be passed as
+    callables returning the message, which are only called when the message is logged. Every distinct message is
+    logged once per run, and only the first :attr:`NifLog.report_limit` messages of each level are reported to the
+    operator. Repeated and unreported messages are summarized by :meth:`NifLog.report_summary` at the end of the run.
     """
 
     # Injectable operator reference used to perform reporting, default to simple logging
     op = _MockOperator()
 
+    # Messages below this level are discarded, log everything until initialised with an operator
+    level = logging.DEBUG
+
+    # Number of operator reports per level in a run, further messages only go to the console
+    report_limit = 100
+
+    # Occurrences of each (level, message) in this run
+    _counts = {}
+
+    # Number of operator reports per level in this run
+    _reports = {}
+
+    _report_types = {
+        logging.DEBUG: 'DEBUG',
+        logging.INFO: 'INFO',
+        logging.WARNING: 'WARNING',
+        logging.ERROR: 'ERROR',
+    }
+
+    @staticmethod
+    def _log(level, message):
+        if level < NifLog.level:
+            return
+        if callable(message):
+            message = message()
+        message = str(message)
+
+        key = (level, message)
+        count = NifLog._counts.get(key, 0)
+        NifLog._counts[key] = count + 1
+        if count:
+            # repeated messages are counted and summarized at the end of the run
+            return
+
+        logging.getLogger(LOGGER_PLUGIN).log(level, message)
+        reports = NifLog._reports.get(level, 0)
+        NifLog._reports[level] = reports + 1
+        if reports < NifLog.report_limit:
+            NifLog.op.report({NifLog._report_types[level]}, message)
+
+    @staticmethod
+    def is_enabled(level):
+        """Whether messages of the given logging level are logged, to skip gathering data for them."""
+        return level >= NifLog.level
+
     @staticmethod
     def debug(message):
         """Report a debug message."""
 
-        NifLog.op.report({'DEBUG'}, str(message))
-        logging.getLogger("niftools").debug(str(message))
+        NifLog._log(logging.DEBUG, message)
 
     @staticmethod
     def info(message):
         """Report an informative message."""
 
-        NifLog.op.report({'INFO'}, str(message))
-        logging.getLogger("niftools").info(str(message))
+        NifLog._log(logging.INFO, message)
 
     @staticmethod
     def warn(message):
         """Report a warning message."""
 
-        NifLog.op.report({'WARNING'}, str(message))
-        logging.getLogger("niftools").warning(str(message))
+        NifLog._log(logging.WARNING, message)
 
     @staticmethod
     def error(message):
@@ -90,6 +138,7 @@ class NifLog:
             return error('Something went wrong.')
 
         Blender will raise an exception that is passed to the caller.
+        Errors are always reported, regardless of log level and report limit.
 
         .. seealso::
 
@@ -97,29 +146,92 @@ class NifLog:
         """
 
         NifLog.op.report({'ERROR'}, message)
-        logging.getLogger("niftools").error(str(message))
+        logging.getLogger(LOGGER_PLUGIN).error(str(message))
         return {'FINISHED'}
 
+    @staticmethod
+    def report_summary():
+        """Report the repeated and unreported messages of this run, and start counting anew."""
+
+        repeated = sorted(((count, level, message) for (level, message), count in NifLog._counts.items()
+                           if count > 1), reverse=True)
+        for count, level, message in repeated[:NifLog.report_limit]:
+            summary = f"{message} (×{count})"
+            logging.getLogger(LOGGER_PLUGIN).log(level, summary)
+            NifLog.op.report({NifLog._report_types[level]}, summary)
+        if len(repeated) > NifLog.report_limit:
+            NifLog.op.report({'INFO'}, f"{len(repeated) - NifLog.report_limit} more messages were repeated")
+
+        unreported = sum(max(0, reports - NifLog.report_limit) for reports in NifLog._reports.values())
+        if unreported:
+            NifLog.op.report({'INFO'}, f"{unreported} messages were only logged to the console")
+        NifLog.reset()
+
+    @staticmethod
+    def detach():
+        """Log to the console only, for worker processes that have no operator to report to."""
+        NifLog.op = _MockOperator()
+
+    @staticmethod
+    def reset():
+        NifLog._counts = {}
+        NifLog._reports = {}
+
     @staticmethod
     def init(operator):
         NifLog.op = operator
+        NifLog.reset()
 
         niftools_level_num = getattr(logging, operator.properties.plugin_log_level)
         logging.getLogger(LOGGER_PLUGIN).setLevel(niftools_level_num)
+        NifLog.level = niftools_level_num
 
         pyffi_level_num = getattr(logging, operator.properties.pyffi_log_level)
         logging.getLogger(LOGGER_PYFFI).setLevel(pyffi_level_num)
 
 
+_error_context = []
+
+
+@contextmanager
+def error_context(**context):
+    """
+    Attach context to the NifErrors raised in the body of the with statement, such as the ``stage`` of the pipeline,
+    the nif ``block`` or the blender object ``b_obj`` being processed. Nested contexts of the same key form a path.
+    """
+    _error_context.append(context)
+    try:
+        yield
+    finally:
+        _error_context.pop()
+
+
+def _describe(value):
+    name = getattr(value, "name", None)
+    if name is None:
+        return str(value)
+    return f"{type(value).__name__} '{name}'"
+
+
 class NifError(Exception):
     """A simple custom exception class for export errors."""
 
     def __init__(self, msg):
-        caller = inspect.getframeinfo(inspect.stack()[1][0])
-        NifLog.error(f"{msg:s}")
-        NifLog.error(f"{caller.filename:s}:{caller.lineno:d}")
+        super().__init__(msg)
+        # the frame of the caller is all that is needed, so do not collect the whole stack with its source
+        caller = sys._getframe(1)
+        self.filename = caller.f_code.co_filename
+        self.lineno = caller.f_lineno
+        self.context = {}
+        for context in _error_context:
+            for key, value in context.items():
+                self.context.setdefault(key, []).append(value)
 
-    pass
+        NifLog.error(f"{msg:s}")
+        NifLog.error(f"{self.filename:s}:{self.lineno:d}")
+        if self.context:
+            NifLog.error("While processing " + ", ".join(
+                f"{key} {' > '.join(_describe(value) for value in values)}" for key, values in self.context.items()))
 
 
 def init_loggers():
@@ -1,8 +1,5 @@
 # adapted from https://raw.githubusercontent.com/JuhaW/NodeArrange/master/__init__.py
 
-from collections import OrderedDict
-from itertools import repeat
-
 
 class values():
     average_y = 0
@@ -18,6 +15,7 @@ def nodes_iterate(ntree, nodeoutput):
 
     while a[level]:
         a.append([])
+        queued = set()
         # print (f"level: {level}")
 
         for node in a[level]:
@@ -31,6 +29,10 @@ def nodes_iterate(ntree, nodeoutput):
                         # dont add parented nodes (inside frame) to list
                         # if not nlinks.from_node.parent:
                         node1 = nlinks.from_node
+                        # skip nodes already queued at this level, so shared branches are not walked repeatedly
+                        if node1 in queued:
+                            continue
+                        queued.add(node1)
                         # print (f"appending node: {node1}")
                         a[level + 1].append(node1)
 
@@ -44,24 +46,14 @@ def nodes_iterate(ntree, nodeoutput):
     del a[level]
     level -= 1
 
-    # remove duplicate nodes at the same level, first wins
-    for x, nodes in enumerate(a):
-        a[x] = list(OrderedDict(zip(a[x], repeat(None))))
-    # print ("Duplicate nodes removed")
-
     # remove duplicate nodes in all levels, last wins
-    top = level
-    for row1 in range(top, 1, -1):
-        # print (f"row1: {row1} {a[row1]}")
-        for col1 in a[row1]:
-            # print (f"col1: {col1}")
-            for row2 in range(row1 - 1, 0, -1):
-                for col2 in a[row2]:
-                    if col1 == col2:
-                        # print (f"Duplicate node found: {col1}")
-                        # print (f"Delete node: {col2}")
-                        a[row2].remove(col2)
-                        break
+    # the output node at level 0 is never moved
+    deepest_level = {}
+    for row, nodes in enumerate(a[1:], start=1):
+        for node in nodes:
+            deepest_level[node] = row
+    for row in range(1, level + 1):
+        a[row] = [node for node in a[row] if deepest_level[node] == row]
 
     levelmax = level + 1
     level = 0
@@ -0,0 +1,210 @@
+"""Performance benchmarks of the blender nif scripts."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from abc import ABC, abstractmethod
+
+import bpy
+
+BENCHMARK_ROOT = os.path.dirname(__file__)
+GEN_DIR = os.path.join(BENCHMARK_ROOT, "gen")
+RESULTS_DIR = os.path.join(BENCHMARK_ROOT, "results")
+CURRENT_RESULTS = os.path.join(RESULTS_DIR, "current.json")
+BASELINE_RESULTS = os.path.join(RESULTS_DIR, "baseline.json")
+
+REPEATS = int(os.environ.get("NIFTOOLS_BENCHMARK_REPEATS", 5))
+"""Number of timed runs per measurement, their median is the reported time."""
+
+SAVE_BASELINE = bool(os.environ.get("NIFTOOLS_BENCHMARK_SAVE_BASELINE"))
+"""Also store the results as the new baseline."""
+
+ENABLED = bool(os.environ.get("NIFTOOLS_BENCHMARK"))
+"""Whether to collect the benchmarks, set by blender-nosetests.py when the benchmark package is selected."""
+
+
+def setup():
+    """Enables the nif scripts addon, so all benchmarks can use it."""
+    bpy.ops.wm.addon_enable(module="io_scene_niftools")
+
+
+def teardown():
+    """Disables the nif scripts addon."""
+    bpy.ops.wm.addon_disable(module="io_scene_niftools")
+
+
+def b_clear():
+    """Start from an empty scene, keeping the enabled addons."""
+    if bpy.context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+    bpy.ops.wm.read_homefile(use_empty=True)
+
+
+def measure(func, prepare=None, repeats=REPEATS):
+    """
+    Time repeated calls of func, each after calling prepare, and the stage timings the addon reported for them.
+    Peak memory of Python allocations is measured in one extra untimed run, as tracing slows down the code.
+    """
+    from io_scene_niftools.utils.instrumentation import instrumentation
+
+    runs = []
+    stage_runs = {}
+    for _ in range(repeats):
+        if prepare:
+            prepare()
+        start = time.perf_counter()
+        func()
+        runs.append(time.perf_counter() - start)
+        for name, stage in instrumentation.stages.items():
+            stage_runs.setdefault(name, []).append(stage["seconds"])
+    counters = dict(instrumentation.counters)
+
+    if prepare:
+        prepare()
+    tracemalloc.start()
+    try:
+        func()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "runs": runs,
+        "median": statistics.median(runs),
+        "peak_memory": peak_memory,
+        "counters": counters,
+        "stages": {name: {"runs": stage_runs[name], "median": statistics.median(stage_runs[name])}
+                   for name in stage_runs},
+    }
+
+
+def load_results(file_path):
+    if not os.path.exists(file_path):
+        return {"meta": {}, "scenarios": {}}
+    with open(file_path) as stream:
+        return json.load(stream)
+
+
+def record_results(scenario, result):
+    """Merge the result of one scenario into the current results, and into the baseline if requested."""
+    from io_scene_niftools import bl_info
+
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    for file_path in (CURRENT_RESULTS, BASELINE_RESULTS) if SAVE_BASELINE else (CURRENT_RESULTS,):
+        results = load_results(file_path)
+        results["meta"] = {
+            "addon_version": ".".join(str(i) for i in bl_info["version"]),
+            "blender_version": bpy.app.version_string,
+            "platform": platform.platform(),
+            "python_version": platform.python_version(),
+            "repeats": REPEATS,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        results["scenarios"][scenario] = result
+        with open(file_path, "w") as stream:
+            json.dump(results, stream, indent=2, sort_keys=True)
+
+
+class Benchmark(ABC):
+    """
+    Base class for benchmarks of one scenario at several scales.
+
+    For every scale in :attr:`Benchmark.scales`, the scene built by :meth:`Benchmark.b_create_data` is exported and
+    the exported file is imported again, each timed :data:`REPEATS` times. The results are stored in
+    ``results/current.json`` under ``<scenario>/<scale>``, together with the throughput in items per second.
+    """
+
+    # keep the slow benchmarks out of the default test discovery
+    __test__ = ENABLED
+
+    scenario = None
+    """Name of the scenario, also used for the generated file names."""
+
+    scales = ()
+    """Number of items (vertices, bones, keys, sub shapes) to benchmark with."""
+
+    n_game = 'SKYRIM_SE'
+    """Game for nif export."""
+
+    file_ext = ".nif"
+
+    @abstractmethod
+    def b_create_data(self, scale):
+        """Create the blender scene of the given scale."""
+
+    def n_export(self, n_filepath):
+        bpy.ops.export_scene.nif(filepath=n_filepath, use_visible=True, timing_report=True, use_mopp_cache=False,
+                                 use_collision_cache=False, use_geometry_cache=False)
+
+    def n_import(self, n_filepath):
+        bpy.ops.import_scene.nif(filepath=n_filepath, timing_report=True, use_import_cache=False)
+
+    def prepare_export(self):
+        """Called before every timed export."""
+
+    def prepare_import(self):
+        """Called before every timed import; starts from an empty scene by default."""
+        b_clear()
+
+    def test_scales(self):
+        for scale in self.scales:
+            yield self.run_scale, scale
+
+    def run_scale(self, scale):
+        b_clear()
+        bpy.context.scene.niftools_scene.game = self.n_game
+        self.b_create_data(scale)
+
+        os.makedirs(GEN_DIR, exist_ok=True)
+        n_filepath = os.path.join(GEN_DIR, f"{self.scenario}_{scale}{self.file_ext}")
+        export_result = measure(lambda: self.n_export(n_filepath), self.prepare_export)
+        import_result = measure(lambda: self.n_import(n_filepath), self.prepare_import)
+
+        for result in (export_result, import_result):
+            result["items_per_second"] = scale / result["median"] if result["median"] > 0.0 else 0.0
+        record_results(f"{self.scenario}/{scale}", {
+            "items": scale,
+            "file_size": os.path.getsize(n_filepath),
+            "export": export_result,
+            "import": import_result,
+        })
@@ -0,0 +1,159 @@
+"""Parametric blender scene generators of controlled size for the benchmarks."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import math
+
+import bpy
+import numpy as np
+
+
+def b_link(b_obj):
+    bpy.context.scene.collection.objects.link(b_obj)
+    return b_obj
+
+
+def b_create_grid_mesh(b_name, num_vertices, size=10.0):
+    """Create a square grid mesh object with at least num_vertices vertices, every quad split into two triangles."""
+    side = max(2, math.ceil(math.sqrt(num_vertices)))
+    coords = np.linspace(-size / 2.0, size / 2.0, side)
+    grid_x, grid_y = np.meshgrid(coords, coords, indexing="ij")
+    # a gentle wave keeps the grid from being flat, so collision hulls and normals are not degenerate
+    grid_z = 0.05 * size * np.sin(grid_x) * np.cos(grid_y)
+    vertices = np.stack((grid_x, grid_y, grid_z), axis=-1).reshape(-1, 3)
+
+    corners = np.arange(side * side).reshape(side, side)[:-1, :-1].ravel()
+    triangles = np.concatenate((np.stack((corners, corners + side, corners + side + 1), axis=-1),
+                                np.stack((corners, corners + side + 1, corners + 1), axis=-1)))
+
+    b_mesh = bpy.data.meshes.new(b_name)
+    b_mesh.vertices.add(len(vertices))
+    b_mesh.vertices.foreach_set("co", vertices.ravel())
+    b_mesh.loops.add(len(triangles) * 3)
+    b_mesh.loops.foreach_set("vertex_index", triangles.ravel())
+    b_mesh.polygons.add(len(triangles))
+    b_mesh.polygons.foreach_set("loop_start", np.arange(0, len(triangles) * 3, 3))
+    b_mesh.polygons.foreach_set("loop_total", np.full(len(triangles), 3))
+    b_mesh.update()
+    b_mesh.validate()
+    b_mesh.materials.append(bpy.data.materials.new(b_name))
+    return b_link(bpy.data.objects.new(b_name, b_mesh))
+
+
+def b_create_armature(b_name, num_bones, length=1.0):
+    """Create an armature object with a chain of num_bones bones along the Y axis."""
+    b_armature_data = bpy.data.armatures.new(b_name)
+    b_armature = b_link(bpy.data.objects.new(b_name, b_armature_data))
+    bpy.context.view_layer.objects.active = b_armature
+    bpy.ops.object.mode_set(mode='EDIT')
+    b_parent = None
+    for i in range(num_bones):
+        b_bone = b_armature_data.edit_bones.new(f"Bone{i:03d}")
+        b_bone.head = (0.0, i * length, 0.0)
+        b_bone.tail = (0.0, (i + 1) * length, 0.0)
+        b_bone.parent = b_parent
+        b_parent = b_bone
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return b_armature
+
+
+def b_create_skinned_mesh(b_name, num_vertices, num_bones):
+    """Create a grid mesh skinned to a bone chain, every vertex weighted to its two nearest bones along Y."""
+    b_armature = b_create_armature(f"{b_name}Armature", num_bones, length=10.0 / num_bones)
+    b_obj = b_create_grid_mesh(b_name, num_vertices)
+    b_obj.location.y = 5.0
+    b_obj.parent = b_armature
+    b_obj.modifiers.new("Armature", 'ARMATURE').object = b_armature
+
+    vertices = np.empty(len(b_obj.data.vertices) * 3)
+    b_obj.data.vertices.foreach_get("co", vertices)
+    position = np.clip((vertices[1::3] + 5.0) / 10.0 * num_bones - 0.5, 0.0, num_bones - 1)
+    lower = np.floor(position).astype(int)
+    upper_weight = position - lower
+    for i in range(num_bones):
+        b_group = b_obj.vertex_groups.new(name=f"Bone{i:03d}")
+        for indices, weights in ((np.flatnonzero(lower == i), 1.0 - upper_weight),
+                                 (np.flatnonzero(lower + 1 == i), upper_weight)):
+            for weight in np.unique(np.round(weights[indices], 2)):
+                subset = indices[np.round(weights[indices], 2) == weight]
+                if weight > 0.0 and len(subset):
+                    b_group.add(subset.tolist(), float(weight), 'REPLACE')
+    return b_obj, b_armature
+
+
+def b_create_animation(b_armature, num_keys):
+    """Animate the rotation and location of every bone of the armature with num_keys keys."""
+    b_action = bpy.data.actions.new(f"{b_armature.name}Action")
+    b_armature.animation_data_create().action = b_action
+    frames = np.arange(1, num_keys + 1, dtype=float)
+    for i, b_bone in enumerate(b_armature.pose.bones):
+        b_bone.rotation_mode = 'QUATERNION'
+        angles = 0.5 * np.sin(frames * 0.1 + i)
+        channels = (("rotation_quaternion", (np.cos(angles / 2.0), np.sin(angles / 2.0), 0.0 * angles,
+                                             0.0 * angles)),
+                    ("location", (0.0 * angles, 0.1 * np.sin(frames * 0.05 + i), 0.0 * angles)))
+        for data_path, values in channels:
+            for index, channel in enumerate(values):
+                fcurve = b_action.fcurves.new(f'pose.bones["{b_bone.name}"].{data_path}', index=index,
+                                              action_group=b_bone.name)
+                fcurve.keyframe_points.add(num_keys)
+                fcurve.keyframe_points.foreach_set("co", np.stack((frames, channel), axis=-1).ravel())
+                fcurve.update()
+    bpy.context.scene.frame_start = 1
+    bpy.context.scene.frame_end = num_keys
+    return b_action
+
+
+def b_create_packed_collision(b_name, num_vertices, num_sub_shapes, havok_materials):
+    """Create a MOPP collision mesh whose faces are split over num_sub_shapes havok materials, under an empty."""
+    b_root = b_link(bpy.data.objects.new(f"{b_name}Root", None))
+    b_obj = b_create_grid_mesh(b_name, num_vertices)
+    b_obj.parent = b_root
+    b_mesh = b_obj.data
+    b_mesh.materials.clear()
+    for name in havok_materials[:num_sub_shapes]:
+        b_mesh.materials.append(bpy.data.materials.get(name) or bpy.data.materials.new(name))
+    num_materials = len(b_mesh.materials)
+    b_mesh.polygons.foreach_set("material_index", np.arange(len(b_mesh.polygons)) * num_materials //
+                                len(b_mesh.polygons))
+
+    with bpy.context.temp_override(selected_objects=[b_obj], object=b_obj, active_object=b_obj):
+        bpy.ops.rigidbody.object_add()
+    b_obj.rigid_body.type = 'PASSIVE'
+    b_obj.rigid_body.collision_shape = 'MESH'
+    return b_obj
@@ -0,0 +1,114 @@
+"""Export and import benchmarks of the main nif scenarios at increasing scales."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+
+import bpy
+
+from benchmark import Benchmark
+from benchmark import b_gen_benchmark
+
+SKYRIM_HAVOK_MATERIALS = (
+    "SKY_HAV_MAT_STONE", "SKY_HAV_MAT_WOOD", "SKY_HAV_MAT_DIRT", "SKY_HAV_MAT_GRASS", "SKY_HAV_MAT_GRAVEL",
+    "SKY_HAV_MAT_SNOW", "SKY_HAV_MAT_GLASS", "SKY_HAV_MAT_ICE", "SKY_HAV_MAT_MUD", "SKY_HAV_MAT_SAND",
+    "SKY_HAV_MAT_WATER", "SKY_HAV_MAT_CLOTH", "SKY_HAV_MAT_BARREL", "SKY_HAV_MAT_BOTTLE", "SKY_HAV_MAT_BONES",
+    "SKY_HAV_MAT_SKIN", "SKY_HAV_MAT_HEAVY_METAL", "SKY_HAV_MAT_LIGHT_WOOD", "SKY_HAV_MAT_HEAVY_STONE",
+    "SKY_HAV_MAT_STAIRS_STONE", "SKY_HAV_MAT_STAIRS_WOOD", "SKY_HAV_MAT_STAIRS_SNOW", "SKY_HAV_MAT_ORGANIC",
+    "SKY_HAV_MAT_BROKEN_STONE", "SKY_HAV_MAT_SOLID_METAL", "SKY_HAV_MAT_MATERIAL_CHAIN",
+    "SKY_HAV_MAT_MATERIAL_BASKET", "SKY_HAV_MAT_MATERIAL_BOWL", "SKY_HAV_MAT_MATERIAL_BOOK",
+    "SKY_HAV_MAT_MATERIAL_POTS_PANS", "SKY_HAV_MAT_MATERIAL_ARMOR_LIGHT", "SKY_HAV_MAT_MATERIAL_ARMOR_HEAVY",
+)
+
+
+class TestBSTriShapeBenchmark(Benchmark):
+    """Static BSTriShape geometry, scaled by vertex count."""
+
+    scenario = "bstrishape"
+    scales = (1000, 10000, 100000)
+
+    def b_create_data(self, scale):
+        b_gen_benchmark.b_create_grid_mesh("Grid", scale)
+
+
+class TestSkinPartitionBenchmark(Benchmark):
+    """Skinned geometry with skin partitions, scaled by bone count."""
+
+    scenario = "skin_partition"
+    scales = (8, 32, 128)
+    n_game = 'SKYRIM'
+
+    def b_create_data(self, scale):
+        b_gen_benchmark.b_create_skinned_mesh("Skin", 10000, scale)
+
+
+class TestKeyframeBenchmark(Benchmark):
+    """Bone animation of a 16 bone armature in a kf file, scaled by keys per bone."""
+
+    scenario = "keyframe"
+    scales = (100, 1000, 10000)
+    file_ext = ".kf"
+
+    def b_create_data(self, scale):
+        self.b_armature = b_gen_benchmark.b_create_armature("Armature", 16)
+        b_gen_benchmark.b_create_animation(self.b_armature, scale)
+
+    def n_export(self, n_filepath):
+        bpy.ops.export_scene.kf(filepath=n_filepath, use_visible=True, timing_report=True)
+
+    def n_import(self, n_filepath):
+        bpy.ops.import_scene.kf(filepath=n_filepath, files=[{"name": os.path.basename(n_filepath)}],
+                                timing_report=True)
+
+    def prepare_import(self):
+        # keep the armature the animation is imported onto, but drop the actions of earlier runs
+        self.b_armature.animation_data_clear()
+        for b_action in tuple(bpy.data.actions):
+            bpy.data.actions.remove(b_action)
+        bpy.context.view_layer.objects.active = self.b_armature
+        self.b_armature.select_set(True)
+
+
+class TestPackedCollisionBenchmark(Benchmark):
+    """MOPP packed triangle collision, scaled by the number of havok material sub shapes."""
+
+    scenario = "packed_collision"
+    scales = (1, 8, 32)
+
+    def b_create_data(self, scale):
+        b_gen_benchmark.b_create_packed_collision("Collision", 10000, scale, SKYRIM_HAVOK_MATERIALS)
@@ -37,6 +37,7 @@
 #
 # ***** END LICENSE BLOCK *****
 
+import os
 import sys
 import nose
 
@@ -50,4 +51,9 @@ Useful additional params:
 """
 # Nose internally uses sys.argv for paramslist, prune extras params from chain, add name param
 sys.argv = ['blender-nosetests'] + sys.argv[6:]
+
+# The benchmarks are slow, so they are only collected when the benchmark package is selected
+if any(arg.replace("\\", "/").startswith("benchmark") for arg in sys.argv[1:]):
+    os.environ["NIFTOOLS_BENCHMARK"] = "1"
+
 nose.run_exit()
@@ -0,0 +1,158 @@
+"""Tests that ragdoll constraints between capsule bodies are imported with their pivots in the rigid body frame."""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import math
+import os
+
+import bpy
+import mathutils
+import nose.tools
+
+import nifgen.formats.nif as NifFormat
+from nifgen.formats.nif import classes as NifClasses
+
+from integration import INTEGRATION_ROOT
+from integration import Base
+
+
+class TestConstraintPivot(Base):
+    """Import a ragdoll of two capsule bodies and check where the constraint pivot is placed."""
+
+    n_path = os.path.join(INTEGRATION_ROOT, "gen", "nif", "collision", "constraint")
+    """Folder of the generated files."""
+
+    n_node_translation = (1.0, 2.0, 3.0)
+    """Translation of the node of the first body."""
+
+    n_body_rotation = (math.cos(math.pi / 4), 0.0, 0.0, math.sin(math.pi / 4))
+    """Rotation (w, x, y, z) of the first bhkRigidBodyT, a quarter turn about z."""
+
+    n_body_translation = (0.1, 0.0, 0.0)
+    """Translation of the first bhkRigidBodyT, in havok units."""
+
+    n_pivot = (0.05, 0.1, 0.0)
+    """Pivot of the constraint in the first body, in havok units."""
+
+    def setup(self):
+        os.makedirs(self.n_path, exist_ok=True)
+        self.n_data = NifFormat.NifFile.from_version(0x14000005, 11, 11)
+
+    def n_create_body(self, n_name, translation, first_point, second_point):
+        """Create a node with a bhkRigidBodyT holding a capsule whose center is away from the body origin."""
+        n_node = NifClasses.NiNode(self.n_data)
+        n_node.name = n_name
+        n_node.rotation.set_identity()
+        n_node.scale = 1.0
+        n_node.translation.x, n_node.translation.y, n_node.translation.z = translation
+
+        n_capsule = NifClasses.BhkCapsuleShape(self.n_data)
+        n_capsule.radius = n_capsule.radius_1 = n_capsule.radius_2 = 0.05
+        n_capsule.first_point.x, n_capsule.first_point.y, n_capsule.first_point.z = first_point
+        n_capsule.second_point.x, n_capsule.second_point.y, n_capsule.second_point.z = second_point
+
+        n_bhk_rigid_body = NifClasses.BhkRigidBodyT(self.n_data)
+        n_bhk_rigid_body.shape = n_capsule
+        n_bhk_rigid_body.rigid_body_info.rotation.w = 1.0
+
+        n_collision_object = NifClasses.BhkCollisionObject(self.n_data)
+        n_collision_object.target = n_node
+        n_collision_object.body = n_bhk_rigid_body
+        n_node.collision_object = n_collision_object
+        return n_node, n_bhk_rigid_body
+
+    def n_create_ragdoll(self):
+        """Write a nif with a ragdoll constraint from the first capsule body to the second."""
+        n_root = NifClasses.NiNode(self.n_data)
+        n_root.name = "Scene Root"
+        n_root.rotation.set_identity()
+        n_root.scale = 1.0
+
+        n_node_a, n_body_a = self.n_create_body("BodyA", self.n_node_translation, (0.2, 0.0, 0.0), (0.6, 0.0, 0.0))
+        n_node_b, n_body_b = self.n_create_body("BodyB", (1.0, 2.0, 0.0), (0.0, 0.0, 0.1), (0.0, 0.0, 0.5))
+        n_root.add_child(n_node_a)
+        n_root.add_child(n_node_b)
+
+        n_info = n_body_a.rigid_body_info
+        (n_info.rotation.w, n_info.rotation.x, n_info.rotation.y, n_info.rotation.z) = self.n_body_rotation
+        n_info.translation.x, n_info.translation.y, n_info.translation.z = self.n_body_translation
+
+        n_bhk_constraint = NifClasses.BhkRagdollConstraint(self.n_data)
+        n_bhk_constraint.constraint_info.num_entities = 2
+        n_bhk_constraint.constraint_info.entity_a = n_body_a
+        n_bhk_constraint.constraint_info.entity_b = n_body_b
+        n_descriptor = n_bhk_constraint.constraint
+        n_descriptor.pivot_a.x, n_descriptor.pivot_a.y, n_descriptor.pivot_a.z = self.n_pivot
+        n_descriptor.twist_a.z = 1.0
+        n_descriptor.plane_a.x = 1.0
+        n_body_a.num_constraints += 1
+        n_body_a.constraints.append(n_bhk_constraint)
+
+        self.n_data.roots = [n_root]
+        n_filepath = os.path.join(self.n_path, "ragdoll_capsules.nif")
+        with open(n_filepath, "wb") as stream:
+            self.n_data.write(stream)
+        return n_filepath
+
+    def b_expected_pivot(self):
+        """World position of the pivot: node, then bhkRigidBodyT, then pivot, without the capsule's centering."""
+        havok_scale = self.n_data.havok_scale
+        b_body_matrix = mathutils.Quaternion(self.n_body_rotation).to_matrix().to_4x4()
+        b_body_matrix.translation = mathutils.Vector(self.n_body_translation) * havok_scale
+        b_node_matrix = mathutils.Matrix.Translation(self.n_node_translation)
+        return b_node_matrix @ b_body_matrix @ (mathutils.Vector(self.n_pivot) * havok_scale)
+
+    def test_pivot_in_rigid_body_frame(self):
+        bpy.ops.import_scene.nif(filepath=self.n_create_ragdoll())
+        bpy.context.view_layer.update()
+
+        b_constr_objs = [b_obj for b_obj in bpy.data.objects if b_obj.rigid_body_constraint]
+        nose.tools.assert_equal(len(b_constr_objs), 1)
+        b_constr_obj = b_constr_objs[0]
+        nose.tools.assert_equal(b_constr_obj.rigid_body_constraint.type, 'GENERIC')
+
+        b_pivot = b_constr_obj.matrix_world.translation
+        b_expected = self.b_expected_pivot()
+        for b_value, b_expected_value in zip(b_pivot, b_expected):
+            nose.tools.assert_almost_equal(b_value, b_expected_value, places=4)
+
+        # the capsule is centered away from the body origin, so its world matrix must not be the pivot frame
+        b_col_obj = b_constr_obj.rigid_body_constraint.object1
+        b_wrong = b_col_obj.matrix_world @ (mathutils.Vector(self.n_pivot) * self.n_data.havok_scale)
+        nose.tools.assert_not_almost_equal((b_wrong - b_expected).length, 0.0, places=4)
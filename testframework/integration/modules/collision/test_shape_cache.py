@@ -0,0 +1,127 @@
+"""Tests that re-exports with collision shapes spliced from the session cache write the same nif as a full export."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+
+import bpy
+import nose.tools
+
+from integration import INTEGRATION_ROOT
+from integration import Base
+
+
+class TestShapeCache(Base):
+    """Export a collision object, export it again with its shapes spliced from the cache, and compare the files."""
+
+    n_game = 'SKYRIM'
+    """Game for nif export."""
+
+    n_path = os.path.join(INTEGRATION_ROOT, "gen", "nif", "collision", "cache")
+    """Folder of the exported files."""
+
+    def setup(self):
+        from io_scene_niftools.modules.nif_export.collision.havok.shape_cache import shape_cache
+        self.shape_cache = shape_cache
+        self.shape_cache.clear()
+        os.makedirs(self.n_path, exist_ok=True)
+        bpy.context.scene.niftools_scene.game = self.n_game
+        self.b_col_obj = self.b_create_collision("Collision", "SKY_HAV_MAT_STONE")
+
+    @staticmethod
+    def b_create_collision(b_name, havok_material):
+        """Create a convex hull collider under an empty, with a havok material."""
+        b_root = bpy.data.objects.new(f"{b_name}Root", None)
+        bpy.context.scene.collection.objects.link(b_root)
+        bpy.ops.mesh.primitive_cube_add(location=(0, 0, 1))
+        b_obj = bpy.context.active_object
+        b_obj.name = b_name
+        b_obj.parent = b_root
+        b_obj.data.materials.append(bpy.data.materials.new(havok_material))
+        bpy.ops.rigidbody.object_add()
+        b_obj.rigid_body.type = 'PASSIVE'
+        b_obj.rigid_body.collision_shape = 'CONVEX_HULL'
+        return b_obj
+
+    def n_export(self, n_name, use_collision_cache=True):
+        bpy.context.view_layer.update()
+        n_filepath = os.path.join(self.n_path, n_name)
+        bpy.ops.export_scene.nif(filepath=n_filepath, use_visible=True, use_mopp_cache=False,
+                                 use_geometry_cache=False, use_collision_cache=use_collision_cache)
+        return n_filepath
+
+    @staticmethod
+    def read_bytes(n_filepath):
+        with open(n_filepath, "rb") as stream:
+            return stream.read()
+
+    def check_invalidated(self, n_name):
+        """Export after a change, which must not reuse the shapes stored by the export before it."""
+        self.n_export(n_name)
+        nose.tools.assert_equal(self.shape_cache.hits, 0)
+        nose.tools.assert_equal(self.shape_cache.misses, 2)
+
+    def test_cache_hit_writes_same_file(self):
+        n_full = self.n_export("full.nif", use_collision_cache=False)
+        self.n_export("stored.nif")
+        nose.tools.assert_equal(self.shape_cache.hits, 0)
+
+        n_spliced = self.n_export("spliced.nif")
+        nose.tools.assert_equal(self.shape_cache.hits, 1)
+        nose.tools.assert_equal(self.read_bytes(n_full), self.read_bytes(n_spliced))
+
+    def test_mesh_change_invalidates_entry(self):
+        self.n_export("mesh_before.nif")
+        self.b_col_obj.data.vertices[0].co.x += 0.5
+        self.b_col_obj.data.update()
+        self.check_invalidated("mesh_after.nif")
+
+    def test_transform_change_invalidates_entry(self):
+        self.n_export("transform_before.nif")
+        self.b_col_obj.location.x += 1.0
+        self.check_invalidated("transform_after.nif")
+
+    def test_margin_change_invalidates_entry(self):
+        self.n_export("margin_before.nif")
+        self.b_col_obj.rigid_body.collision_margin += 0.1
+        self.check_invalidated("margin_after.nif")
+
+    def test_havok_material_change_invalidates_entry(self):
+        self.n_export("material_before.nif")
+        self.b_col_obj.data.materials[0] = bpy.data.materials.new("SKY_HAV_MAT_WOOD")
+        self.check_invalidated("material_after.nif")
@@ -0,0 +1,122 @@
+"""Tests that re-exports with geometry spliced from the session cache write the same nif as a full export."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import os
+
+import bpy
+import nose.tools
+
+from integration import INTEGRATION_ROOT
+from integration import Base
+
+
+class TestGeometryCache(Base):
+    """Export a scene, export it again with its geometry spliced from the cache, and compare the files."""
+
+    n_game = 'OBLIVION'
+    """Game for nif export."""
+
+    n_path = os.path.join(INTEGRATION_ROOT, "gen", "nif", "geometry", "cache")
+    """Folder of the exported files."""
+
+    def setup(self):
+        from io_scene_niftools.modules.nif_export.geometry.geometry_cache import geometry_cache
+        self.geometry_cache = geometry_cache
+        self.geometry_cache.clear()
+        os.makedirs(self.n_path, exist_ok=True)
+        bpy.context.scene.niftools_scene.game = self.n_game
+
+    @staticmethod
+    def b_create_cube(b_name, location, b_mat):
+        bpy.ops.mesh.primitive_cube_add(location=location)
+        b_obj = bpy.context.active_object
+        b_obj.name = b_name
+        b_obj.data.materials.append(b_mat)
+        return b_obj
+
+    def n_export(self, n_name, use_geometry_cache=True):
+        n_filepath = os.path.join(self.n_path, n_name)
+        bpy.ops.export_scene.nif(filepath=n_filepath, use_visible=True, use_geometry_cache=use_geometry_cache)
+        return n_filepath
+
+    @staticmethod
+    def read_bytes(n_filepath):
+        with open(n_filepath, "rb") as stream:
+            return stream.read()
+
+    def test_cache_hit_writes_same_file(self):
+        self.b_create_cube("CubeA", (-2, 0, 0), bpy.data.materials.new("MaterialA"))
+        self.b_create_cube("CubeB", (2, 0, 0), bpy.data.materials.new("MaterialB"))
+        n_full = self.n_export("full.nif", use_geometry_cache=False)
+        self.n_export("stored.nif")
+        nose.tools.assert_equal(self.geometry_cache.hits, 0)
+
+        n_spliced = self.n_export("spliced.nif")
+        nose.tools.assert_equal(self.geometry_cache.hits, 2)
+        nose.tools.assert_equal(self.read_bytes(n_full), self.read_bytes(n_spliced))
+
+    def test_cache_hit_keeps_shared_properties(self):
+        # both objects use the same property blocks, also when their geometry is spliced from the cache
+        b_mat = bpy.data.materials.new("Material")
+        self.b_create_cube("CubeA", (-2, 0, 0), b_mat)
+        self.b_create_cube("CubeB", (2, 0, 0), b_mat)
+        n_full = self.n_export("shared_full.nif", use_geometry_cache=False)
+        self.n_export("shared_stored.nif")
+
+        n_spliced = self.n_export("shared_spliced.nif")
+        nose.tools.assert_equal(self.geometry_cache.hits, 2)
+        nose.tools.assert_equal(self.read_bytes(n_full), self.read_bytes(n_spliced))
+
+    def test_mesh_change_invalidates_entry(self):
+        b_obj = self.b_create_cube("Cube", (0, 0, 0), bpy.data.materials.new("Material"))
+        self.n_export("mesh_before.nif")
+        b_obj.data.vertices[0].co.x += 0.5
+        b_obj.data.update()
+        self.n_export("mesh_after.nif")
+        nose.tools.assert_equal(self.geometry_cache.hits, 0)
+        nose.tools.assert_equal(self.geometry_cache.misses, 2)
+
+    def test_material_change_invalidates_entry(self):
+        b_mat = bpy.data.materials.new("Material")
+        self.b_create_cube("Cube", (0, 0, 0), b_mat)
+        self.n_export("material_before.nif")
+        b_mat.specular_color = (0.25, 0.5, 0.75)
+        self.n_export("material_after.nif")
+        nose.tools.assert_equal(self.geometry_cache.hits, 0)
+        nose.tools.assert_equal(self.geometry_cache.misses, 2)
@@ -0,0 +1,88 @@
+"""Unit testing header-only Nif reading and cataloguing"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nose
+
+import os
+import shutil
+import tempfile
+
+from io_scene_niftools.file_io.catalogue import NifCatalogue
+from io_scene_niftools.file_io.header import NifHeader
+
+
+class TestNifHeader:
+
+    @classmethod
+    def setup_class(cls):
+        cls.working_dir = os.path.dirname(__file__)
+
+    def test_read_header(self):
+        header = NifHeader.from_file(self.working_dir + os.sep + "readable.nif")
+        nose.tools.assert_equal(header.version, 335544325)
+        nose.tools.assert_equal(header.num_blocks, 3)
+        nose.tools.assert_equal(header.block_type(0), "NiNode")
+        nose.tools.assert_equal(header.block_type_counts()["NiTriShapeData"], 1)
+        nose.tools.assert_false(header.has_offsets)
+
+    @nose.tools.raises(Exception)
+    def test_read_header_unsupported_file(self):
+        NifHeader.from_file(self.working_dir + os.sep + "notnif.txt")
+
+    def test_catalogue(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with NifCatalogue(os.path.join(temp_dir, "catalogue.db")) as catalogue:
+                catalogue.scan(self.working_dir, processes=1)
+                nose.tools.assert_in(self.working_dir + os.sep + "readable.nif",
+                                     catalogue.find(block_type="NiTriShape"))
+                nose.tools.assert_in(self.working_dir + os.sep + "unreadable.nif",
+                                     [path for path, error in catalogue.errors()])
+
+    def test_catalogue_removes_deleted_files(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            scan_dir = os.path.join(temp_dir, "nifs")
+            os.mkdir(scan_dir)
+            file_path = os.path.join(scan_dir, "readable.nif")
+            shutil.copy(self.working_dir + os.sep + "readable.nif", file_path)
+            with NifCatalogue(os.path.join(temp_dir, "catalogue.db")) as catalogue:
+                catalogue.scan(scan_dir, processes=1)
+                nose.tools.assert_equal(catalogue.find(has_skin=False), [file_path])
+                os.remove(file_path)
+                catalogue.scan(scan_dir, processes=1)
+                nose.tools.assert_equal(catalogue.find(), [])
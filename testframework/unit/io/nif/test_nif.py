@@ -41,8 +41,10 @@
 import nose
 
 import os
+from unittest import mock
 
-from io_scene_niftools.io.nif import NifFile
+import nifgen.formats.nif as NifFormat
+from io_scene_niftools.file_io.nif import NifFile
 
 
 class TestNifIO:
@@ -62,3 +64,18 @@ class TestNifIO:
     @nose.tools.raises(Exception)
     def test_load_unsupported_file(self):
         NifFile.load_nif(self.working_dir + os.sep + "notnif.txt")
+
+    def test_load_header_does_not_decode_blocks(self):
+        with mock.patch.object(NifFormat.NifFile, "from_stream", side_effect=AssertionError("blocks decoded")):
+            header = NifFile.load_header(self.working_dir + os.sep + "readable.nif")
+        nose.tools.assert_equal(header.version, 335544325)
+        nose.tools.assert_equal(header.block_type(0), "NiNode")
+
+    def test_decode_nif_from_header(self):
+        header = NifFile.load_header(self.working_dir + os.sep + "readable.nif")
+        data = NifFile.decode_nif(header)
+        nose.tools.assert_equal(data.version, header.version)
+
+    @nose.tools.raises(Exception)
+    def test_load_header_unsupported_file(self):
+        NifFile.load_header(self.working_dir + os.sep + "notnif.txt")
@@ -0,0 +1,111 @@
+"""Tests for the structural validation of NIF data before export."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nose
+
+from io_scene_niftools.file_io.validation import NifValidator
+from io_scene_niftools.utils.logging import NifError
+
+
+class Block:
+    """Stand-in for a nifgen block, with references (children) and links (pointers)."""
+
+    def __init__(self, name, children=(), links=()):
+        self.name = name
+        self.children = list(children)
+        self.num_children = len(self.children)
+        self.links = list(links)
+
+    def get_refs(self):
+        return self.children
+
+    def get_links(self):
+        return self.links
+
+
+class Data:
+
+    def __init__(self, *roots):
+        self.roots = list(roots)
+        self.validated = False
+
+    def validate(self):
+        self.validated = True
+
+
+class TestNifValidator:
+
+    def test_valid_tree(self):
+        n_leaf = Block("leaf")
+        n_root = Block("root", [n_leaf, Block("other", links=[n_leaf])])
+        n_data = Data(n_root)
+        nose.tools.assert_equal(NifValidator(n_data).validate(NifValidator.STRUCTURAL), NifValidator.STRUCTURAL)
+        nose.tools.assert_false(n_data.validated)
+        NifValidator(n_data).validate(NifValidator.FULL)
+        nose.tools.assert_true(n_data.validated)
+
+    def test_dangling_link(self):
+        validator = NifValidator(Data(Block("root", [Block("child", links=[Block("outside")])])))
+        validator.structural_pass()
+        nose.tools.assert_equal(len(validator.problems), 1)
+        nose.tools.assert_in("'outside'", validator.problems[0])
+
+    def test_count_mismatch(self):
+        n_root = Block("root", [Block("child")])
+        n_root.num_children = 2
+        validator = NifValidator(Data(n_root))
+        validator.structural_pass()
+        nose.tools.assert_equal(len(validator.problems), 1)
+        nose.tools.assert_in("num_children = 2", validator.problems[0])
+
+    def test_cycle(self):
+        n_child = Block("child")
+        n_root = Block("root", [n_child])
+        n_child.children.append(n_root)
+        n_child.num_children = 1
+        validator = NifValidator(Data(n_root))
+        validator.structural_pass()
+        nose.tools.assert_equal(len(validator.problems), 1)
+        nose.tools.assert_in("cycle", validator.problems[0])
+
+    @nose.tools.raises(NifError)
+    def test_validate_raises(self):
+        n_root = Block("root")
+        n_root.num_children = 1
+        NifValidator(Data(n_root)).validate()
@@ -0,0 +1,85 @@
+"""Unit testing collision generation from render geometry"""
+
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nose
+
+import numpy as np
+
+from io_scene_niftools.modules.nif_export.collision.havok.generator import CollisionGenerator
+
+
+def l_shape():
+    """Two boxes joined at a corner, as vertices and triangles."""
+    corners = np.array([(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)], dtype=float)
+    faces = np.array([(0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5), (0, 4, 5), (0, 5, 1),
+                      (2, 3, 7), (2, 7, 6), (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3)])
+    vertices = np.vstack((corners * (4, 1, 1), corners * (1, 4, 1)))
+    return vertices, np.vstack((faces, faces + 8))
+
+
+def torus(major_radius=2.0, minor_radius=0.5, rings=32, sides=16):
+    """A torus, as vertices and triangles."""
+    u, v = np.meshgrid(np.linspace(0, 2 * np.pi, rings, endpoint=False),
+                       np.linspace(0, 2 * np.pi, sides, endpoint=False), indexing="ij")
+    vertices = np.stack(((major_radius + minor_radius * np.cos(v)) * np.cos(u),
+                         (major_radius + minor_radius * np.cos(v)) * np.sin(u),
+                         minor_radius * np.sin(v)), axis=-1).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(rings), np.arange(sides), indexing="ij")
+    a = (i * sides + j).ravel()
+    b = (((i + 1) % rings) * sides + j).ravel()
+    c = (((i + 1) % rings) * sides + (j + 1) % sides).ravel()
+    d = (i * sides + (j + 1) % sides).ravel()
+    return vertices, np.vstack((np.column_stack((a, b, c)), np.column_stack((a, c, d))))
+
+
+class TestCollisionGenerator:
+
+    def test_convex_decomposition(self):
+        generator = CollisionGenerator(*l_shape())
+        hulls, error = generator.convex_decomposition(max_parts=4, max_hull_vertices=16, max_error=0.01)
+        nose.tools.assert_true(1 < len(hulls) <= 4)
+        nose.tools.assert_true(error <= 0.01)
+
+    def test_decimated_mesh(self):
+        generator = CollisionGenerator(*torus())
+        vertices, triangles, error = generator.decimated_mesh(max_triangles=300)
+        nose.tools.assert_true(0 < len(triangles) <= 300)
+        nose.tools.assert_true(triangles.max() < len(vertices))
+        nose.tools.assert_true(error < 0.25)
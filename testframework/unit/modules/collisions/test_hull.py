@@ -0,0 +1,85 @@
+"""Unit testing convex hull computation for collision export"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nose
+
+import numpy as np
+
+from io_scene_niftools.modules.nif_export.collision.havok.hull import ConvexHull, shrink_hull
+
+
+class TestConvexHull:
+
+    def test_cube_is_minimal(self):
+        # subdivided cube: interior and face points must not survive
+        grid = np.linspace(-1.0, 1.0, 5)
+        points = np.array([(x, y, z) for x in grid for y in grid for z in grid])
+        hull = ConvexHull(points)
+        nose.tools.assert_equal(len(hull.vertices), 8)
+        nose.tools.assert_equal(len(hull.planes), 6)
+        nose.tools.assert_almost_equal(hull.volume, 8.0)
+        nose.tools.assert_equal(hull.volume_error, 0.0)
+
+    def test_decimation_budget(self):
+        points = np.random.default_rng(0).normal(size=(500, 3))
+        points /= np.linalg.norm(points, axis=1)[:, None]
+        hull = ConvexHull(points, max_vertices=32, max_planes=48)
+        nose.tools.assert_true(len(hull.vertices) <= 32)
+        nose.tools.assert_true(len(hull.planes) <= 48)
+        nose.tools.assert_true(0.0 < hull.volume_error < 0.5)
+        # every vertex lies on or behind every plane
+        dists = hull.vertices @ hull.planes[:, :3].T + hull.planes[:, 3]
+        nose.tools.assert_true(dists.max() < 1e-6)
+
+
+class TestShrinkHull:
+
+    def test_shrink_box(self):
+        grid = np.linspace(-1.0, 1.0, 5)
+        points = np.array([(x, y, z) for x in grid for y in grid for z in grid])
+        shrunk, is_valid = shrink_hull(points, 0.1)
+        nose.tools.assert_true(is_valid)
+        nose.tools.assert_almost_equal(np.abs(shrunk).max(), 0.9, places=5)
+        # interior points stay put
+        interior = np.all(np.abs(points) < 1.0, axis=1)
+        nose.tools.assert_true(np.array_equal(shrunk[interior], points[interior]))
+
+    def test_collapsed_hull(self):
+        points = np.array([(x, y, z) for x in (-2.0, 2.0) for y in (-1.0, 1.0) for z in (-0.5, 0.5)])
+        nose.tools.assert_false(shrink_hull(points, 0.6)[1])
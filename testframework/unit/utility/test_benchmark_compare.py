@@ -0,0 +1,76 @@
+"""Unit tests of the benchmark regression gate."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import nose
+
+from utils.benchmark_compare import check_regressions
+
+
+def results(runs, stage_runs):
+    measurement = {"runs": runs, "stages": {"geometry": {"runs": stage_runs}}}
+    return {"scenarios": {"bstrishape/1000": {"export": measurement, "import": measurement}}}
+
+
+class TestBenchmarkCompare:
+
+    def test_identical_results(self):
+        baseline = results([1.0, 1.1, 0.9], [0.5, 0.5, 0.5])
+        regressions, report = check_regressions(baseline, baseline)
+        nose.tools.assert_equal(regressions, [])
+        nose.tools.assert_in("No regressions in 4 compared stage(s)", report)
+
+    def test_regression(self):
+        baseline = results([1.0, 1.0, 1.0], [0.5, 0.5, 0.5])
+        current = results([1.0, 1.0, 1.0], [0.8, 0.8, 0.8])
+        regressions, report = check_regressions(baseline, current, tolerance=0.1)
+        nose.tools.assert_equal([comparison.name for comparison in regressions],
+                                ["bstrishape/1000 export:geometry", "bstrishape/1000 import:geometry"])
+        nose.tools.assert_in("REGRESSION", report)
+
+    def test_slowdown_within_tolerance(self):
+        baseline = results([1.0, 1.0, 1.0], [0.5, 0.5, 0.5])
+        current = results([1.05, 1.05, 1.05], [0.5, 0.5, 0.5])
+        regressions, _ = check_regressions(baseline, current, tolerance=0.1)
+        nose.tools.assert_equal(regressions, [])
+
+    def test_slowdown_within_noise(self):
+        baseline = results([1.0, 0.5, 1.5, 0.7, 1.3], [0.5, 0.5, 0.5])
+        current = results([1.2, 0.7, 1.7, 0.9, 1.5], [0.5, 0.5, 0.5])
+        regressions, _ = check_regressions(baseline, current, tolerance=0.1, mad_threshold=3.0)
+        nose.tools.assert_equal(regressions, [])
@@ -0,0 +1,112 @@
+"""Tests for the least recently used disk cache."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import io
+import os
+import tempfile
+
+import nose
+
+import nifgen.formats.nif as NifFormat
+
+from io_scene_niftools.utils.cache import DiskCache
+
+
+class TestDiskCache:
+
+    def setup(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskCache("test", self.temp_dir.name)
+
+    def teardown(self):
+        self.temp_dir.cleanup()
+
+    def test_make_key(self):
+        nose.tools.assert_equal(DiskCache.make_key("a", 1, 2.0), DiskCache.make_key("a", 1, 2.0))
+        nose.tools.assert_not_equal(DiskCache.make_key("a", 1), DiskCache.make_key("a", 2))
+        nose.tools.assert_not_equal(DiskCache.make_key("a1"), DiskCache.make_key("a", 1))
+
+    def test_round_trip(self):
+        key = DiskCache.make_key("round trip")
+        nose.tools.assert_is_none(self.cache.get(key))
+        nose.tools.assert_true(self.cache.put(key, {"value": [1, 2, 3]}))
+        nose.tools.assert_equal(self.cache.get(key), {"value": [1, 2, 3]})
+        nose.tools.assert_equal((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_stale_entry(self):
+        key = DiskCache.make_key("stale")
+        os.makedirs(self.cache.directory)
+        with open(self.cache.get_path(key), "wb") as stream:
+            stream.write(b"not a pickle")
+        nose.tools.assert_is_none(self.cache.get(key))
+        nose.tools.assert_false(os.path.exists(self.cache.get_path(key)))
+
+    def test_unpicklable_value(self):
+        key = DiskCache.make_key("unpicklable")
+        nose.tools.assert_false(self.cache.put(key, lambda: None))
+        nose.tools.assert_equal(os.listdir(self.cache.directory), [])
+
+    def test_eviction(self):
+        keys = [DiskCache.make_key(i) for i in range(3)]
+        for age, key in zip((30, 20, 10), keys):
+            self.cache.put(key, bytes(1000))
+            os.utime(self.cache.get_path(key), (0, os.path.getmtime(self.cache.get_path(key)) - age))
+        # reading the oldest entry makes it the most recently used one
+        self.cache.get(keys[0])
+        entry_size = os.path.getsize(self.cache.get_path(keys[0]))
+        self.cache.max_size = 2 * entry_size
+        self.cache.evict()
+        nose.tools.assert_true(os.path.exists(self.cache.get_path(keys[0])))
+        nose.tools.assert_false(os.path.exists(self.cache.get_path(keys[1])))
+        nose.tools.assert_true(os.path.exists(self.cache.get_path(keys[2])))
+
+    def test_nif_round_trip(self):
+        """Parsed NIF data, as stored by the import cache, must survive pickling unchanged."""
+        nif_path = os.path.join(os.path.dirname(__file__), os.pardir, "io", "nif", "readable.nif")
+        with open(nif_path, "rb") as stream:
+            n_data = NifFormat.NifFile.from_stream(stream)
+        key = DiskCache.make_key("nif")
+        nose.tools.assert_true(self.cache.put(key, n_data))
+        n_cached_data = self.cache.get(key)
+
+        nose.tools.assert_equal([type(root) for root in n_cached_data.roots], [type(root) for root in n_data.roots])
+        original, cached = io.BytesIO(), io.BytesIO()
+        n_data.write(original)
+        n_cached_data.write(cached)
+        nose.tools.assert_equal(cached.getvalue(), original.getvalue())
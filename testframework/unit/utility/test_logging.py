@@ -0,0 +1,105 @@
+"""Unit tests of the level gating and deduplication of NifLog, and of the NifError context."""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import logging
+
+import nose
+
+from io_scene_niftools.utils.logging import NifError, NifLog, error_context
+
+
+class Named:
+
+    def __init__(self, name):
+        self.name = name
+
+
+class RecordingOperator:
+
+    def __init__(self):
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((level, message))
+
+
+class TestNifLog:
+
+    def setup(self):
+        self.op = RecordingOperator()
+        NifLog.op = self.op
+        NifLog.level = logging.INFO
+        NifLog.reset()
+
+    def teardown(self):
+        NifLog.level = logging.DEBUG
+        NifLog.reset()
+
+    def test_level_gating(self):
+        def message():
+            raise AssertionError("messages below the log level must not be formatted")
+
+        NifLog.debug(message)
+        NifLog.info(lambda: "lazy message")
+        nose.tools.assert_equal(self.op.reports, [({'INFO'}, "lazy message")])
+
+    def test_repeated_messages(self):
+        for _ in range(3000):
+            NifLog.warn("same warning")
+        nose.tools.assert_equal(self.op.reports, [({'WARNING'}, "same warning")])
+        NifLog.report_summary()
+        nose.tools.assert_equal(self.op.reports[-1], ({'WARNING'}, "same warning (×3000)"))
+
+    def test_report_limit(self):
+        for i in range(NifLog.report_limit + 5):
+            NifLog.warn(f"warning {i}")
+        nose.tools.assert_equal(len(self.op.reports), NifLog.report_limit)
+        NifLog.report_summary()
+        nose.tools.assert_equal(self.op.reports[-1], ({'INFO'}, "5 messages were only logged to the console"))
+
+    def test_error_context(self):
+        try:
+            with error_context(stage="objects"), error_context(block=Named("Root")):
+                with error_context(block=Named("Body")):
+                    raise NifError("Broken block")
+        except NifError as e:
+            nose.tools.assert_equal(str(e), "Broken block")
+            nose.tools.assert_equal(e.filename, __file__)
+            nose.tools.assert_equal(self.op.reports[-1],
+                                    ({'ERROR'}, "While processing stage objects, block Named 'Root' > Named 'Body'"))
@@ -0,0 +1,187 @@
+"""Performance regression gate, comparing benchmark results against a stored baseline.
+
+Usage::
+
+    python -m utils.benchmark_compare [baseline.json] [current.json] [--tolerance 0.1] [--mad-threshold 3.0]
+
+Exits with status 1 and lists the regressions when any export or import stage of any scenario got slower than the
+baseline by more than the tolerance, and by more than the measurement noise.
+"""
+
+# ***** BEGIN LICENSE BLOCK *****
+#
+# Copyright © 2025 NIF File Format Library and Tools contributors.
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions
+# are met:
+#
+#    * Redistributions of source code must retain the above copyright
+#      notice, this list of conditions and the following disclaimer.
+#
+#    * Redistributions in binary form must reproduce the above
+#      copyright notice, this list of conditions and the following
+#      disclaimer in the documentation and/or other materials provided
+#      with the distribution.
+#
+#    * Neither the name of the NIF File Format Library and Tools
+#      project nor the names of its contributors may be used to endorse
+#      or promote products derived from this software without specific
+#      prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+#
+# ***** END LICENSE BLOCK *****
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+
+BENCHMARK_RESULTS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "benchmark", "results")
+
+DEFAULT_TOLERANCE = 0.1
+"""Relative slowdown of a median that is accepted without failing."""
+
+DEFAULT_MAD_THRESHOLD = 3.0
+"""Number of (normal scaled) median absolute deviations a slowdown must exceed to not count as noise."""
+
+DEFAULT_MIN_SECONDS = 0.001
+"""Stages faster than this in both result sets are too short to be timed reliably and are not gated."""
+
+MAD_TO_SIGMA = 1.4826
+"""Scales the median absolute deviation to the standard deviation of normally distributed timings."""
+
+PHASES = ("export", "import")
+
+
+def load_results(file_path):
+    with open(file_path) as stream:
+        return json.load(stream)
+
+
+def median_absolute_deviation(runs):
+    median = statistics.median(runs)
+    return statistics.median(abs(run - median) for run in runs)
+
+
+class Comparison:
+    """Comparison of the timings of one stage of one scenario between baseline and current results."""
+
+    def __init__(self, scenario, phase, stage, baseline_runs, current_runs):
+        self.scenario = scenario
+        self.phase = phase
+        self.stage = stage
+        self.baseline = statistics.median(baseline_runs)
+        self.current = statistics.median(current_runs)
+        # noise of the difference of both medians, from the spread of both sets of runs
+        self.noise = MAD_TO_SIGMA * math.hypot(median_absolute_deviation(baseline_runs),
+                                               median_absolute_deviation(current_runs))
+
+    @property
+    def name(self):
+        return f"{self.scenario} {self.phase}:{self.stage}"
+
+    @property
+    def ratio(self):
+        if self.baseline > 0.0:
+            return self.current / self.baseline
+        return math.inf if self.current > 0.0 else 1.0
+
+    def is_regression(self, tolerance, mad_threshold, min_seconds):
+        if max(self.baseline, self.current) < min_seconds:
+            return False
+        slowdown = self.current - self.baseline
+        return self.ratio > 1.0 + tolerance and slowdown > mad_threshold * self.noise
+
+    def __str__(self):
+        return (f"{self.name:<48} {self.baseline * 1000:>11.2f}ms {self.current * 1000:>11.2f}ms "
+                f"{self.ratio:>7.2f}x {self.noise * 1000:>9.2f}ms")
+
+
+def get_runs(measurement):
+    """Yield the stage names and their runs of one export or import measurement, the total time as 'total'."""
+    yield "total", measurement["runs"]
+    for stage, timing in sorted(measurement.get("stages", {}).items()):
+        yield stage, timing["runs"]
+
+
+def compare_results(baseline, current):
+    """
+    Compare all stages of all scenarios present in both result sets.
+    Return the comparisons, and the names of the scenarios only found in one of them.
+    """
+    comparisons = []
+    baseline_scenarios = baseline.get("scenarios", {})
+    current_scenarios = current.get("scenarios", {})
+    for scenario in sorted(set(baseline_scenarios) & set(current_scenarios)):
+        for phase in PHASES:
+            baseline_stages = dict(get_runs(baseline_scenarios[scenario][phase]))
+            for stage, current_runs in get_runs(current_scenarios[scenario][phase]):
+                if baseline_stages.get(stage) and current_runs:
+                    comparisons.append(Comparison(scenario, phase, stage, baseline_stages[stage], current_runs))
+    unmatched = sorted(set(baseline_scenarios) ^ set(current_scenarios))
+    return comparisons, unmatched
+
+
+def format_report(comparisons, regressions, unmatched, tolerance, mad_threshold):
+    header = f"{'stage':<48} {'baseline':>13} {'current':>13} {'ratio':>8} {'noise':>11}"
+    lines = [header, "-" * len(header)]
+    for comparison in comparisons:
+        marker = "  << REGRESSION" if comparison in regressions else ""
+        lines.append(f"{comparison}{marker}")
+    for scenario in unmatched:
+        lines.append(f"{scenario:<48} only present in one of the result sets, not compared")
+    lines.append("")
+    if regressions:
+        lines.append(f"{len(regressions)} stage(s) regressed by more than {tolerance:.0%} "
+                     f"and {mad_threshold:g} times the noise:")
+        lines.extend(f"  {comparison.name}: {comparison.ratio:.2f}x" for comparison in regressions)
+    else:
+        lines.append(f"No regressions in {len(comparisons)} compared stage(s).")
+    return "\n".join(lines)
+
+
+def check_regressions(baseline, current, tolerance=DEFAULT_TOLERANCE, mad_threshold=DEFAULT_MAD_THRESHOLD,
+                      min_seconds=DEFAULT_MIN_SECONDS):
+    """Compare the result sets and return the regressed comparisons and a readable report."""
+    comparisons, unmatched = compare_results(baseline, current)
+    regressions = [comparison for comparison in comparisons
+                   if comparison.is_regression(tolerance, mad_threshold, min_seconds)]
+    return regressions, format_report(comparisons, regressions, unmatched, tolerance, mad_threshold)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fail when benchmark results regressed against a baseline.")
+    parser.add_argument("baseline", nargs="?", default=os.path.join(BENCHMARK_RESULTS, "baseline.json"))
+    parser.add_argument("current", nargs="?", default=os.path.join(BENCHMARK_RESULTS, "current.json"))
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="accepted relative slowdown of a stage (default: %(default)s)")
+    parser.add_argument("--mad-threshold", type=float, default=DEFAULT_MAD_THRESHOLD,
+                        help="slowdown must exceed this many scaled MADs of noise (default: %(default)s)")
+    parser.add_argument("--min-seconds", type=float, default=DEFAULT_MIN_SECONDS,
+                        help="stages faster than this are not gated (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    regressions, report = check_regressions(load_results(args.baseline), load_results(args.current),
+                                            args.tolerance, args.mad_threshold, args.min_seconds)
+    print(report)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())